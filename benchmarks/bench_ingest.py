@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+Feed ingest benchmark for RSS Terminal.
+Starts the synthetic feed server (benchmarks/feed_server.py) on a free port,
+points a throwaway config at it and drives FeedManager.fetch_all_feeds
+headlessly. Reports cycle latency percentiles, articles per second, peak
+RSS and the per-stage timings of each cycle, and appends the results with
+the current commit to a history file so runs can be compared across commits.
+
+Usage: python benchmarks/bench_ingest.py [--feeds N] [--entries N] [--entry-bytes N] [--latency MS]
+                                         [--error-rate P] [--cycles N] [--workers N] [--history FILE]
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.feed_server import start_in_background
+from rss_terminal.config import ConfigManager
+from rss_terminal.feed_manager import CYCLE_STAGES, FeedManager
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_HISTORY = os.path.join(REPO_ROOT, "benchmarks", "results", "ingest_history.jsonl")
+
+# Every synthetic feed shares one host, so the per-host limits are lifted to the pool size
+CONFIG_TEMPLATE = """[Settings]
+show_intro = false
+
+[Fetch]
+workers = {workers}
+max_per_host = {workers}
+host_rate = 0
+failure_threshold = 1000
+
+[Feeds]
+{feeds}
+"""
+
+def make_config(workdir, base_url, feeds, workers):
+    """Create a ConfigManager whose feeds all point at the synthetic server"""
+    feed_lines = "\n".join(f"SYN{i} = {base_url}/feed/{i}" for i in range(feeds))
+    config_file = os.path.join(workdir, "rss_config.ini")
+    with open(config_file, "w") as f:
+        f.write(CONFIG_TEMPLATE.format(workers=workers, feeds=feed_lines))
+    return ConfigManager(config_file, os.path.join(workdir, "last_seen.json"))
+
+def peak_rss_mb():
+    """Peak resident set size of this process in MiB, or None where unavailable"""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+def percentile(values, fraction):
+    """Nearest-rank percentile of a list of numbers"""
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, max(0, round(fraction * len(ordered)) - 1))]
+
+def git_commit():
+    """Short hash of HEAD, marked dirty when the tree has local changes"""
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=REPO_ROOT,
+                                capture_output=True, text=True, check=True).stdout.strip()
+        dirty = subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"], cwd=REPO_ROOT,
+                               capture_output=True, text=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+    return commit + ("-dirty" if dirty else "")
+
+def run_cycles(manager, cycles):
+    """Run fetch cycles and return (cycle seconds, per-cycle stage timings, per-cycle counts)"""
+    latencies = []
+    stages = []
+    counts = []
+    for _ in range(cycles):
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):  # Silence the fetch cycle's debug output
+            manager.fetch_all_feeds()
+        latencies.append(time.perf_counter() - start)
+        stages.append(dict(manager.stage_timings))
+        counts.append(dict(manager.cycle_counts))
+    return latencies, stages, counts
+
+def load_previous(history, settings):
+    """Most recent history entry run with the same settings, or None"""
+    if not os.path.exists(history):
+        return None
+    previous = None
+    with open(history, "r") as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                entry = json.loads(line)
+                if entry.get('settings') == settings:
+                    previous = entry
+    return previous
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark feed ingest against a synthetic feed server")
+    parser.add_argument("--feeds", type=int, default=100, help="number of synthetic feeds")
+    parser.add_argument("--entries", type=int, default=20, help="entries per feed")
+    parser.add_argument("--entry-bytes", type=int, default=400, help="approximate summary size per entry")
+    parser.add_argument("--latency", type=float, default=20, help="server latency in milliseconds")
+    parser.add_argument("--jitter", type=float, default=10, help="random +/- latency in milliseconds")
+    parser.add_argument("--error-rate", type=float, default=0.02, help="fraction of requests answered with 500")
+    parser.add_argument("--atom-ratio", type=float, default=0.2, help="fraction of feeds served as Atom")
+    parser.add_argument("--cycles", type=int, default=10, help="fetch cycles to time")
+    parser.add_argument("--workers", type=int, default=8, help="fetch worker threads")
+    parser.add_argument("--history", default=DEFAULT_HISTORY, help="JSON-lines file the results are appended to")
+    parser.add_argument("--no-history", action="store_true", help="do not record this run")
+    args = parser.parse_args()
+    
+    settings = {'feeds': args.feeds, 'entries': args.entries, 'entry_bytes': args.entry_bytes,
+                'latency': args.latency, 'jitter': args.jitter, 'error_rate': args.error_rate,
+                'atom_ratio': args.atom_ratio, 'cycles': args.cycles, 'workers': args.workers}
+    
+    server, base_url = start_in_background(entries=args.entries, entry_bytes=args.entry_bytes,
+                                           latency=args.latency / 1000, jitter=args.jitter / 1000,
+                                           error_rate=args.error_rate, atom_ratio=args.atom_ratio)
+    with tempfile.TemporaryDirectory() as workdir:
+        with contextlib.redirect_stdout(io.StringIO()):
+            config = make_config(workdir, base_url, args.feeds, args.workers)
+            manager = FeedManager(config)
+        try:
+            latencies, stages, counts = run_cycles(manager, args.cycles)
+        finally:
+            manager.stop_fetching()
+            server.shutdown()
+    
+    # Articles per second counts every entry processed, not only new ones, so cycles stay comparable
+    entries = sum(count['entries'] for count in counts)
+    results = {
+        'p50_ms': percentile(latencies, 0.5) * 1000,
+        'p90_ms': percentile(latencies, 0.9) * 1000,
+        'p99_ms': percentile(latencies, 0.99) * 1000,
+        'max_ms': max(latencies) * 1000,
+        'articles_per_s': entries / sum(latencies),
+        'new_articles': sum(count['new_articles'] for count in counts),
+        'peak_rss_mb': peak_rss_mb(),
+        'stages_ms': {stage: statistics.mean(timing[stage] for timing in stages) * 1000 for stage in CYCLE_STAGES},
+    }
+    
+    print(f"{args.feeds} feeds x {args.entries} entries, {args.cycles} cycles, {args.workers} workers")
+    print(f"cycle        p50 {results['p50_ms']:8.1f} ms | p90 {results['p90_ms']:8.1f} ms | "
+          f"p99 {results['p99_ms']:8.1f} ms | max {results['max_ms']:8.1f} ms")
+    print(f"throughput   {results['articles_per_s']:8.0f} articles/s | {results['new_articles']} new articles")
+    if results['peak_rss_mb'] is not None:
+        print(f"peak RSS     {results['peak_rss_mb']:8.1f} MiB")
+    # download and parse are summed over the worker threads, so they can exceed the cycle total
+    print("stages (mean per cycle): " + " | ".join(f"{stage} {ms:.1f} ms" for stage, ms in results['stages_ms'].items()))
+    
+    previous = load_previous(args.history, settings)
+    if previous:
+        change = (results['p50_ms'] - previous['results']['p50_ms']) / previous['results']['p50_ms'] * 100
+        print(f"vs {previous['commit']}: p50 {previous['results']['p50_ms']:.1f} ms -> "
+              f"{results['p50_ms']:.1f} ms ({change:+.1f}%)")
+    
+    if not args.no_history:
+        os.makedirs(os.path.dirname(os.path.abspath(args.history)), exist_ok=True)
+        entry = {'time': time.strftime('%Y-%m-%dT%H:%M:%S'), 'commit': git_commit(),
+                 'settings': settings, 'results': results}
+        with open(args.history, "a") as f:
+            f.write(json.dumps(entry) + "\n")
+
+if __name__ == "__main__":
+    main()
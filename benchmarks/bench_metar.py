@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+METAR decoder benchmark for RSS Terminal.
+Decodes a corpus of raw METARs and reports throughput and how many body
+tokens the decoder did not recognise. Pass an archive with one report per
+line (e.g. saved from the aviationweather.gov raw endpoint) via --file;
+otherwise a synthetic corpus is generated from sample reports.
+
+Usage: python benchmarks/bench_metar.py [--file FILE] [--count N] [--runs N]
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from rss_terminal.metar import decode_metar
+
+SAMPLES = [
+    "KTUS 190453Z 12006KT 10SM FEW200 23/M03 A3004 RMK AO2 SLP150 T02331028",
+    "METAR KJFK 191851Z 31015G25KT 280V340 1 1/2SM R04R/2400FT -SHRA BR BKN008 OVC015CB 12/11 A2990 RMK AO2",
+    "SPECI EGLL 191850Z AUTO VRB03KT 9999 NSC M02/M05 Q1021",
+    "LFPG 191900Z 24010KT CAVOK 15/08 Q1015 NOSIG",
+    "KDEN 191853Z 00000KT M1/4SM +TSRAGR FG VV002 M01/M01 A3010 RMK AO2 TSB45",
+    "KORD 191851Z 27012KT 3SM -SN BR SCT015 OVC030 M04/M06 A2998 RMK AO2",
+    "KPHX 191851Z 09005KT 10SM HZ SKC 35/02 A2985",
+    "KSEA 191853Z 18008KT 6SM -RA BKN012 OVC025 10/08 A3002 RMK AO2 P0002",
+    "RJTT 191900Z 34012KT 9999 FEW030 SCT100 18/09 Q1018 NOSIG",
+    "KMIA 191853Z 11015G22KT 10SM VCSH FEW025 SCT045 BKN250 29/23 A3001",
+]
+
+def synthetic_corpus(count, rng):
+    """Generate reports by varying time, wind and temperature of the samples"""
+    corpus = []
+    for _ in range(count):
+        tokens = rng.choice(SAMPLES).split()
+        offset = 1 if tokens[0] in ("METAR", "SPECI") else 0
+        tokens[offset + 1] = f"{rng.randint(1, 28):02d}{rng.randint(0, 23):02d}{rng.choice(('51', '53', '00'))}Z"
+        corpus.append(" ".join(tokens))
+    return corpus
+
+def load_corpus(path):
+    """Read one raw report per line"""
+    with open(path, "r") as f:
+        return [line.strip() for line in f if line.strip()]
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the METAR decoder")
+    parser.add_argument("--file", help="archived raw METARs, one per line")
+    parser.add_argument("--count", type=int, default=5000, help="synthetic reports when no file is given")
+    parser.add_argument("--runs", type=int, default=5, help="passes over the corpus")
+    args = parser.parse_args()
+    
+    corpus = load_corpus(args.file) if args.file else synthetic_corpus(args.count, random.Random(0))
+    
+    timings = []
+    for _ in range(args.runs):
+        start = time.perf_counter()
+        reports = [decode_metar(raw) for raw in corpus]
+        timings.append(time.perf_counter() - start)
+    
+    decoded = [report for report in reports if report]
+    unparsed = sum(len(report['unparsed']) for report in decoded)
+    tokens = sum(len(report['raw'].split(" RMK ")[0].split()) for report in decoded)
+    
+    median = statistics.median(timings)
+    print(f"{len(corpus)} reports | median {median * 1000:8.1f} ms | "
+          f"{median / len(corpus) * 1e6:6.1f} us/report | {len(corpus) / median:10,.0f} reports/s")
+    print(f"decoded {len(decoded)}/{len(corpus)} | with temperature "
+          f"{sum(report['temperature'] is not None for report in decoded)} | "
+          f"unparsed tokens {unparsed}/{tokens} ({unparsed / max(tokens, 1):.1%})")
+
+if __name__ == "__main__":
+    main()
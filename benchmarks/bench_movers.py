@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Top movers benchmark for RSS Terminal.
+Times writing a full quote refresh into MoversTable and ranking gainers,
+losers and unusual moves for a large synthetic watchlist.
+
+Usage: python benchmarks/bench_movers.py [--symbols N] [--runs N]
+"""
+import argparse
+import os
+import statistics
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from rss_terminal.movers import MoversTable
+from timing import report, time_call
+
+# Target from the movers panel: ranking 1000 symbols must fit well inside a frame
+RANK_BUDGET_MS = 1.0
+
+def make_quotes(symbols, rng):
+    """Build a synthetic quote refresh shaped like StockManager.stocks"""
+    prices = rng.uniform(5, 500, len(symbols))
+    pct_changes = rng.normal(0, 1.5, len(symbols))
+    return {
+        symbol: {'current_price': float(price), 'percent_change': float(pct)}
+        for symbol, price, pct in zip(symbols, prices, pct_changes)
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the top movers ranking")
+    parser.add_argument("--symbols", type=int, default=1000, help="watchlist size")
+    parser.add_argument("--runs", type=int, default=200, help="timed repetitions")
+    args = parser.parse_args()
+    
+    rng = np.random.default_rng(0)
+    symbols = [f"SYM{i:04d}" for i in range(args.symbols)]
+    refreshes = [make_quotes(symbols, rng) for _ in range(8)]
+    
+    table = MoversTable()
+    table.update(refreshes[0])
+    
+    update_timings = []
+    for i in range(args.runs):
+        quotes = refreshes[i % len(refreshes)]
+        update_timings.extend(time_call(lambda: table.update(quotes), 1))
+    rank_timings = time_call(table.rank, args.runs)
+    
+    print(f"{args.symbols} symbols")
+    report("update", update_timings)
+    report("rank", rank_timings)
+    
+    median = statistics.median(rank_timings)
+    if median > RANK_BUDGET_MS:
+        print(f"WARNING: rank median {median:.3f} ms exceeds the {RANK_BUDGET_MS:.1f} ms budget")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Article list render benchmark for RSS Terminal.
+Builds the rows for a synthetic article snapshot with the Tk-free view
+model, so it runs without a display: a full rebuild of every row, a
+viewport's worth of rows after scrolling, and a refit after each resize.
+
+Usage: python benchmarks/bench_render.py [--articles N] [--width PX] [--rows N] [--runs N]
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from rss_terminal.view_model import create_headless_view, row_segments
+from timing import report, time_call
+
+# Frame budget at 60 Hz; a viewport refresh should take a small part of it
+FRAME_BUDGET_MS = 16.7
+
+WORDS = ("Markets rally as earnings beat guidance while rates hold steady and "
+         "chip supply tightens ahead of merger talks in 東京 and Zürich").split()
+
+def make_articles(count, rng):
+    """Build a synthetic snapshot shaped like FeedManager's filtered articles"""
+    sources = ["BBC", "NYT", "WSJ", "FT", "REUTERS", "AP", "CNBC", "HN"]
+    return tuple({
+        'title': " ".join(rng.choice(WORDS) for _ in range(rng.randint(6, 24))),
+        'source': rng.choice(sources),
+        'pub_date_str': f"{rng.randint(0, 23):02d}:{rng.randint(0, 59):02d}",
+        'is_new': rng.random() < 0.05,
+    } for _ in range(count))
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark article row rendering without Tk")
+    parser.add_argument("--articles", type=int, default=1000, help="articles in the snapshot")
+    parser.add_argument("--width", type=int, default=1000, help="viewport width in pixels")
+    parser.add_argument("--rows", type=int, default=45, help="viewport height in rows")
+    parser.add_argument("--runs", type=int, default=50, help="timed repetitions")
+    args = parser.parse_args()
+    
+    rng = random.Random(0)
+    articles = make_articles(args.articles, rng)
+    view = create_headless_view(args.width, args.rows)
+    
+    def rebuild():
+        for row in view.rows(articles):
+            row_segments(row)
+    
+    tops = [rng.randrange(max(1, args.articles - args.rows)) for _ in range(args.runs)]
+    def scroll():
+        view.visible_rows(articles, tops.pop())
+    
+    # Alternate between two widths so every refit misses the layout's fit cache
+    widths = [args.width, args.width - 77]
+    def resize():
+        widths.reverse()
+        view.resize(widths[0])
+        view.visible_rows(articles, 0)
+    
+    print(f"{args.articles} articles, {args.width}px x {args.rows} rows")
+    report("rebuild", time_call(rebuild, args.runs))
+    scroll_timings = time_call(scroll, args.runs)
+    report("scroll", scroll_timings)
+    resize_timings = time_call(resize, args.runs)
+    report("resize", resize_timings)
+    
+    median = statistics.median(resize_timings)
+    if median > FRAME_BUDGET_MS / 4:
+        print(f"WARNING: resize median {median:.3f} ms exceeds a quarter of the {FRAME_BUDGET_MS} ms frame budget")
+
+if __name__ == "__main__":
+    main()
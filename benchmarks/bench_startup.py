@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Startup benchmark for RSS Terminal.
+Measures how long `import rss_terminal.app` takes in a fresh interpreter,
+which heavy modules it drags in, and (when a display is available) the
+time from creating the app to its first painted frame.
+
+Usage: python benchmarks/bench_startup.py [--runs N]
+"""
+import argparse
+import os
+import subprocess
+import sys
+
+from timing import report
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Modules that should only be imported on first use
+LAZY_MODULES = ["yfinance", "pandas", "numpy", "html2text", "dateutil"]
+
+IMPORT_SCRIPT = """
+import sys, time
+start = time.perf_counter()
+import rss_terminal.app
+elapsed = time.perf_counter() - start
+loaded = [m for m in {lazy!r} if m in sys.modules]
+print(elapsed, ",".join(loaded))
+"""
+
+FIRST_PAINT_SCRIPT = """
+import os, sys, time, tempfile
+start = time.perf_counter()
+import tkinter as tk
+from rss_terminal.app import RSSTerminalApp
+os.chdir(tempfile.mkdtemp())  # Use a throwaway default config
+root = tk.Tk()
+app = RSSTerminalApp(root)
+root.update()  # Process the first paint
+print(time.perf_counter() - start)
+app.on_closing()
+"""
+
+def run_script(script):
+    """Run a snippet in a fresh interpreter and return its stdout"""
+    python_path = os.pathsep.join(filter(None, [REPO_ROOT, os.environ.get("PYTHONPATH")]))
+    result = subprocess.run([sys.executable, "-c", script], cwd=REPO_ROOT,
+                            capture_output=True, text=True, env=dict(os.environ, PYTHONPATH=python_path))
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1] if result.stderr else "failed")
+    return result.stdout.strip()
+
+def bench_import(runs):
+    """Time importing the app module in fresh interpreters"""
+    timings = []
+    loaded = set()
+    for _ in range(runs):
+        elapsed, _, modules = run_script(IMPORT_SCRIPT.format(lazy=LAZY_MODULES)).partition(" ")
+        timings.append(float(elapsed) * 1000)
+        loaded.update(m for m in modules.split(",") if m)
+    return timings, sorted(loaded)
+
+def bench_first_paint(runs):
+    """Time app construction up to the first painted frame, in ms"""
+    return [float(run_script(FIRST_PAINT_SCRIPT).splitlines()[-1]) * 1000 for _ in range(runs)]
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark RSS Terminal startup")
+    parser.add_argument("--runs", type=int, default=5, help="number of fresh interpreters per measurement")
+    args = parser.parse_args()
+    
+    timings, loaded = bench_import(args.runs)
+    report("import", timings)
+    if loaded:
+        print(f"WARNING: eagerly imported: {', '.join(loaded)}")
+    
+    if sys.platform != "darwin" and sys.platform != "win32" and not os.environ.get("DISPLAY"):
+        print("first-paint  skipped (no display available)")
+        return
+    
+    try:
+        report("first-paint", bench_first_paint(args.runs))
+    except RuntimeError as e:
+        print(f"first-paint  failed: {e}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Stock pipeline benchmark for RSS Terminal.
+Replays a synthetic quote recording through StockManager with the replay
+provider (no network access) and measures update throughput and, when a
+display is available, the cost of refreshing the UI ticker bar.
+
+Usage: python benchmarks/bench_stocks.py [--symbols N] [--steps N]
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from rss_terminal.config import ConfigManager
+from rss_terminal.stock_manager import StockManager
+from timing import report
+
+CONFIG_TEMPLATE = """[Settings]
+show_intro = false
+
+[Stock]
+symbols = {symbols}
+provider = replay
+replay_file = {replay_file}
+replay_speed = 0
+"""
+
+def make_recording(path, symbols, steps, rng):
+    """Write a random-walk recording with one tick per symbol per step"""
+    prices = rng.uniform(5, 500, len(symbols))
+    previous_close = prices.copy()
+    with open(path, "w") as f:
+        for step in range(steps):
+            prices *= 1 + rng.normal(0, 0.002, len(symbols))
+            for symbol, price, close in zip(symbols, prices, previous_close):
+                f.write(json.dumps({"time": 1_760_000_000 + step * 60, "symbol": symbol,
+                                    "price": round(float(price), 4), "previous_close": round(float(close), 4),
+                                    "volume": step * 100}) + "\n")
+
+def make_config(workdir, symbols, steps, rng):
+    """Create a ConfigManager that replays a fresh recording"""
+    replay_file = os.path.join(workdir, "quotes_replay.jsonl")
+    make_recording(replay_file, symbols, steps, rng)
+
+    config_file = os.path.join(workdir, "rss_config.ini")
+    with open(config_file, "w") as f:
+        f.write(CONFIG_TEMPLATE.format(symbols=",".join(symbols), replay_file=replay_file))
+    return ConfigManager(config_file, os.path.join(workdir, "last_seen.json"))
+
+def replay_steps(config, steps):
+    """Run one fetch per recorded step and return (timings in ms, quote snapshots)"""
+    manager = StockManager(config)
+    timings = []
+    snapshots = []
+
+    # fetch_stock_data logs every symbol; keep that out of the report
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(steps):
+            start = time.perf_counter()
+            manager.fetch_stock_data()
+            timings.append((time.perf_counter() - start) * 1000)
+            snapshots.append(manager.stocks)
+
+    manager.stop_fetching()
+    return timings, snapshots
+
+def bench_ticker(config, snapshots):
+    """Time TerminalUI.handle_stock_update including the resulting layout pass, in ms"""
+    import tkinter as tk
+    from rss_terminal.feed_manager import FeedManager
+    from rss_terminal.ui import TerminalUI
+
+    root = tk.Tk()
+    ui = TerminalUI(root, config, FeedManager(config))
+    root.update()
+
+    timings = []
+    for stocks in snapshots:
+        start = time.perf_counter()
+        ui.handle_stock_update(stocks)
+        root.update_idletasks()
+        timings.append((time.perf_counter() - start) * 1000)
+
+    root.destroy()
+    return timings
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the stock pipeline offline")
+    parser.add_argument("--symbols", type=int, default=2000, help="watchlist size")
+    parser.add_argument("--steps", type=int, default=20, help="recorded quote updates per symbol")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    symbols = [f"S{i:05d}" for i in range(args.symbols)]
+
+    with tempfile.TemporaryDirectory() as workdir:
+        config = make_config(workdir, symbols, args.steps, rng)
+        timings, snapshots = replay_steps(config, args.steps)
+
+        print(f"{args.symbols} symbols, {args.steps} steps")
+        report("update", timings, args.symbols, "quotes")
+
+        if sys.platform != "darwin" and sys.platform != "win32" and not os.environ.get("DISPLAY"):
+            print("ticker       skipped (no display available)")
+            return
+        report("ticker", bench_ticker(config, snapshots), args.symbols, "quotes")
+
+if __name__ == "__main__":
+    main()
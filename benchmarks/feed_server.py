@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Local synthetic feed server for RSS Terminal benchmarks.
+Serves deterministic RSS 2.0 and Atom feeds at /feed/<n> with a configurable
+number and size of entries, response latency and error rate. Each request
+to a feed publishes a few new entries on top, so repeated fetch cycles have
+fresh articles to deduplicate and merge. Point feeds at it by hand with:
+
+    [Feeds]
+    SYN0 = http://127.0.0.1:8766/feed/0
+
+Usage: python benchmarks/feed_server.py [--entries N] [--entry-bytes N] [--latency MS]
+                                        [--jitter MS] [--error-rate P] [--atom-ratio P] [--port N]
+"""
+import argparse
+import random
+import threading
+import time
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from xml.sax.saxutils import escape
+
+WORDS = ("market rally earnings guidance rates inflation chip supply merger outlook "
+         "record shares bond yields oil demand forecast tariff growth labor retail").split()
+
+def entry_text(rng, size):
+    """Pseudo-random words filling about size characters"""
+    words = []
+    length = 0
+    while length < size:
+        word = rng.choice(WORDS)
+        words.append(word)
+        length += len(word) + 1
+    return " ".join(words)
+
+def render_feed(feed_id, generation, entries, entry_bytes, atom, now):
+    """Feed XML with the newest `entries` items; item ids advance with the generation"""
+    items = []
+    for i in range(entries):
+        number = generation + entries - i  # Newest first
+        rng = random.Random(feed_id * 1_000_003 + number)
+        title = f"Feed {feed_id} story {number}: {entry_text(rng, 40)}"
+        summary = entry_text(rng, entry_bytes)
+        published = now - i * 300  # Five minutes apart, inside the app's two-day window
+        link = f"http://example.invalid/{feed_id}/{number}"
+        guid = f"feed-{feed_id}-{number}"
+        if atom:
+            items.append(f"<entry><title>{escape(title)}</title><link href=\"{link}\"/><id>{guid}</id>"
+                         f"<updated>{time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime(published))}</updated>"
+                         f"<summary>{escape(summary)}</summary></entry>")
+        else:
+            items.append(f"<item><title>{escape(title)}</title><link>{link}</link><guid>{guid}</guid>"
+                         f"<pubDate>{formatdate(published, usegmt=True)}</pubDate>"
+                         f"<description>{escape(summary)}</description></item>")
+    
+    if atom:
+        return ("<?xml version=\"1.0\" encoding=\"utf-8\"?><feed xmlns=\"http://www.w3.org/2005/Atom\">"
+                f"<title>Synthetic feed {feed_id}</title><id>urn:feed:{feed_id}</id>{''.join(items)}</feed>")
+    return ("<?xml version=\"1.0\" encoding=\"utf-8\"?><rss version=\"2.0\"><channel>"
+            f"<title>Synthetic feed {feed_id}</title><link>http://example.invalid/{feed_id}</link>"
+            f"{''.join(items)}</channel></rss>")
+
+class FeedHandler(BaseHTTPRequestHandler):
+    """Serves /feed/<n>, with latency and errors drawn from the server settings"""
+    
+    protocol_version = "HTTP/1.1"
+    
+    def do_GET(self):
+        server = self.server
+        parts = self.path.strip("/").split("/")
+        if len(parts) != 2 or parts[0] != "feed" or not parts[1].isdigit():
+            self.send_error(404)
+            return
+        feed_id = int(parts[1])
+        
+        with server.lock:
+            server.requests += 1
+            generation = server.generations.get(feed_id, 0)
+            server.generations[feed_id] = generation + server.new_per_request
+            fail = server.rng.random() < server.error_rate
+            delay = max(0.0, server.latency + server.rng.uniform(-server.jitter, server.jitter))
+        
+        time.sleep(delay)
+        if fail:
+            # 500 rather than 503: every feed shares this host, and a 503 would defer all of them
+            self.send_error(500)
+            return
+        
+        atom = (feed_id * 7919 % 100) < server.atom_ratio * 100
+        body = render_feed(feed_id, generation, server.entries, server.entry_bytes, atom, time.time()).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/atom+xml" if atom else "application/rss+xml")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def log_message(self, format, *args):
+        pass  # Benchmarks would otherwise drown in request logs
+
+def make_server(port=0, entries=20, entry_bytes=400, latency=0.0, jitter=0.0, error_rate=0.0,
+                atom_ratio=0.2, new_per_request=2, seed=0):
+    """Create the server (port 0 picks a free port); latency and jitter are in seconds"""
+    server = ThreadingHTTPServer(("127.0.0.1", port), FeedHandler)
+    server.daemon_threads = True
+    server.entries = entries
+    server.entry_bytes = entry_bytes
+    server.latency = latency
+    server.jitter = jitter
+    server.error_rate = error_rate
+    server.atom_ratio = atom_ratio
+    server.new_per_request = new_per_request
+    server.rng = random.Random(seed)
+    server.lock = threading.Lock()
+    server.generations = {}
+    server.requests = 0
+    return server
+
+def start_in_background(**settings):
+    """Start a server on a free port in a daemon thread; returns (server, base URL)"""
+    server = make_server(**settings)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve synthetic RSS/Atom feeds")
+    parser.add_argument("--port", type=int, default=8766)
+    parser.add_argument("--entries", type=int, default=20, help="entries per feed")
+    parser.add_argument("--entry-bytes", type=int, default=400, help="approximate summary size per entry")
+    parser.add_argument("--latency", type=float, default=0, help="response latency in milliseconds")
+    parser.add_argument("--jitter", type=float, default=0, help="random +/- latency in milliseconds")
+    parser.add_argument("--error-rate", type=float, default=0, help="fraction of requests answered with 500")
+    parser.add_argument("--atom-ratio", type=float, default=0.2, help="fraction of feeds served as Atom")
+    parser.add_argument("--new-per-request", type=int, default=2, help="new entries published per request")
+    args = parser.parse_args()
+    
+    server = make_server(args.port, args.entries, args.entry_bytes, args.latency / 1000, args.jitter / 1000,
+                         args.error_rate, args.atom_ratio, args.new_per_request)
+    print(f"Serving synthetic feeds on http://127.0.0.1:{args.port}/feed/<n> (Ctrl+C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == "__main__":
+    main()
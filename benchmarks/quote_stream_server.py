@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for a push quote stream.
+Serves ticks to each client as newline-delimited JSON (or Server-Sent Events
+with --sse) over a long-lived HTTP response, either replaying a recorded
+file in the replay provider's format or generating random-walk ticks.
+Point the app at it with:
+
+    [Stock]
+    stream_url = http://127.0.0.1:8765/quotes
+
+Usage: python benchmarks/quote_stream_server.py [--replay-file FILE] [--speed X]
+                                                [--rate N] [--port N] [--sse]
+"""
+import argparse
+import json
+import random
+import time
+import urllib.parse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+HEARTBEAT_INTERVAL = 5  # Seconds of silence before sending an empty line
+
+def load_recording(path):
+    """Read recorded ticks sorted by time"""
+    ticks = []
+    with open(path, "r") as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                ticks.append(json.loads(line))
+    ticks.sort(key=lambda tick: tick['time'])
+    return ticks
+
+def replay_ticks(ticks, speed, loop):
+    """Yield recorded ticks paced by their timestamps (speed 0 = as fast as possible)"""
+    while True:
+        wall_start = time.time()
+        recording_start = ticks[0]['time']
+        for tick in ticks:
+            if speed > 0:
+                delay = (tick['time'] - recording_start) / speed - (time.time() - wall_start)
+                if delay > 0:
+                    time.sleep(delay)
+            yield dict(tick, time=time.time())
+        if not loop:
+            return
+
+def random_ticks(symbols, rate):
+    """Yield random-walk ticks for the requested symbols at a fixed rate"""
+    prices = {symbol: random.uniform(20, 500) for symbol in symbols}
+    closes = dict(prices)
+    volumes = dict.fromkeys(symbols, 0)
+    while True:
+        symbol = random.choice(symbols)
+        prices[symbol] *= 1 + random.gauss(0, 0.001)
+        volumes[symbol] += random.randint(1, 50) * 100
+        yield {"time": time.time(), "symbol": symbol, "price": round(prices[symbol], 4),
+               "previous_close": round(closes[symbol], 4), "volume": volumes[symbol]}
+        time.sleep(1.0 / rate)
+
+class QuoteStreamHandler(BaseHTTPRequestHandler):
+    """Streams ticks until the client disconnects"""
+    
+    protocol_version = "HTTP/1.0"  # No Content-Length: the body ends when the connection closes
+    
+    def do_GET(self):
+        query = urllib.parse.parse_qs(urllib.parse.urlparse(self.path).query)
+        symbols = [s for s in ",".join(query.get('symbols', [])).split(",") if s]
+        
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream" if self.server.sse else "application/x-ndjson")
+        self.send_header("Cache-Control", "no-cache")
+        self.end_headers()
+        
+        if self.server.recording:
+            ticks = replay_ticks(self.server.recording, self.server.speed, self.server.loop)
+        else:
+            ticks = random_ticks(symbols or ["AAPL", "MSFT", "NVDA"], self.server.rate)
+        
+        wanted = set(symbols)
+        last_write = time.time()
+        sent = 0
+        try:
+            for tick in ticks:
+                if wanted and tick['symbol'] not in wanted:
+                    # Keep the connection alive through long runs of unwatched symbols
+                    if time.time() - last_write >= HEARTBEAT_INTERVAL:
+                        self._write(b"\n")
+                        last_write = time.time()
+                    continue
+                
+                payload = json.dumps(tick)
+                self._write((f"data: {payload}\n\n" if self.server.sse else payload + "\n").encode("utf-8"))
+                last_write = time.time()
+                sent += 1
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+        self.log_message("client done after %d ticks", sent)
+    
+    def _write(self, data):
+        self.wfile.write(data)
+        self.wfile.flush()
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve a local push quote stream")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--replay-file", help="recorded ticks (JSON lines) to replay")
+    parser.add_argument("--speed", type=float, default=1.0, help="replay speed multiplier (0 = as fast as possible)")
+    parser.add_argument("--loop", action="store_true", help="restart the recording when it ends")
+    parser.add_argument("--rate", type=float, default=20, help="random ticks per second without a recording")
+    parser.add_argument("--sse", action="store_true", help="use Server-Sent Events framing")
+    args = parser.parse_args()
+    
+    server = ThreadingHTTPServer(("127.0.0.1", args.port), QuoteStreamHandler)
+    server.daemon_threads = True
+    server.recording = load_recording(args.replay_file) if args.replay_file else None
+    server.speed = args.speed
+    server.loop = args.loop
+    server.rate = args.rate
+    server.sse = args.sse
+    
+    print(f"Streaming quotes on http://127.0.0.1:{args.port}/quotes (Ctrl+C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == "__main__":
+    main()
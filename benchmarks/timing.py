@@ -0,0 +1,22 @@
+"""
+Timing helpers shared by the RSS Terminal benchmarks.
+Every helper works in milliseconds.
+"""
+import statistics
+import time
+
+def time_call(func, runs):
+    """Return per-call timings of func in milliseconds"""
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+def report(name, timings, items=None, unit="items"):
+    """Print median/min/max of a list of timings in milliseconds, and a rate when each call handles `items` units"""
+    median = statistics.median(timings)
+    rate = f" | {items / (median / 1000):12,.0f} {unit}/s" if items and median else ""
+    print(f"{name:<12} median {median:8.3f} ms | min {min(timings):8.3f} ms | max {max(timings):8.3f} ms"
+          f"{rate} | runs {len(timings)}")
@@ -4,31 +4,21 @@ RSS Terminal - Main entry point
 A terminal-inspired RSS feed reader application
 """
 import tkinter as tk
+import importlib.util
 import sys
 
 def check_dependencies():
     """Check for required dependencies and provide helpful error if missing"""
-    missing_modules = []
-    
-    try:
-        import pytz
-    except ImportError:
-        missing_modules.append("pytz")
-    
-    try:
-        from dateutil import parser
-    except ImportError:
-        missing_modules.append("python-dateutil")
-        
-    try:
-        import feedparser
-    except ImportError:
-        missing_modules.append("feedparser")
-        
-    try:
-        import html2text
-    except ImportError:
-        missing_modules.append("html2text")
+    # find_spec locates modules without importing them, so heavy
+    # dependencies are still only loaded when they are first used
+    required = {
+        "pytz": "pytz",
+        "dateutil": "python-dateutil",
+        "feedparser": "feedparser",
+        "html2text": "html2text",
+    }
+    missing_modules = [package for module, package in required.items()
+                       if importlib.util.find_spec(module) is None]
     
     if missing_modules:
         print(f"ERROR: Missing required modules: {', '.join(missing_modules)}")
@@ -2,13 +2,28 @@
 Main application module for RSS Terminal.
 This module coordinates between the UI, feed manager, and configuration.
 """
+import functools
 import tkinter as tk
 
 from rss_terminal.config import ConfigManager
 from rss_terminal.feed_manager import FeedManager
 from rss_terminal.stock_manager import StockManager
+from rss_terminal.weather_manager import WeatherManager
+from rss_terminal.traffic import create_traffic_log
+from rss_terminal.metrics import create_metrics_exporter
+from rss_terminal.perf_monitor import PerfMonitor
 from rss_terminal.ui import TerminalUI
 
+# How often rss_config.ini is checked for edits
+CONFIG_POLL_MS = 2000
+
+# Settings that are only read at startup
+RESTART_SETTINGS = ('stock_provider', 'stock_replay_file', 'stock_replay_speed', 'stock_bar_cache_file', 'show_intro',
+                    'fetch_workers', 'fetch_max_per_host', 'fetch_host_rate', 'fetch_host_burst',
+                    'fetch_failure_threshold', 'fetch_max_backoff', 'replay_mode', 'replay_directory', 'replay_speed',
+                    'metrics_enabled', 'metrics_file', 'metrics_interval', 'metrics_max_bytes', 'metrics_backups',
+                    'metrics_port', 'metrics_main_loop')
+
 class RSSTerminalApp:
     """
     Main application class that coordinates all components
@@ -21,20 +36,42 @@ class RSSTerminalApp:
         # Initialize configuration
         self.config_manager = ConfigManager()
         
+        # Record or replay network traffic if the [Replay] section asks for it
+        self.traffic = create_traffic_log(self.config_manager)
+        
+        # Export counters and timings if the [Metrics] section enables it
+        self.metrics = create_metrics_exporter(self.config_manager)
+        if self.metrics:
+            self.metrics.start()
+        
         # Initialize feed manager
-        self.feed_manager = FeedManager(self.config_manager)
+        self.feed_manager = FeedManager(self.config_manager, traffic=self.traffic)
         
         # Initialize stock manager
-        self.stock_manager = StockManager(self.config_manager)
+        self.stock_manager = StockManager(self.config_manager, traffic=self.traffic)
+        
+        # Initialize weather manager (loads the last known observations from disk)
+        self.weather_manager = WeatherManager(self.config_manager, traffic=self.traffic)
+        
+        # Time the main loop and its callbacks from before the UI schedules any
+        self.perf_monitor = None
+        if self.config_manager.metrics_main_loop:
+            self.perf_monitor = PerfMonitor(self.root, export_metrics=self.config_manager.metrics_enabled)
+            self.perf_monitor.start()
         
         # Initialize UI 
-        self.ui = TerminalUI(self.root, self.config_manager, self.feed_manager)
+        self.ui = TerminalUI(self.root, self.config_manager, self.feed_manager, perf_monitor=self.perf_monitor)
         
         # Set up the feed update callback
-        self.feed_manager.fetch_callback = self.ui.handle_feed_update
+        self.feed_manager.fetch_callback = self._on_main_thread(self.ui.handle_feed_update)
         
         # Set up the stock update callback
-        self.stock_manager.fetch_callback = self.ui.handle_stock_update
+        self.stock_manager.fetch_callback = self._on_main_thread(self.ui.handle_stock_update)
+        
+        # Show cached weather right away; the worker revalidates it in the background
+        cached_weather = self.weather_manager.get_all_weather()
+        if cached_weather:
+            self.ui.handle_weather_update(cached_weather)
         
         # Start background feed fetching
         self.initial_setup()
@@ -48,16 +85,79 @@ class RSSTerminalApp:
         self.root.after(1000, self.feed_manager.initial_fetch)
         
         # Start background thread for periodic fetching
-        self.feed_manager.start_fetching(self.ui.handle_feed_update)
+        self.feed_manager.start_fetching(self._on_main_thread(self.ui.handle_feed_update))
+        
+        # Start background stock fetching with initial delay (after feed fetch)
+        self.stock_manager.start_fetching(self._on_main_thread(self.ui.handle_stock_update), initial_delay=5)
         
-        # Start background stock fetching with initial delay
-        self.stock_manager.start_fetching(self.ui.handle_stock_update)
+        # Start the weather worker
+        self.weather_manager.start_fetching(self._on_main_thread(self.ui.handle_weather_update))
         
-        # Schedule initial stock fetch (after feed fetch)
-        self.root.after(5000, self.stock_manager.fetch_stock_data)
+        # Pick up edits to the config file while running
+        self.root.after(CONFIG_POLL_MS, self.watch_config)
+    
+    def watch_config(self):
+        """Poll the config file and apply only what changed, keeping articles and quotes in memory"""
+        try:
+            diff = self.config_manager.reload_if_changed()
+            if diff:
+                self.apply_config_diff(diff)
+        except Exception as e:
+            print(f"Error applying config changes: {e}")
+        
+        self.root.after(CONFIG_POLL_MS, self.watch_config)
+    
+    def apply_config_diff(self, diff):
+        """Apply a reloaded config: fetch added feeds, drop removed ones, wake only the affected timers"""
+        changed = diff.changed
+        print(f"[DEBUG] Config reloaded: +{len(diff.added_feeds)} feeds, -{len(diff.removed_feeds)} feeds, "
+              f"changed {', '.join(sorted(changed)) or 'no settings'}")
+        
+        # Feeds: drop articles of removed feeds, fetch just the new ones
+        if diff.removed_feeds:
+            if self.feed_manager.current_filter in diff.removed_feeds:
+                self.ui.set_filter("ALL")
+            if self.feed_manager.remove_feeds(diff.removed_feeds):
+                self.ui.display_articles(maintain_position=True)
+        if diff.added_feeds:
+            self.feed_manager.fetch_feeds(diff.added_feeds)
+        if changed.keys() & {'refresh_interval', 'feeds_per_slot'}:
+            self.feed_manager.reschedule()
+        
+        # Stocks: quotes for kept symbols stay, added symbols are fetched on their own
+        if 'stock_symbols' in changed or 'stock_stream_url' in changed:
+            old_symbols, new_symbols = changed.get('stock_symbols', (self.config_manager.stock_symbols,) * 2)
+            added = [symbol for symbol in new_symbols if symbol not in old_symbols]
+            removed = [symbol for symbol in old_symbols if symbol not in new_symbols]
+            self.stock_manager.update_watchlist(added, removed, resubscribe='stock_stream_url' in changed)
+            self.ui.update_stock_display()
+        if changed.keys() & {'stock_update_interval', 'stock_extended_interval', 'stock_settlement_delay'}:
+            self.stock_manager.reschedule()
+        
+        # Weather: the worker fetches at once when the station list changed
+        if changed.keys() & {'airport_codes', 'weather_update_interval'}:
+            self.weather_manager.reschedule()
+        if 'airport_codes' in changed:
+            self.ui.handle_weather_update(self.weather_manager.get_all_weather())
+        
+        needs_restart = sorted(changed.keys() & set(RESTART_SETTINGS))
+        if needs_restart:
+            print(f"Restart to apply: {', '.join(needs_restart)}")
+    
+    def _on_main_thread(self, callback):
+        """Wrap a callback so background threads hand it off to the Tk main loop"""
+        def _dispatch(*args, **kwargs):
+            # A partial rather than a lambda keeps the callback's name for the performance monitor
+            self.root.after(0, functools.partial(callback, *args, **kwargs))
+        return _dispatch
     
     def on_closing(self):
         """Cleanup when closing the application"""
         self.feed_manager.stop_fetching()
         self.stock_manager.stop_fetching()
+        self.weather_manager.stop_fetching()
+        if self.metrics:
+            self.metrics.stop()
+        if self.perf_monitor:
+            self.perf_monitor.stop()
         self.root.destroy()
\ No newline at end of file
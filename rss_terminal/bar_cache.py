@@ -0,0 +1,93 @@
+"""
+Daily bar cache for RSS Terminal.
+Stores completed daily OHLCV bars in SQLite, keyed by symbol and date, so
+past sessions are downloaded once and only the missing tail is fetched.
+"""
+import datetime
+import sqlite3
+import threading
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS bars (
+    symbol TEXT NOT NULL,
+    date TEXT NOT NULL,
+    open REAL,
+    high REAL,
+    low REAL,
+    close REAL NOT NULL,
+    volume REAL,
+    PRIMARY KEY (symbol, date)
+)
+"""
+
+class BarCache:
+    """SQLite store of completed daily bars with hit/miss counters"""
+    
+    def __init__(self, path="bar_cache.db"):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = None
+        
+        # Counted per symbol and fetch: a hit needed no history from the network
+        self.hits = 0
+        self.misses = 0
+        self.bars_stored = 0
+    
+    def _connection(self):
+        """Open the database on first use; the fetch thread is the main user"""
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute(SCHEMA)
+            self._conn.commit()
+        return self._conn
+    
+    def latest_date(self, symbol):
+        """Date of the newest cached bar for a symbol, or None"""
+        with self._lock:
+            row = self._connection().execute(
+                "SELECT MAX(date) FROM bars WHERE symbol = ?", (symbol,)).fetchone()
+        return datetime.date.fromisoformat(row[0]) if row and row[0] else None
+    
+    def closes(self, symbol, before, count):
+        """Return up to count closes (oldest first) for sessions before a date"""
+        with self._lock:
+            rows = self._connection().execute(
+                "SELECT close FROM bars WHERE symbol = ? AND date < ? ORDER BY date DESC LIMIT ?",
+                (symbol, before.isoformat(), count)).fetchall()
+        return [row[0] for row in reversed(rows)]
+    
+    def store(self, symbol, bars):
+        """Insert or replace (date, open, high, low, close, volume) rows for a symbol"""
+        rows = [(symbol, day.isoformat(), o, h, l, c, v) for day, o, h, l, c, v in bars]
+        if not rows:
+            return
+        
+        with self._lock:
+            conn = self._connection()
+            conn.executemany("INSERT OR REPLACE INTO bars VALUES (?, ?, ?, ?, ?, ?, ?)", rows)
+            conn.commit()
+            self.bars_stored += len(rows)
+    
+    def record_lookup(self, hit):
+        """Count whether a symbol's history was already complete in the cache"""
+        if hit:
+            self.hits += 1
+        else:
+            self.misses += 1
+    
+    def stats(self):
+        """Return hit/miss counters and the hit rate"""
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'bars_stored': self.bars_stored,
+        }
+    
+    def close(self):
+        """Close the database connection"""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
@@ -4,6 +4,16 @@ Configuration handling for the RSS Terminal application.
 import os
 import configparser
 import json
+import xml.etree.ElementTree as ET
+from collections import namedtuple
+from rss_terminal.opml import load_opml
+
+# What a reload changed: feeds to fetch (new or with a new URL), names of feeds
+# that went away (or moved URL), and {setting: (old, new)} for everything else
+ConfigDiff = namedtuple('ConfigDiff', ['added_feeds', 'removed_feeds', 'changed'])
+
+# Attributes that are state rather than settings, so reloads never diff them
+NON_SETTINGS = ('config_file', 'last_seen_file', 'last_seen_guids', 'feeds')
 
 class ConfigManager:
     """Manages application configuration and state persistence"""
@@ -14,10 +24,44 @@ class ConfigManager:
         self.refresh_interval = 60  # default: 60 seconds
         self.timezone = "America/Los_Angeles"  # default timezone
         self.airport_code = "KTUS"  # default airport code for weather
+        self.airport_codes = ["KTUS"]  # all weather stations, fetched in one request
         self.weather_update_interval = 900  # default: 15 minutes (in seconds)
+        self.show_intro = True  # animate the startup sequence
+        self.opml_file = ""  # OPML export whose feeds are added to [Feeds]
+        self.feeds_per_slot = 50  # feeds fetched together; more feeds are spread across the refresh window
         self.stock_symbols = ["^GSPC", "^IXIC", "^DJI"]  # default: S&P 500, NASDAQ, Dow Jones
-        self.stock_update_interval = 300  # default: 5 minutes (in seconds)
+        self.stock_update_interval = 300  # default: 5 minutes (in seconds) during regular hours
+        self.stock_extended_interval = 900  # default: 15 minutes in pre/post-market (0 = don't poll)
+        self.stock_settlement_delay = 900  # fetch once this long after the close for settled prices
         self.show_change_percent = True  # show percentage change in display
+        self.stock_history_size = 390  # intraday samples kept per symbol
+        self.show_sparkline = True  # show the intraday trend in the ticker bar
+        self.stock_bar_cache_file = "bar_cache.db"  # SQLite cache of completed daily bars
+        self.stock_provider = "yahoo"  # quote source: yahoo or replay
+        self.stock_replay_file = "quotes_replay.jsonl"  # recorded ticks for the replay provider
+        self.stock_replay_speed = 1.0  # replay speed multiplier (0 = one recorded step per fetch)
+        self.stock_stream_url = ""  # push quote stream (NDJSON/SSE over HTTP); empty = poll only
+        self.stock_max_redraws_per_second = 4  # cap on ticker redraws from streamed quotes
+        self.fetch_workers = 8  # feeds downloaded in parallel within a cycle
+        self.fetch_max_per_host = 2  # concurrent requests to one host
+        self.fetch_host_rate = 1.0  # requests per second to one host (0 = unlimited)
+        self.fetch_host_burst = 2  # requests to one host allowed back to back before pacing starts
+        self.fetch_failure_threshold = 3  # consecutive failures before a feed is skipped with backoff
+        self.fetch_max_backoff = 3600  # longest a failing feed is skipped before a probe fetch
+        self.fetch_connect_timeout = 5  # seconds to establish a connection
+        self.fetch_read_timeout = 15  # seconds a connection may stay silent
+        self.fetch_max_bytes = 5 * 1024 * 1024  # larger feed responses are abandoned (0 = no limit)
+        self.fetch_cycle_deadline = 120  # a cycle publishes what it has after this long (0 = no deadline)
+        self.replay_mode = "off"  # off, record (save responses) or replay (serve saved responses offline)
+        self.replay_directory = "traffic"  # where recorded responses are kept
+        self.replay_speed = 1.0  # replayed latency and quote clock speed-up (0 = no delays)
+        self.metrics_enabled = False  # export counters and timings of the fetch and render paths
+        self.metrics_file = "metrics.jsonl"  # snapshots appended here, rotated by size
+        self.metrics_interval = 60  # seconds between snapshots
+        self.metrics_max_bytes = 1024 * 1024  # the file is rotated once it grows past this
+        self.metrics_backups = 3  # rotated files kept (metrics.jsonl.1, .2, ...)
+        self.metrics_port = 0  # serve Prometheus text on 127.0.0.1:<port>/metrics (0 = off)
+        self.metrics_main_loop = True  # time the Tk main loop for the performance overlay
         self.feeds = []
         self.last_seen_guids = {}
         
@@ -25,7 +69,10 @@ class ConfigManager:
         if not os.path.exists(self.config_file):
             self._create_default_config()
         
+        self._file_signature = None  # (mtime, size) of the loaded config and OPML files
+        self._pending_signature = None  # Seen changed once, reloaded when it holds still
         self.load_config()
+        self._file_signature = self._config_signature()
         self.load_last_seen()
     
     def load_config(self):
@@ -36,19 +83,139 @@ class ConfigManager:
         if 'Settings' in config:
             self.refresh_interval = config.getint('Settings', 'refresh_interval', fallback=60)
             self.timezone = config.get('Settings', 'timezone', fallback="America/Los_Angeles")
-            self.airport_code = config.get('Settings', 'airport_code', fallback="KTUS")
+            airport_str = config.get('Settings', 'airport_code', fallback="KTUS")
+            self.airport_codes = [code.strip().upper() for code in airport_str.split(',') if code.strip()]
+            self.airport_code = self.airport_codes[0] if self.airport_codes else ""
             self.weather_update_interval = config.getint('Settings', 'weather_update_interval', fallback=900)
+            self.show_intro = config.getboolean('Settings', 'show_intro', fallback=True)
+            opml_file = config.get('Settings', 'opml_file', fallback="").strip()
+            # A relative path is relative to the config file, not to where the app was started
+            self.opml_file = os.path.join(os.path.dirname(self.config_file), opml_file) if opml_file else ""
+            self.feeds_per_slot = config.getint('Settings', 'feeds_per_slot', fallback=50)
         
         if 'Stock' in config:
             symbols_str = config.get('Stock', 'symbols', fallback="^GSPC,^IXIC,^DJI")
             self.stock_symbols = [s.strip().upper() for s in symbols_str.split(',') if s.strip()]
             self.stock_update_interval = config.getint('Stock', 'update_interval', fallback=300)
+            self.stock_extended_interval = config.getint('Stock', 'extended_hours_interval', fallback=900)
+            self.stock_settlement_delay = config.getint('Stock', 'settlement_delay', fallback=900)
             self.show_change_percent = config.getboolean('Stock', 'show_change_percent', fallback=True)
+            self.stock_history_size = config.getint('Stock', 'history_size', fallback=390)
+            self.show_sparkline = config.getboolean('Stock', 'show_sparkline', fallback=True)
+            self.stock_bar_cache_file = config.get('Stock', 'bar_cache_file', fallback="bar_cache.db")
+            self.stock_provider = config.get('Stock', 'provider', fallback="yahoo").strip().lower()
+            self.stock_replay_file = config.get('Stock', 'replay_file', fallback="quotes_replay.jsonl")
+            self.stock_replay_speed = config.getfloat('Stock', 'replay_speed', fallback=1.0)
+            self.stock_stream_url = config.get('Stock', 'stream_url', fallback="").strip()
+            self.stock_max_redraws_per_second = config.getfloat('Stock', 'max_redraws_per_second', fallback=4)
+        
+        if 'Fetch' in config:
+            self.fetch_workers = config.getint('Fetch', 'workers', fallback=8)
+            self.fetch_max_per_host = config.getint('Fetch', 'max_per_host', fallback=2)
+            self.fetch_host_rate = config.getfloat('Fetch', 'host_rate', fallback=1.0)
+            self.fetch_host_burst = config.getfloat('Fetch', 'host_burst', fallback=2)
+            self.fetch_failure_threshold = config.getint('Fetch', 'failure_threshold', fallback=3)
+            self.fetch_max_backoff = config.getint('Fetch', 'max_backoff', fallback=3600)
+            self.fetch_connect_timeout = config.getfloat('Fetch', 'connect_timeout', fallback=5)
+            self.fetch_read_timeout = config.getfloat('Fetch', 'read_timeout', fallback=15)
+            self.fetch_max_bytes = config.getint('Fetch', 'max_bytes', fallback=5 * 1024 * 1024)
+            self.fetch_cycle_deadline = config.getfloat('Fetch', 'cycle_deadline', fallback=120)
+        
+        if 'Replay' in config:
+            self.replay_mode = config.get('Replay', 'mode', fallback="off").strip().lower()
+            self.replay_directory = config.get('Replay', 'directory', fallback="traffic")
+            self.replay_speed = config.getfloat('Replay', 'speed', fallback=1.0)
+        
+        if 'Metrics' in config:
+            self.metrics_enabled = config.getboolean('Metrics', 'enabled', fallback=False)
+            self.metrics_file = config.get('Metrics', 'file', fallback="metrics.jsonl")
+            self.metrics_interval = config.getfloat('Metrics', 'interval', fallback=60)
+            self.metrics_max_bytes = config.getint('Metrics', 'max_bytes', fallback=1024 * 1024)
+            self.metrics_backups = config.getint('Metrics', 'backups', fallback=3)
+            self.metrics_port = config.getint('Metrics', 'port', fallback=0)
+            self.metrics_main_loop = config.getboolean('Metrics', 'main_loop', fallback=True)
         
+        # The feed list is built aside and swapped in with one assignment, because the
+        # fetch thread reads self.feeds while a hot reload runs
         if 'Feeds' in config:
-            self.feeds = []
-            for key, url in config['Feeds'].items():
-                self.feeds.append({'name': key.upper(), 'url': url})
+            feeds = [{'name': key.upper(), 'url': url, 'group': None} for key, url in config['Feeds'].items()]
+        else:
+            feeds = [feed for feed in self.feeds if feed['group'] is None]
+        
+        # OPML feeds are re-read on every load, after the [Feeds] entries
+        if self.opml_file:
+            feeds += self._load_opml_feeds(feeds)
+        self.feeds = feeds
+    
+    def _load_opml_feeds(self, listed_feeds):
+        """Feeds from the OPML file, skipping any already listed in [Feeds]"""
+        listed_urls = {feed['url'] for feed in listed_feeds}
+        taken_names = {feed['name'] for feed in listed_feeds}
+        try:
+            return [feed for feed in load_opml(self.opml_file, taken_names) if feed['url'] not in listed_urls]
+        except (OSError, ET.ParseError) as e:
+            # Missing or caught mid-write: keep the feeds imported last time rather than dropping them all
+            print(f"Error importing feeds from {self.opml_file}, keeping the previously imported feeds: {e}")
+            return [feed for feed in self.feeds if feed['group'] is not None
+                    and feed['url'] not in listed_urls and feed['name'] not in taken_names]
+    
+    def _config_signature(self):
+        """(mtime, size) of the config file and the OPML file, or None if the config cannot be read"""
+        signature = []
+        for path in (self.config_file, self.opml_file):
+            try:
+                stat = os.stat(path) if path else None
+            except OSError:
+                if path == self.config_file:
+                    return None
+                stat = None
+            signature.append((stat.st_mtime_ns, stat.st_size) if stat else None)
+        return tuple(signature)
+    
+    def _settings(self):
+        """Current values of every setting, for diffing across a reload"""
+        return {name: value for name, value in vars(self).items()
+                if name not in NON_SETTINGS and not name.startswith('_')}
+    
+    def reload_if_changed(self):
+        """Reload the config file if it changed on disk; returns a ConfigDiff, or None if nothing changed"""
+        signature = self._config_signature()
+        if signature is None or signature == self._file_signature:
+            self._pending_signature = None
+            return None
+        
+        # Editors may write in several steps; wait one poll for the file to hold still
+        if signature != self._pending_signature:
+            self._pending_signature = signature
+            return None
+        
+        self._file_signature = signature
+        self._pending_signature = None
+        
+        old_settings = self._settings()
+        old_feed_list = self.feeds
+        old_feeds = {feed['name']: feed['url'] for feed in self.feeds}
+        try:
+            self.load_config()
+        except (configparser.Error, ValueError) as e:
+            # Roll back whatever was assigned before the bad value
+            for name, value in old_settings.items():
+                setattr(self, name, value)
+            self.feeds = old_feed_list
+            print(f"Error reloading {self.config_file}, keeping the previous settings: {e}")
+            return None
+        new_settings = self._settings()
+        new_feeds = {feed['name']: feed['url'] for feed in self.feeds}
+        
+        # A feed whose URL changed is dropped and fetched again from the new URL
+        added_feeds = [feed for feed in self.feeds if old_feeds.get(feed['name']) != feed['url']]
+        removed_feeds = [name for name, url in old_feeds.items() if new_feeds.get(name) != url]
+        changed = {name: (old_settings.get(name), value) for name, value in new_settings.items()
+                   if old_settings.get(name) != value}
+        
+        if not (added_feeds or removed_feeds or changed):
+            return None
+        return ConfigDiff(added_feeds, removed_feeds, changed)
     
     def _create_default_config(self):
         """Create a default configuration file"""
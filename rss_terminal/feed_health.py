@@ -0,0 +1,102 @@
+"""
+Feed health tracking for RSS Terminal.
+Counts consecutive failures per feed and trips a circuit breaker after a
+few of them: the feed is skipped for an exponentially growing interval,
+then a single half-open probe decides whether it is back.
+"""
+import random
+import threading
+import time
+
+CLOSED = "OK"  # Fetched every cycle
+OPEN = "OPEN"  # Skipped until its next retry time
+HALF_OPEN = "PROBE"  # One probe fetch in flight after the retry time passed
+
+class FeedHealth:
+    """Health record of one feed"""
+    
+    def __init__(self, name):
+        self.name = name
+        self.state = CLOSED
+        self.failures = 0  # Consecutive failures
+        self.total_failures = 0
+        self.last_error = None
+        self.last_success = None
+        self.next_retry = None  # When an open circuit lets a probe through
+        self.probe_started = None
+
+class FeedHealthTracker:
+    """Circuit breakers for all feeds, shared by the fetch cycle and the health popup"""
+    
+    def __init__(self, failure_threshold=3, base_backoff=60, max_backoff=3600):
+        self.failure_threshold = max(1, failure_threshold)
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+        self._feeds = {}
+        self._lock = threading.Lock()
+    
+    def _get(self, name):
+        health = self._feeds.get(name)
+        if health is None:
+            health = self._feeds[name] = FeedHealth(name)
+        return health
+    
+    def allow(self, name, now=None):
+        """Whether to fetch the feed this cycle; an open circuit past its retry time lets one probe through"""
+        now = time.time() if now is None else now
+        with self._lock:
+            health = self._feeds.get(name)
+            if health is None or health.state == CLOSED:
+                return True
+            # A probe that never reported back (e.g. its host was deferred) is retried after a while
+            probe_lost = health.state == HALF_OPEN and now - health.probe_started >= self.base_backoff
+            if (health.state == OPEN and now >= health.next_retry) or probe_lost:
+                health.state = HALF_OPEN
+                health.probe_started = now
+                return True
+            return False
+    
+    def record_success(self, name):
+        """Close the circuit after a successful fetch"""
+        with self._lock:
+            health = self._get(name)
+            health.state = CLOSED
+            health.failures = 0
+            health.next_retry = None
+            health.last_success = time.time()
+    
+    def record_failure(self, name, error, now=None):
+        """Count a failed fetch, opening the circuit with a longer backoff each time past the threshold"""
+        now = time.time() if now is None else now
+        with self._lock:
+            health = self._get(name)
+            health.failures += 1
+            health.total_failures += 1
+            health.last_error = str(error) or error.__class__.__name__
+            
+            if health.failures >= self.failure_threshold:
+                # 60s, 120s, 240s, ... capped, with jitter so failing feeds do not retry in step
+                backoff = min(self.max_backoff, self.base_backoff * 2 ** (health.failures - self.failure_threshold))
+                health.state = OPEN
+                health.next_retry = now + backoff * random.uniform(0.9, 1.1)
+            else:
+                health.state = CLOSED
+    
+    def forget(self, names):
+        """Drop records of feeds that left the config"""
+        with self._lock:
+            for name in names:
+                self._feeds.pop(name, None)
+    
+    def failing_count(self):
+        """Number of feeds whose last fetch failed"""
+        with self._lock:
+            return sum(1 for health in self._feeds.values() if health.failures)
+    
+    def rows(self):
+        """Feeds with failures as (name, state, failures, total failures, next retry, last error), worst first"""
+        with self._lock:
+            failing = [health for health in self._feeds.values() if health.failures]
+            failing.sort(key=lambda health: (health.state == CLOSED, -health.failures, health.name))
+            return [(health.name, health.state, health.failures, health.total_failures,
+                     health.next_retry, health.last_error) for health in failing]
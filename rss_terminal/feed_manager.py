@@ -1,23 +1,119 @@
 """
 Feed management for RSS Terminal application.
 """
+import random
 import time
 import threading
+import zlib
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from types import MappingProxyType
 import feedparser
+from rss_terminal import metrics
+from rss_terminal.feed_health import FeedHealthTracker
+from rss_terminal.fetcher import FeedFetcher, FetchCancelled
+from rss_terminal.politeness import PolitenessGate, HostDeferred, THROTTLE_STATUSES, host_of
 from rss_terminal.utils import parse_date, get_formatted_time
 
+# Immutable, versioned view of the article store. A new snapshot (with a higher
+# generation) is published whenever the articles or the active filter change.
+ArticleSnapshot = namedtuple('ArticleSnapshot', ['generation', 'articles', 'filtered_articles', 'current_filter'])
+
+# Stages timed in each fetch cycle. download and parse run on the worker threads
+# and are summed across them, so they can add up to more than the cycle's total.
+CYCLE_STAGES = ('download', 'parse', 'entries', 'dedup', 'sort', 'save', 'cleanup', 'total')
+
+# Fraction of a slot's length by which its start is randomly delayed
+SLOT_JITTER = 0.5
+
+def assign_slots(feeds, feeds_per_slot):
+    """Split feeds into equal time slots of at most feeds_per_slot each, in a stable hashed order"""
+    slot_count = max(1, -(-len(feeds) // max(1, feeds_per_slot)))
+    slots = [[] for _ in range(slot_count)]
+    # Dealing in hash order keeps the slots within one feed of each other
+    ordered = sorted(feeds, key=lambda feed: zlib.crc32(feed['name'].encode('utf-8')))
+    for i, feed in enumerate(ordered):
+        slots[i % slot_count].append(feed)
+    return slots
+
+class FeedFetchError(Exception):
+    """A feed responded, but with an HTTP error or nothing parseable"""
+
 class FeedManager:
     """Manages RSS feeds, fetches articles and maintains article lists"""
     
-    def __init__(self, config_manager):
+    def __init__(self, config_manager, traffic=None):
         self.config = config_manager
-        self.articles = []  # All articles
-        self.filtered_articles = []  # Articles filtered by current selection
-        self.current_filter = "ALL"  # Default filter showing all feeds
+        # Articles are published as copy-on-write snapshots: readers grab
+        # self._snapshot once and never need a lock, writers build a new
+        # snapshot under _publish_lock and swap it in with one assignment.
+        self._snapshot = ArticleSnapshot(0, (), (), "ALL")
+        self._publish_lock = threading.Lock()
         self.last_check_time = None
         self.running = True
         self.fetch_thread = None
         self.fetch_callback = None
+        self.is_fetching = False
+        
+        # Set to wake the background worker early (manual refresh, new interval or shutdown)
+        self._wake_event = threading.Event()
+        self._refresh_requested = False
+        self._next_fetch_time = None  # When the worker fetches next; moved by reschedule()
+        self._cycle_start = None  # When the first slot of the current cycle was due
+        self._slot_index = 0  # Next slot to fetch in the current cycle
+        # Serializes fetch cycles so overlapping requests never run concurrently
+        self._fetch_lock = threading.Lock()
+        
+        # Within a cycle feeds download in parallel, limited per host
+        self.politeness = PolitenessGate(self.config.fetch_max_per_host, self.config.fetch_host_rate,
+                                         self.config.fetch_host_burst)
+        self._executor = ThreadPoolExecutor(max_workers=max(1, self.config.fetch_workers),
+                                            thread_name_prefix="feed-fetch")
+        self.fetcher = FeedFetcher(traffic)
+        # Set to make the current cycle's downloads give up (deadline or shutdown)
+        self._cycle_cancel = threading.Event()
+        
+        # Seconds spent per stage and counts from the last cycle, for benchmarks and tuning
+        self.stage_timings = dict.fromkeys(CYCLE_STAGES, 0.0)
+        self.cycle_counts = {'feeds': 0, 'entries': 0, 'new_articles': 0}
+        
+        # Feeds that keep failing are skipped for a growing interval instead of every cycle
+        self.health = FeedHealthTracker(self.config.fetch_failure_threshold, max_backoff=self.config.fetch_max_backoff)
+    
+    @property
+    def articles(self):
+        """All articles in the current snapshot"""
+        return self._snapshot.articles
+    
+    @property
+    def filtered_articles(self):
+        """Articles matching the current filter in the current snapshot"""
+        return self._snapshot.filtered_articles
+    
+    @property
+    def current_filter(self):
+        """The filter applied to the current snapshot"""
+        return self._snapshot.current_filter
+    
+    def snapshot(self):
+        """Return the latest published article snapshot (lock-free)"""
+        return self._snapshot
+    
+    def _publish(self, articles=None, current_filter=None):
+        """Publish a new snapshot; the caller must hold _publish_lock"""
+        previous = self._snapshot
+        if articles is None:
+            articles = previous.articles
+        if current_filter is None:
+            current_filter = previous.current_filter
+        
+        if current_filter == "ALL":
+            filtered = articles  # Tuples are immutable, so sharing is safe
+        else:
+            filtered = tuple(a for a in articles if a['source'] == current_filter)
+        
+        self._snapshot = ArticleSnapshot(previous.generation + 1, articles, filtered, current_filter)
+        return self._snapshot
     
     def start_fetching(self, callback=None):
         """Start the background thread that fetches feeds periodically"""
@@ -30,29 +126,185 @@ class FeedManager:
     def stop_fetching(self):
         """Stop the background thread"""
         self.running = False
+        self._wake_event.set()
+        self._cycle_cancel.set()
         if self.fetch_thread:
             self.fetch_thread.join(timeout=1)
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self.fetcher.close()
     
     def fetch_feeds_periodically(self):
-        """Periodically fetch all feeds based on refresh interval"""
+        """Periodically fetch the feeds, one time slot at a time across the refresh interval"""
+        self._start_cycle(time.time() + self.config.refresh_interval)
         while self.running:
-            time.sleep(self.config.refresh_interval)
-            self.fetch_all_feeds()
+            # Sleep until the next slot is due or a refresh/reschedule/shutdown wakes us
+            self._wake_event.wait(max(0, self._next_fetch_time - time.time()))
+            if not self.running:
+                break
+            
+            # Woken only because the interval changed: sleep until the new deadline
+            if not self._refresh_requested and time.time() < self._next_fetch_time:
+                self._wake_event.clear()
+                continue
+            
+            if self._refresh_requested:
+                # A manual refresh fetches every feed now and restarts the cycle
+                self._refresh_requested = False
+                self.fetch_all_feeds(wait=True)
+                self._wake_event.clear()
+                self._start_cycle(time.time() + self.config.refresh_interval)
+                continue
+            
+            slots = assign_slots(self.config.feeds, self.config.feeds_per_slot)
+            if self._slot_index == 0:
+                self.last_check_time = time.time()
+            if self._slot_index < len(slots):
+                self.fetch_all_feeds(slots[self._slot_index], wait=True)
+            
+            # A refresh requested while the fetch was in flight was only served by it if
+            # this slot held every feed; otherwise keep the event set so the loop goes
+            # straight on to the manual refresh
+            self._wake_event.clear()
+            if self._refresh_requested:
+                if len(slots) <= 1:
+                    self._refresh_requested = False
+                else:
+                    self._wake_event.set()
+
+            self._slot_index += 1
+            if self._slot_index >= len(slots):
+                # Next cycle; if fetching fell behind, start it now rather than bursting to catch up
+                self._start_cycle(max(time.time(), self._cycle_start + self.config.refresh_interval))
+            else:
+                self._next_fetch_time = self._slot_time(self._slot_index, len(slots))
+    
+    def _start_cycle(self, start):
+        """Schedule the first slot of a new cycle"""
+        self._cycle_start = start
+        self._slot_index = 0
+        self._next_fetch_time = start
+    
+    def _slot_time(self, index, slot_count):
+        """When a slot is due: its share of the interval plus jitter, so hosts are not hit in lockstep"""
+        slot_length = self.config.refresh_interval / slot_count
+        jitter = random.uniform(0, SLOT_JITTER) if index else 0
+        return self._cycle_start + (index + jitter) * slot_length
+    
+    def request_refresh(self):
+        """Ask the background worker to fetch now; merged with any fetch in flight"""
+        if self.fetch_thread and self.fetch_thread.is_alive():
+            self._refresh_requested = True
+            self._wake_event.set()
+        else:
+            threading.Thread(target=self.fetch_all_feeds, daemon=True).start()
+    
+    def reschedule(self):
+        """Move the next periodic fetch after the interval or slot size changed, without fetching now"""
+        if self._next_fetch_time is None:
+            return
+        if self._slot_index == 0:
+            if not self.last_check_time:
+                return
+            self._start_cycle(self.last_check_time + self.config.refresh_interval)
+        else:
+            slot_count = len(assign_slots(self.config.feeds, self.config.feeds_per_slot))
+            self._next_fetch_time = self._slot_time(min(self._slot_index, slot_count), slot_count)
+        self._wake_event.set()
+    
+    def fetch_feeds(self, feeds):
+        """Fetch just the given feeds in the background, e.g. ones added to the config"""
+        def _fetch():
+            # Wait for any cycle in flight; it started before these feeds existed
+            with self._fetch_lock:
+                self.is_fetching = True
+                try:
+                    self._fetch_feeds(feeds)
+                finally:
+                    self.is_fetching = False
+        
+        threading.Thread(target=_fetch, daemon=True).start()
+    
+    def remove_feeds(self, feed_names):
+        """Drop the articles of feeds that left the config; returns True if any were removed"""
+        removed = set(feed_names)
+        self.health.forget(removed)
+        for name in removed:
+            metrics.registry.remove('feed_fetches_total', source=name)
+        with self._publish_lock:
+            articles = tuple(article for article in self._snapshot.articles if article['source'] not in removed)
+            current_filter = "ALL" if self._snapshot.current_filter in removed else None
+            if len(articles) == len(self._snapshot.articles) and current_filter is None:
+                return False
+            self._publish(articles, current_filter)
+            return True
     
     def initial_fetch(self):
         """Perform first fetch of feeds in background"""
-        threading.Thread(target=self.fetch_all_feeds).start()
+        self.request_refresh()
     
-    def fetch_all_feeds(self):
-        """Fetch all configured RSS feeds and process articles"""
-        self.last_check_time = time.time()
+    def fetch_all_feeds(self, feeds=None, wait=False):
+        """Fetch all configured RSS feeds (or one time slot's share) and process articles"""
+        # If another fetch is already running, this request is covered by it, unless the caller
+        # waits its turn: the worker's own fetches must run even behind e.g. a fetch of new feeds
+        if not self._fetch_lock.acquire(blocking=wait):
+            return []
         
+        try:
+            self.is_fetching = True
+            if feeds is None:
+                feeds = self.config.feeds
+                self.last_check_time = time.time()
+            return self._fetch_feeds(feeds)
+        finally:
+            self.is_fetching = False
+            self._fetch_lock.release()
+    
+    def _fetch_feeds(self, feeds):
+        """Run a single fetch cycle over the given feeds"""
+        cycle_started = time.perf_counter()
+        timings = dict.fromkeys(CYCLE_STAGES, 0.0)
+        fetched_feeds = 0
+        entry_count = 0
         new_articles = []
         seen_headlines = set()  # Track duplicate headlines
+        host_waits = {}  # Host -> seconds each request queued for its slot
+        
+        # Feeds with an open circuit sit this cycle out until their retry time
+        skipped = [feed['name'] for feed in feeds if not self.health.allow(feed['name'])]
+        if skipped:
+            skipped_set = set(skipped)
+            feeds = [feed for feed in feeds if feed['name'] not in skipped_set]
+            print(f"[DEBUG] Circuit open, skipping {len(skipped)} feeds: {' '.join(skipped[:10])}")
+        
+        # Download in parallel, then process in config order so deduplication stays deterministic
+        cancel_event = self._cycle_cancel = threading.Event()
+        deadline = time.time() + self.config.fetch_cycle_deadline if self.config.fetch_cycle_deadline > 0 else None
+        downloads = [self._executor.submit(self._download, feed, cancel_event) for feed in feeds]
+        stragglers = 0
         
-        for i, feed in enumerate(self.config.feeds):
+        for feed, download in zip(feeds, downloads):
+            if not self.running:
+                cancel_event.set()
+                for pending in downloads:
+                    pending.cancel()
+                break
+            
+            # Past the deadline only downloads that already finished are used
+            if cancel_event.is_set() and not download.done():
+                download.cancel()
+                stragglers += 1
+                metrics.counter('feed_fetches_total', source=feed['name'], result='timeout').inc()
+                continue
+            
             try:
-                parsed_feed = feedparser.parse(feed['url'])
+                timeout = None if deadline is None else max(0, deadline - time.time())
+                parsed_feed, waited, download_seconds, parse_seconds = download.result(timeout=timeout)
+                host_waits.setdefault(host_of(feed['url']), []).append(waited)
+                timings['download'] += download_seconds
+                timings['parse'] += parse_seconds
+                fetched_feeds += 1
+                entry_count += len(parsed_feed.entries)
+                entries_started = time.perf_counter()
                 feed_title = feed['name']  # Use the standardized feed name
                 
                 # Initialize last_seen_guids for this feed if it doesn't exist
@@ -79,8 +331,8 @@ class FeedManager:
                     # Determine if this is a new article (not seen before)
                     is_new = hasattr(entry, 'id') and not self.config.is_guid_seen(feed['name'], entry.id)
                     
-                    # Add to articles list
-                    new_articles.append({
+                    # Add to articles list (read-only, it will be shared across threads)
+                    new_articles.append(MappingProxyType({
                         'title': title,
                         'pub_date': pub_date,
                         'pub_date_str': get_formatted_time(pub_date, self.config.timezone),
@@ -88,35 +340,80 @@ class FeedManager:
                         'source': feed_title,
                         'is_new': is_new,  # Mark as new for highlighting if it's new
                         'description': entry.description if hasattr(entry, 'description') else None
-                    })
+                    }))
                     
                     # Mark as seen if it's new
                     if is_new and hasattr(entry, 'id'):
                         self.config.update_last_seen_guid(feed['name'], entry.id)
+                
+                timings['entries'] += time.perf_counter() - entries_started
+                self.health.record_success(feed['name'])
+                metrics.counter('feed_fetches_total', "Feed fetches by source and result",
+                                source=feed['name'], result='ok').inc()
             
+            except FutureTimeoutError:
+                # Out of time: stop the downloads still running and publish what arrived
+                cancel_event.set()
+                download.cancel()
+                stragglers += 1
+                metrics.counter('feed_fetches_total', source=feed['name'], result='timeout').inc()
+            except (HostDeferred, FetchCancelled) as e:
+                metrics.counter('feed_fetches_total', source=feed['name'], result='skipped').inc()
+                print(f"[DEBUG] Skipping {feed['name']}: {e}")
             except Exception as e:
-                if self.fetch_callback:
-                    self.fetch_callback(f"Error fetching {feed['name']}: {str(e)}", error=True)
-        
-        # Check for duplicate headlines in existing articles
-        if new_articles and self.articles:
-            existing_headlines = {article['title'] for article in self.articles}
-            new_articles = [article for article in new_articles if article['title'] not in existing_headlines]
-        
-        # If we have new articles, add them to our list
-        if new_articles:
-            # Sort new articles by publication date (newest first)
-            new_articles.sort(key=lambda x: x['pub_date'], reverse=True)
+                # Tracked per feed and shown in the health table rather than on the status line
+                self.health.record_failure(feed['name'], e)
+                metrics.counter('feed_fetches_total', source=feed['name'], result='error').inc()
+                print(f"Error fetching {feed['name']}: {e}")
+        
+        if stragglers:
+            print(f"[DEBUG] Cycle deadline of {self.config.fetch_cycle_deadline}s reached, "
+                  f"{stragglers} feeds left for the next cycle")
+        self._report_host_waits(host_waits)
+        
+        with self._publish_lock:
+            articles = self._snapshot.articles
+            
+            # A feed removed by a config reload while it was being fetched stays removed
+            configured = {feed['name'] for feed in self.config.feeds}
+            new_articles = [article for article in new_articles if article['source'] in configured]
             
-            # Add to the beginning of our master list (newest first approach)
-            self.articles = new_articles + self.articles
-            self.config.save_last_seen()
+            # Check for duplicate headlines in existing articles
+            stage_started = time.perf_counter()
+            if new_articles and articles:
+                existing_headlines = {article['title'] for article in articles}
+                new_articles = [article for article in new_articles if article['title'] not in existing_headlines]
+            timings['dedup'] = time.perf_counter() - stage_started
+            
+            # If we have new articles, add them to our list
+            stage_started = time.perf_counter()
+            if new_articles:
+                # Sort new articles by publication date (newest first)
+                new_articles.sort(key=lambda x: x['pub_date'], reverse=True)
+                
+                # Add to the beginning of our master list (newest first approach)
+                articles = tuple(new_articles) + articles
+            timings['sort'] = time.perf_counter() - stage_started
             
-        # Clean up old articles if needed
-        self.cleanup_old_articles()
+            # Rewriting last_seen.json is disk I/O, so it is timed apart from the merge
+            if new_articles:
+                stage_started = time.perf_counter()
+                self.config.save_last_seen()
+                timings['save'] = time.perf_counter() - stage_started
+            
+            # Clean up old articles if needed
+            stage_started = time.perf_counter()
+            articles = self._prune_articles(articles)
+            
+            # Only publish (and bump the generation) if something changed
+            if new_articles or len(articles) != len(self._snapshot.articles):
+                self._publish(articles)
+            timings['cleanup'] = time.perf_counter() - stage_started
         
-        # Apply the current filter
-        self.apply_filter(self.current_filter)
+        timings['total'] = time.perf_counter() - cycle_started
+        self.stage_timings = timings
+        self.cycle_counts = {'feeds': fetched_feeds, 'entries': entry_count, 'new_articles': len(new_articles)}
+        self._record_cycle_metrics(timings, stragglers, len(new_articles))
         
         # Notify about completion
         if self.fetch_callback:
@@ -124,38 +421,98 @@ class FeedManager:
         
         return new_articles
     
-    def cleanup_old_articles(self):
-        """Remove old articles to prevent memory issues during long-term use"""
+    def _record_cycle_metrics(self, timings, stragglers, new_count):
+        """Export the cycle's stage timings and counts; download and parse are recorded per fetch"""
+        for stage in ('entries', 'dedup', 'sort', 'save', 'cleanup', 'total'):
+            metrics.histogram('feed_cycle_stage_seconds', "Time per fetch cycle stage (sort = store merge, save = last-seen file)",
+                              stage=stage).observe(timings[stage])
+        metrics.counter('feed_deadline_stragglers_total', "Downloads cancelled by the cycle deadline").inc(stragglers)
+        metrics.counter('feed_new_articles_total', "Articles added to the store").inc(new_count)
+        metrics.gauge('feed_articles_stored', "Articles in the current snapshot").set(len(self._snapshot.articles))
+        metrics.gauge('feed_failing', "Feeds whose last fetch failed").set(self.health.failing_count())
+    
+    def _download(self, feed, cancel_event=None):
+        """Fetch and parse one feed within its host's limits; returns (parsed feed, queued, download, parse seconds)"""
+        with self.politeness.slot(feed['url']) as waited:
+            download_started = time.perf_counter()
+            result = self.fetcher.fetch(feed['url'],
+                                        timeout=(self.config.fetch_connect_timeout, self.config.fetch_read_timeout),
+                                        max_bytes=self.config.fetch_max_bytes, cancel_event=cancel_event)
+            download_seconds = time.perf_counter() - download_started
+        # Not labelled by source: bucket series for thousands of feeds would swamp the snapshot file
+        metrics.histogram('feed_download_seconds', "Feed download time").observe(download_seconds)
+        
+        # A throttled host is left alone until the time it asked for
+        if result.status in THROTTLE_STATUSES:
+            retry_at = self.politeness.defer(feed['url'], result.headers.get('retry-after'))
+            raise HostDeferred(host_of(feed['url']), retry_at)
+        if result.status >= 400:
+            raise FeedFetchError(f"HTTP {result.status}")
+        
+        # The headers let feedparser pick the declared encoding and resolve relative links
+        headers = dict(result.headers)
+        headers.setdefault('content-location', result.url)
+        parse_started = time.perf_counter()
+        parsed_feed = feedparser.parse(result.content, response_headers=headers)
+        parse_seconds = time.perf_counter() - parse_started
+        metrics.histogram('feed_parse_seconds', "Feed parse time").observe(parse_seconds)
+        if parsed_feed.get('bozo') and not parsed_feed.entries:
+            raise FeedFetchError(str(parsed_feed.get('bozo_exception') or "unparseable feed"))
+        return parsed_feed, waited, download_seconds, parse_seconds
+    
+    def _report_host_waits(self, host_waits):
+        """Log the hosts whose requests queued longest this cycle, for tuning the per-host limits"""
+        queued = sorted(((sum(waits), host, waits) for host, waits in host_waits.items() if sum(waits) >= 0.1),
+                        reverse=True)
+        if queued:
+            print("[DEBUG] Host queue wait: " + ", ".join(
+                f"{host} avg {total / len(waits):.2f}s max {max(waits):.2f}s ({len(waits)} requests)"
+                for total, host, waits in queued[:5]))
+    
+    def _prune_articles(self, articles):
+        """Return articles with old entries dropped to bound memory use"""
         current_time = time.time()
-        orig_count = len(self.articles)
         
         # Time-based cleanup - keep articles less than 2 days old
         max_age_seconds = 2 * 24 * 60 * 60  # 2 days in seconds
-        self.articles = [article for article in self.articles 
-                        if (current_time - article['pub_date']) < max_age_seconds]
+        articles = tuple(article for article in articles
+                         if (current_time - article['pub_date']) < max_age_seconds)
         
         # Maximum count limit - keep at most 1000 articles
         max_articles = 1000
-        if len(self.articles) > max_articles:
+        if len(articles) > max_articles:
             # Keep only the newest max_articles (since they're already sorted newest first)
-            self.articles = self.articles[:max_articles]
+            articles = articles[:max_articles]
         
-        # Return true if any articles were removed
-        return len(self.articles) < orig_count
+        return articles
+    
+    def cleanup_old_articles(self):
+        """Remove old articles to prevent memory issues during long-term use"""
+        with self._publish_lock:
+            orig_count = len(self._snapshot.articles)
+            articles = self._prune_articles(self._snapshot.articles)
+            
+            # Return true if any articles were removed
+            if len(articles) < orig_count:
+                self._publish(articles)
+                return True
+            return False
     
     def apply_filter(self, feed_filter):
         """Filter articles based on the selected feed"""
-        self.current_filter = feed_filter
-        
-        if feed_filter == "ALL":
-            self.filtered_articles = self.articles.copy()
-        else:
-            self.filtered_articles = [a for a in self.articles if a['source'] == feed_filter]
-        
-        return self.filtered_articles
+        with self._publish_lock:
+            if feed_filter != self._snapshot.current_filter:
+                self._publish(current_filter=feed_filter)
+            return self._snapshot.filtered_articles
     
     def reset_new_article_flags(self):
-        """Reset the is_new flag on all articles"""
-        for article in self.articles:
-            if article.get('is_new', False):
-                article['is_new'] = False
\ No newline at end of file
+        """Reset the is_new flag on all articles, returning the new snapshot if any changed"""
+        with self._publish_lock:
+            articles = self._snapshot.articles
+            if not any(article['is_new'] for article in articles):
+                return None
+            
+            # Copy-on-write: replace flagged articles instead of mutating them
+            articles = tuple(MappingProxyType(dict(article, is_new=False)) if article['is_new'] else article
+                             for article in articles)
+            return self._publish(articles)
@@ -0,0 +1,86 @@
+"""
+HTTP fetching for RSS Terminal's feeds.
+Downloads a feed with separate connect and read timeouts, streams the body
+in chunks so oversized responses are abandoned early, and checks a cancel
+event between chunks so a fetch cycle can stop its stragglers.
+"""
+import threading
+import time
+from collections import namedtuple
+import requests
+
+USER_AGENT = "Mozilla/5.0 (compatible; RSSTerminal/1.0)"
+ACCEPT = "application/rss+xml, application/atom+xml, application/xml;q=0.9, text/xml;q=0.9, */*;q=0.1"
+CHUNK_SIZE = 64 * 1024
+
+# Body and response metadata handed to the parser; header names are lower-case
+FetchResult = namedtuple('FetchResult', ['url', 'status', 'headers', 'content'])
+
+class FetchCancelled(Exception):
+    """The fetch was abandoned because its cycle was cancelled or ran out of time"""
+
+class ResponseTooLarge(Exception):
+    """The response body exceeded the size limit"""
+
+class FeedFetcher:
+    """Streams feed downloads with timeouts, a size cap and cancellation; safe to share between threads"""
+    
+    def __init__(self, traffic=None):
+        self.traffic = traffic  # Optional TrafficLog that records or replays responses
+        # requests sessions are not thread-safe, so each worker keeps its own (and its connections)
+        self._local = threading.local()
+        self._sessions = []
+        self._sessions_lock = threading.Lock()
+    
+    def _session(self):
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = self._local.session = requests.Session()
+            session.headers.update({'User-Agent': USER_AGENT, 'Accept': ACCEPT})
+            with self._sessions_lock:
+                self._sessions.append(session)
+        return session
+    
+    def fetch(self, url, timeout=(5, 15), max_bytes=None, cancel_event=None):
+        """Download a URL; timeout is (connect, read) seconds, max_bytes caps the body (None = no cap)"""
+        if cancel_event is not None and cancel_event.is_set():
+            raise FetchCancelled(url)
+        
+        if self.traffic is not None and self.traffic.replaying:
+            recorded = self.traffic.replay('feeds', url)
+            if max_bytes and len(recorded.body) > max_bytes:
+                raise ResponseTooLarge(f"{url}: over the {max_bytes:,} byte limit")
+            headers = {key.lower(): value for key, value in recorded.headers.items()}
+            return FetchResult(url, recorded.status, headers, recorded.body)
+        
+        started = time.monotonic()
+        with self._session().get(url, stream=True, timeout=timeout) as response:
+            # Reject up front when the server announces an oversized body
+            declared = response.headers.get('Content-Length')
+            if max_bytes and declared and declared.isdigit() and int(declared) > max_bytes:
+                raise ResponseTooLarge(f"{url}: {int(declared):,} bytes declared, limit {max_bytes:,}")
+            
+            chunks = []
+            received = 0
+            for chunk in response.iter_content(CHUNK_SIZE):
+                if cancel_event is not None and cancel_event.is_set():
+                    raise FetchCancelled(url)
+                received += len(chunk)
+                if max_bytes and received > max_bytes:
+                    raise ResponseTooLarge(f"{url}: over the {max_bytes:,} byte limit")
+                chunks.append(chunk)
+            
+            headers = {key.lower(): value for key, value in response.headers.items()}
+            result = FetchResult(response.url, response.status_code, headers, b"".join(chunks))
+        
+        if self.traffic is not None and self.traffic.recording:
+            self.traffic.record('feeds', url, result.status, result.headers, result.content,
+                                time.monotonic() - started)
+        return result
+    
+    def close(self):
+        """Close every worker's session"""
+        with self._sessions_lock:
+            for session in self._sessions:
+                session.close()
+            self._sessions = []
@@ -0,0 +1,115 @@
+"""
+Column layout for the RSS Terminal article list.
+Headlines are measured once and the source/time column is right-aligned
+with a Tk tab stop, so resizing only needs to move the tab stop.
+"""
+import unicodedata
+
+# Characters that take no space of their own (joiners, variation selectors)
+ZERO_WIDTH_CHARS = {'\u200b', '\u200c', '\u200d', '\ufe0e', '\ufe0f'}
+
+_cell_width_cache = {}
+
+def cell_width(text):
+    """Return the number of terminal cells text occupies (CJK/emoji count as two)"""
+    width = _cell_width_cache.get(text)
+    if width is not None:
+        return width
+    
+    width = 0
+    for char in text:
+        if char in ZERO_WIDTH_CHARS or unicodedata.combining(char):
+            continue
+        if unicodedata.east_asian_width(char) in ('W', 'F'):
+            width += 2
+        else:
+            width += 1
+    
+    # Keep the cache bounded during long sessions
+    if len(_cell_width_cache) > 10000:
+        _cell_width_cache.clear()
+    _cell_width_cache[text] = width
+    return width
+
+def truncate_to_cells(text, max_cells, ellipsis="..."):
+    """Truncate text so it occupies at most max_cells display cells"""
+    if cell_width(text) <= max_cells:
+        return text
+    
+    cells = 0
+    for i, char in enumerate(text):
+        cells += cell_width(char)
+        if cells > max_cells:
+            return text[:i] + ellipsis
+    return text
+
+class ColumnLayout:
+    """Lays out article rows using cached font measurements"""
+    
+    def __init__(self, measure, max_headline_cells=80, min_gap_chars=5, right_margin_chars=2):
+        self._measure = measure  # Callable returning the pixel width of a string
+        self.max_headline_cells = max_headline_cells
+        self.width = 0
+        
+        self._measure_cache = {}
+        self._fit_cache = {}
+        
+        self.char_width = max(1, self.measure("0"))
+        self.min_gap = self.char_width * min_gap_chars
+        self.right_margin = self.char_width * right_margin_chars
+    
+    def measure(self, text):
+        """Return the pixel width of text, cached per string"""
+        width = self._measure_cache.get(text)
+        if width is None:
+            if len(self._measure_cache) > 10000:
+                self._measure_cache.clear()
+            width = self._measure(text)
+            self._measure_cache[text] = width
+        return width
+    
+    def set_width(self, width):
+        """Update the viewport width in pixels, returning True if the layout changed"""
+        if width == self.width:
+            return False
+        
+        self.width = width
+        self._fit_cache.clear()  # Fits depend on the width
+        return True
+    
+    def tab_stop(self):
+        """Pixel position of the right-aligned tab stop for the source/time column"""
+        return max(self.char_width, self.width - self.right_margin)
+    
+    def fit_headline(self, num_text, title, meta_text):
+        """Return the headline text truncated to fit between the number and source/time columns"""
+        available = None
+        if self.width > 1:
+            available = self.tab_stop() - self.measure(num_text) - self.measure(meta_text) - self.min_gap
+        
+        key = (title, available)
+        headline = self._fit_cache.get(key)
+        if headline is not None:
+            return headline
+        
+        # Same cap as the plain-text display, but counted in display cells
+        headline = truncate_to_cells(title, self.max_headline_cells)
+        
+        if available is not None and self.measure(headline) > available:
+            headline = self._truncate_to_pixels(title, available)
+        
+        if len(self._fit_cache) > 5000:
+            self._fit_cache.clear()
+        self._fit_cache[key] = headline
+        return headline
+    
+    def _truncate_to_pixels(self, text, available, ellipsis="..."):
+        """Binary search the longest prefix that fits in the available pixels"""
+        low, high = 0, len(text)
+        while low < high:
+            mid = (low + high + 1) // 2
+            if self._measure(text[:mid] + ellipsis) <= available:
+                low = mid
+            else:
+                high = mid - 1
+        return text[:low] + ellipsis if low else ""
@@ -0,0 +1,165 @@
+"""
+US equity market calendar for RSS Terminal.
+Computes NYSE trading sessions, holidays and early closes in America/New_York.
+"""
+import datetime
+from functools import lru_cache
+import pytz
+
+EASTERN = pytz.timezone("America/New_York")
+
+# Session boundaries (Eastern Time)
+PRE_MARKET_OPEN = datetime.time(4, 0)
+REGULAR_OPEN = datetime.time(9, 30)
+REGULAR_CLOSE = datetime.time(16, 0)
+EARLY_CLOSE = datetime.time(13, 0)
+POST_MARKET_CLOSE = datetime.time(20, 0)
+EARLY_POST_MARKET_CLOSE = datetime.time(17, 0)
+
+def _observed(day):
+    """Move a holiday falling on a weekend to the weekday it is observed on"""
+    if day.weekday() == 5:  # Saturday -> Friday
+        return day - datetime.timedelta(days=1)
+    if day.weekday() == 6:  # Sunday -> Monday
+        return day + datetime.timedelta(days=1)
+    return day
+
+def _nth_weekday(year, month, weekday, n):
+    """Return the nth weekday of a month (n=-1 for the last one)"""
+    if n > 0:
+        first = datetime.date(year, month, 1)
+        offset = (weekday - first.weekday()) % 7
+        return first + datetime.timedelta(days=offset + 7 * (n - 1))
+    
+    # Last occurrence: step back from the first day of the next month
+    next_month = datetime.date(year + month // 12, month % 12 + 1, 1)
+    last = next_month - datetime.timedelta(days=1)
+    return last - datetime.timedelta(days=(last.weekday() - weekday) % 7)
+
+def _easter(year):
+    """Western Easter Sunday (anonymous Gregorian algorithm)"""
+    a = year % 19
+    b, c = divmod(year, 100)
+    d, e = divmod(b, 4)
+    f = (b + 8) // 25
+    g = (b - f + 1) // 3
+    h = (19 * a + b - d - g + 15) % 30
+    i, k = divmod(c, 4)
+    l = (32 + 2 * e + 2 * i - h - k) % 7
+    m = (a + 11 * h + 22 * l) // 451
+    month, day = divmod(h + l - 7 * m + 114, 31)
+    return datetime.date(year, month, day + 1)
+
+@lru_cache(maxsize=16)
+def market_holidays(year):
+    """Return the set of full-day NYSE holidays in a year"""
+    holidays = set()
+    
+    # New Year's Day; not moved back to Friday when it falls on a Saturday
+    new_year = datetime.date(year, 1, 1)
+    if new_year.weekday() != 5:
+        holidays.add(_observed(new_year))
+    
+    holidays.add(_nth_weekday(year, 1, 0, 3))  # Martin Luther King Jr. Day
+    holidays.add(_nth_weekday(year, 2, 0, 3))  # Washington's Birthday
+    holidays.add(_easter(year) - datetime.timedelta(days=2))  # Good Friday
+    holidays.add(_nth_weekday(year, 5, 0, -1))  # Memorial Day
+    if year >= 2022:
+        holidays.add(_observed(datetime.date(year, 6, 19)))  # Juneteenth
+    holidays.add(_observed(datetime.date(year, 7, 4)))  # Independence Day
+    holidays.add(_nth_weekday(year, 9, 0, 1))  # Labor Day
+    holidays.add(_nth_weekday(year, 11, 3, 4))  # Thanksgiving
+    holidays.add(_observed(datetime.date(year, 12, 25)))  # Christmas
+    
+    return frozenset(holidays)
+
+@lru_cache(maxsize=16)
+def early_closes(year):
+    """Return the set of days the NYSE closes at 1:00 PM"""
+    holidays = market_holidays(year)
+    candidates = [
+        datetime.date(year, 7, 3),  # Day before Independence Day
+        _nth_weekday(year, 11, 3, 4) + datetime.timedelta(days=1),  # Day after Thanksgiving
+        datetime.date(year, 12, 24),  # Christmas Eve
+    ]
+    return frozenset(day for day in candidates if day.weekday() < 5 and day not in holidays)
+
+class MarketCalendar:
+    """Answers which trading session is active at a given time"""
+    
+    def is_trading_day(self, day):
+        """True if the exchange trades on this date"""
+        return day.weekday() < 5 and day not in market_holidays(day.year)
+    
+    def session_times(self, day):
+        """Return (pre_open, open, close, post_close) timestamps for a trading day, or None"""
+        if not self.is_trading_day(day):
+            return None
+        
+        early = day in early_closes(day.year)
+        times = (
+            PRE_MARKET_OPEN,
+            REGULAR_OPEN,
+            EARLY_CLOSE if early else REGULAR_CLOSE,
+            EARLY_POST_MARKET_CLOSE if early else POST_MARKET_CLOSE,
+        )
+        return tuple(EASTERN.localize(datetime.datetime.combine(day, t)).timestamp() for t in times)
+    
+    def session_info(self, now=None):
+        """Return (state, started_at, ends_at) where state is PRE, REGULAR, POST or CLOSED"""
+        if now is None:
+            now = datetime.datetime.now(EASTERN).timestamp()
+        today = datetime.datetime.fromtimestamp(now, EASTERN).date()
+        
+        times = self.session_times(today)
+        if times:
+            pre_open, regular_open, regular_close, post_close = times
+            if pre_open <= now < regular_open:
+                return 'PRE', pre_open, regular_open
+            if regular_open <= now < regular_close:
+                return 'REGULAR', regular_open, regular_close
+            if regular_close <= now < post_close:
+                return 'POST', regular_close, post_close
+        
+        # Closed: the next boundary is the next pre-market open
+        return 'CLOSED', None, self.next_session_start(now)
+    
+    def session(self, now=None):
+        """Return the current session state"""
+        return self.session_info(now)[0]
+    
+    def next_session_start(self, now):
+        """Timestamp of the next pre-market open after now"""
+        day = datetime.datetime.fromtimestamp(now, EASTERN).date()
+        for _ in range(14):
+            times = self.session_times(day)
+            if times and times[0] > now:
+                return times[0]
+            day += datetime.timedelta(days=1)
+        return now + 24 * 60 * 60  # Unreachable in practice; re-check tomorrow
+    
+    def previous_trading_day(self, day):
+        """The trading day before a date"""
+        for _ in range(14):
+            day -= datetime.timedelta(days=1)
+            if self.is_trading_day(day):
+                return day
+        return day
+    
+    def current_session_day(self, now):
+        """Date of the latest trading day whose regular session has opened"""
+        day = datetime.datetime.fromtimestamp(now, EASTERN).date()
+        times = self.session_times(day)
+        if times and times[1] <= now:
+            return day
+        return self.previous_trading_day(day)
+    
+    def last_close(self, now):
+        """Timestamp of the most recent regular-session close at or before now"""
+        day = datetime.datetime.fromtimestamp(now, EASTERN).date()
+        for _ in range(14):
+            times = self.session_times(day)
+            if times and times[2] <= now:
+                return times[2]
+            day -= datetime.timedelta(days=1)
+        return None
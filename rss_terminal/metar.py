@@ -0,0 +1,175 @@
+"""
+METAR decoder for RSS Terminal.
+Decodes raw METAR/SPECI observation strings locally with a table of
+compiled token patterns, so weather can be fetched from the compact raw
+text endpoint instead of the pre-parsed JSON API.
+"""
+import re
+
+# Header: optional report type, station, observation time (DDHHMMZ)
+HEADER_RE = re.compile(r"^(?:(?P<type>METAR|SPECI)\s+)?(?P<station>[A-Z][A-Z0-9]{3})\s+"
+                       r"(?P<day>\d{2})(?P<hour>\d{2})(?P<minute>\d{2})Z\b")
+
+INTENSITIES = "[-+]|VC"
+DESCRIPTORS = "MI|PR|BC|DR|BL|SH|TS|FZ"
+PHENOMENA = "DZ|RA|SN|SG|IC|PL|GR|GS|UP|BR|FG|FU|VA|DU|SA|HZ|PY|PO|SQ|FC|SS|DS"
+
+# Body token patterns, tried in order; every group name is unique across the table
+TOKEN_PATTERNS = [
+    ('modifier', r"AUTO|COR|NIL"),
+    ('wind', r"(?P<wind_dir>\d{3}|VRB)(?P<wind_speed>\d{2,3})(?:G(?P<wind_gust>\d{2,3}))?(?P<wind_unit>KT|MPS|KMH)"),
+    ('wind_variation', r"(?P<var_from>\d{3})V(?P<var_to>\d{3})"),
+    ('cavok', r"CAVOK"),
+    ('visibility_sm', r"(?:(?P<vis_whole>\d{1,2}) )?(?P<vis_qualifier>[MP])?(?P<vis_num>\d{1,2})(?:/(?P<vis_den>\d{1,2}))?SM"),
+    ('runway_range', r"R\d{2}[LRC]?/[PM]?\d{4}(?:V[PM]?\d{4})?(?:FT)?[UDN]?"),
+    ('visibility_m', r"(?P<vis_meters>\d{4})(?:NDV)?"),
+    ('weather', rf"(?P<wx_intensity>{INTENSITIES})?(?P<wx_descriptor>{DESCRIPTORS})?(?P<wx_phenomena>(?:{PHENOMENA})*)"),
+    ('sky_clear', r"SKC|CLR|NSC|NCD"),
+    ('sky', r"(?P<sky_cover>FEW|SCT|BKN|OVC|VV)(?P<sky_height>\d{3}|///)(?P<sky_type>CB|TCU|///)?"),
+    ('temperature', r"(?P<temp>M?\d{2})/(?P<dewpoint>M?\d{2})?"),
+    ('altimeter', r"(?P<alt_unit>[AQ])(?P<alt_value>\d{4})"),
+    ('remarks', r"RMK"),
+    ('trend', r"NOSIG|BECMG|TEMPO"),
+]
+
+# One compiled alternation; a token must end at whitespace or the end of the report
+TOKEN_RE = re.compile("(?:" + "|".join(f"(?P<{name}>{pattern})" for name, pattern in TOKEN_PATTERNS) + r")(?=\s|$)")
+WHITESPACE_RE = re.compile(r"\s+")
+PHENOMENA_RE = re.compile(PHENOMENA)
+
+METERS_PER_MILE = 1609.344
+
+def _signed_celsius(text):
+    """Temperature group value; a leading M means minus"""
+    return -int(text[1:]) if text.startswith("M") else int(text)
+
+def _parse_weather(match):
+    """Decode a present weather group, or None if it carries no weather"""
+    descriptor = match.group('wx_descriptor')
+    phenomena = PHENOMENA_RE.findall(match.group('wx_phenomena') or "")
+    if not descriptor and not phenomena:
+        return None
+    return {
+        'raw': match.group('weather'),
+        'intensity': match.group('wx_intensity') or "",
+        'descriptor': descriptor or "",
+        'phenomena': phenomena,
+    }
+
+def decode_metar(raw):
+    """Decode a raw METAR string into a dict, or None if it has no valid header"""
+    raw = " ".join(raw.split())
+    header = HEADER_RE.match(raw)
+    if not header:
+        return None
+    
+    report = {
+        'raw': raw,
+        'type': header.group('type') or "METAR",
+        'station': header.group('station'),
+        'day': int(header.group('day')),
+        'hour': int(header.group('hour')),
+        'minute': int(header.group('minute')),
+        'modifier': None,
+        'wind': None,
+        'visibility': None,  # Statute miles
+        'visibility_qualifier': "",  # M = less than, P = more than
+        'weather': [],
+        'clouds': [],
+        'temperature': None,  # Celsius
+        'dewpoint': None,
+        'altimeter': None,  # Inches of mercury
+        'unparsed': [],
+    }
+    
+    pos = header.end()
+    end = len(raw)
+    while pos < end:
+        space = WHITESPACE_RE.match(raw, pos)
+        if space:
+            pos = space.end()
+            continue
+        
+        match = TOKEN_RE.match(raw, pos)
+        if not match or match.end() == pos:
+            # Unknown token: note it and move on to the next one
+            next_space = raw.find(" ", pos)
+            next_space = end if next_space < 0 else next_space
+            report['unparsed'].append(raw[pos:next_space])
+            pos = next_space
+            continue
+        
+        kind = match.lastgroup
+        pos = match.end()
+        
+        if kind == 'remarks' or kind == 'trend':
+            break  # Remarks and forecast trends are not part of the observation
+        elif kind == 'modifier':
+            report['modifier'] = match.group('modifier')
+        elif kind == 'wind':
+            direction = match.group('wind_dir')
+            gust = match.group('wind_gust')
+            report['wind'] = {
+                'direction': None if direction == "VRB" else int(direction),
+                'speed': int(match.group('wind_speed')),
+                'gust': int(gust) if gust else None,
+                'unit': match.group('wind_unit'),
+                'variable_from': None,
+                'variable_to': None,
+            }
+        elif kind == 'wind_variation':
+            if report['wind']:
+                report['wind']['variable_from'] = int(match.group('var_from'))
+                report['wind']['variable_to'] = int(match.group('var_to'))
+        elif kind == 'cavok':
+            report['visibility'] = 10000 / METERS_PER_MILE
+            report['visibility_qualifier'] = "P"
+        elif kind == 'visibility_sm':
+            miles = int(match.group('vis_num'))
+            if match.group('vis_den'):
+                miles /= int(match.group('vis_den'))
+            if match.group('vis_whole'):
+                miles += int(match.group('vis_whole'))
+            report['visibility'] = float(miles)
+            report['visibility_qualifier'] = match.group('vis_qualifier') or ""
+        elif kind == 'visibility_m':
+            meters = int(match.group('vis_meters'))
+            report['visibility'] = meters / METERS_PER_MILE
+            report['visibility_qualifier'] = "P" if meters == 9999 else ""
+        elif kind == 'weather':
+            weather = _parse_weather(match)
+            if weather:
+                report['weather'].append(weather)
+            else:
+                report['unparsed'].append(match.group(0))
+        elif kind == 'sky_clear':
+            report['clouds'].append({'cover': match.group('sky_clear'), 'height_ft': None, 'type': None})
+        elif kind == 'sky':
+            height = match.group('sky_height')
+            cloud_type = match.group('sky_type')
+            report['clouds'].append({
+                'cover': match.group('sky_cover'),
+                'height_ft': int(height) * 100 if height.isdigit() else None,
+                'type': cloud_type if cloud_type and cloud_type != "///" else None,
+            })
+        elif kind == 'temperature':
+            report['temperature'] = _signed_celsius(match.group('temp'))
+            dewpoint = match.group('dewpoint')
+            report['dewpoint'] = _signed_celsius(dewpoint) if dewpoint else None
+        elif kind == 'altimeter':
+            value = int(match.group('alt_value'))
+            # A = hundredths of inHg, Q = hectopascals
+            report['altimeter'] = value / 100 if match.group('alt_unit') == "A" else round(value * 0.02953, 2)
+    
+    return report
+
+def parse_weather_groups(wx_string):
+    """Decode a space-separated present weather string such as '-SHRA BR'"""
+    groups = []
+    for token in (wx_string or "").split():
+        match = TOKEN_RE.fullmatch(token)
+        if match and match.lastgroup == 'weather':
+            weather = _parse_weather(match)
+            if weather:
+                groups.append(weather)
+    return groups
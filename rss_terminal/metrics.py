@@ -0,0 +1,284 @@
+"""
+Instrumentation for RSS Terminal.
+Counters, gauges and timing histograms kept in memory, cheap enough to sit
+on the fetch and render paths. The exporter writes them to a size-rotated
+local file and can serve them as Prometheus text on localhost.
+"""
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Upper bounds in seconds, from a quick row render to a slow feed download
+DEFAULT_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5,
+                   1.0, 2.5, 5.0, 10.0, 30.0)
+
+COUNTER = "counter"
+GAUGE = "gauge"
+HISTOGRAM = "histogram"
+
+def _label_text(labels):
+    """Prometheus label set for a sorted tuple of (name, value) pairs"""
+    if not labels:
+        return ""
+    escaped = (str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") for _, value in labels)
+    return "{" + ",".join(f'{name}="{value}"' for (name, _), value in zip(labels, escaped)) + "}"
+
+class Counter:
+    """A value that only goes up"""
+    
+    def __init__(self, lock):
+        self._lock = lock
+        self.value = 0
+    
+    def inc(self, amount=1):
+        with self._lock:
+            self.value += amount
+
+class Gauge:
+    """A value that is set to the latest reading"""
+    
+    def __init__(self, lock):
+        self._lock = lock
+        self.value = 0
+    
+    def set(self, value):
+        self.value = value
+    
+    def inc(self, amount=1):
+        with self._lock:
+            self.value += amount
+
+class Histogram:
+    """Counts observations into fixed buckets, keeping their sum and count"""
+    
+    def __init__(self, lock, buckets=DEFAULT_BUCKETS):
+        self._lock = lock
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)  # Last slot is +Inf
+        self.sum = 0.0
+        self.count = 0
+    
+    def observe(self, value):
+        index = len(self.buckets)
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                index = i
+                break
+        with self._lock:
+            self.counts[index] += 1
+            self.sum += value
+            self.count += 1
+    
+    def quantile(self, q):
+        """Estimate a quantile by interpolating within its bucket"""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        lower = 0.0
+        for bound, count in zip(self.buckets, self.counts):
+            if count and seen + count >= rank:
+                return lower + (bound - lower) * (rank - seen) / count
+            seen += count
+            lower = bound
+        return self.buckets[-1]  # Past the last bucket there is no upper bound to interpolate to
+
+class MetricsRegistry:
+    """All metrics of the process, keyed by name and labels"""
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._metrics = {}  # (name, labels) -> metric
+        self._kinds = {}  # Name -> (kind, help)
+    
+    def _get(self, kind, name, help, labels, factory):
+        key = (name, tuple(sorted(labels.items())))
+        metric = self._metrics.get(key)
+        if metric is None:
+            with self._lock:
+                known_kind, known_help = self._kinds.get(name, (kind, help))
+                if known_kind != kind:
+                    raise ValueError(f"Metric {name} is a {known_kind}, not a {kind}")
+                self._kinds[name] = (kind, known_help or help)
+                metric = self._metrics.setdefault(key, factory())
+        return metric
+    
+    def counter(self, name, help="", **labels):
+        """The counter with this name and labels, created on first use"""
+        return self._get(COUNTER, name, help, labels, lambda: Counter(self._lock))
+    
+    def gauge(self, name, help="", **labels):
+        """The gauge with this name and labels, created on first use"""
+        return self._get(GAUGE, name, help, labels, lambda: Gauge(self._lock))
+    
+    def histogram(self, name, help="", buckets=DEFAULT_BUCKETS, **labels):
+        """The histogram with this name and labels, created on first use"""
+        return self._get(HISTOGRAM, name, help, labels, lambda: Histogram(self._lock, buckets))
+    
+    @contextmanager
+    def timed(self, name, help="", **labels):
+        """Observe the seconds spent in the block in a histogram, also when it raises"""
+        histogram = self.histogram(name, help, **labels)
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            histogram.observe(time.perf_counter() - started)
+    
+    def remove(self, name, **labels):
+        """Drop every series of name whose labels include the given ones, e.g. for a feed that went away"""
+        wanted = set(labels.items())
+        with self._lock:
+            for key in [key for key in self._metrics if key[0] == name and wanted <= set(key[1])]:
+                del self._metrics[key]
+    
+    def find(self, name):
+        """(labels dict, metric) for every label set recorded under name"""
+        metrics, _ = self._sorted_metrics()
+        return [(dict(labels), metric) for (metric_name, labels), metric in metrics if metric_name == name]
+    
+    def _sorted_metrics(self):
+        with self._lock:
+            return sorted(self._metrics.items()), dict(self._kinds)
+    
+    def prometheus_text(self):
+        """All metrics in the Prometheus text exposition format"""
+        metrics, kinds = self._sorted_metrics()
+        lines = []
+        current = None
+        for (name, labels), metric in metrics:
+            kind, help = kinds[name]
+            if name != current:
+                current = name
+                if help:
+                    lines.append(f"# HELP {name} {help}")
+                lines.append(f"# TYPE {name} {kind}")
+            
+            if kind != HISTOGRAM:
+                lines.append(f"{name}{_label_text(labels)} {metric.value}")
+                continue
+            
+            cumulative = 0
+            for bound, count in zip(metric.buckets + (float("inf"),), metric.counts):
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                lines.append(f"{name}_bucket{_label_text(labels + (('le', le),))} {cumulative}")
+            lines.append(f"{name}_sum{_label_text(labels)} {metric.sum}")
+            lines.append(f"{name}_count{_label_text(labels)} {metric.count}")
+        return "\n".join(lines) + "\n"
+    
+    def snapshot(self):
+        """All metrics as a JSON-friendly dict; histograms are summarised as count, sum and percentiles"""
+        metrics, kinds = self._sorted_metrics()
+        values = {}
+        for (name, labels), metric in metrics:
+            if kinds[name][0] == HISTOGRAM:
+                value = {'count': metric.count, 'sum': round(metric.sum, 6),
+                         'p50': round(metric.quantile(0.5), 6), 'p90': round(metric.quantile(0.9), 6),
+                         'p99': round(metric.quantile(0.99), 6)}
+            else:
+                value = metric.value
+            values[name + _label_text(labels)] = value
+        return values
+
+# The process-wide registry the app's modules record into
+registry = MetricsRegistry()
+counter = registry.counter
+gauge = registry.gauge
+histogram = registry.histogram
+timed = registry.timed
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    """Serves the registry at /metrics"""
+    
+    def do_GET(self):
+        if self.path.split("?")[0] != "/metrics":
+            self.send_error(404)
+            return
+        body = self.server.registry.prometheus_text().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def log_message(self, format, *args):
+        pass  # Scrapes would otherwise print a line every few seconds
+
+class MetricsExporter:
+    """Appends periodic snapshots to a size-rotated file and optionally serves /metrics on localhost"""
+    
+    def __init__(self, registry, path, interval=60, max_bytes=1024 * 1024, backups=3, port=0):
+        self.registry = registry
+        self.path = path
+        self.interval = max(1, interval)
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self.port = port  # 0 = no HTTP endpoint
+        self._stop_event = threading.Event()
+        self._thread = None
+        self._server = None
+    
+    def start(self):
+        """Start the snapshot writer and, if a port is set, the HTTP endpoint"""
+        self._thread = threading.Thread(target=self._write_loop, daemon=True)
+        self._thread.start()
+        
+        if self.port:
+            try:
+                # Bound to the loopback interface only; the metrics are not meant for the network
+                self._server = ThreadingHTTPServer(("127.0.0.1", self.port), _MetricsHandler)
+            except OSError as e:
+                print(f"Metrics endpoint unavailable on port {self.port}: {e}")
+                return
+            self._server.daemon_threads = True
+            self._server.registry = self.registry
+            threading.Thread(target=self._server.serve_forever, daemon=True).start()
+            print(f"[DEBUG] Serving metrics on http://127.0.0.1:{self.port}/metrics")
+    
+    def stop(self):
+        """Stop exporting, writing a final snapshot"""
+        self._stop_event.set()
+        if self._thread:
+            self._thread.join(timeout=1)
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+        self.write_snapshot()
+    
+    def _write_loop(self):
+        while not self._stop_event.wait(self.interval):
+            self.write_snapshot()
+    
+    def write_snapshot(self):
+        """Append one JSON line with every metric, rotating the file once it outgrows max_bytes"""
+        line = json.dumps({'time': time.strftime('%Y-%m-%dT%H:%M:%S'), 'metrics': self.registry.snapshot()})
+        try:
+            self._rotate_if_full()
+            with open(self.path, "a") as f:
+                f.write(line + "\n")
+        except OSError as e:
+            print(f"Error writing metrics to {self.path}: {e}")
+    
+    def _rotate_if_full(self):
+        """Shift path -> path.1 -> path.2 ..., dropping the oldest beyond the backup count"""
+        if not self.max_bytes or not os.path.exists(self.path) or os.path.getsize(self.path) < self.max_bytes:
+            return
+        if self.backups <= 0:
+            os.remove(self.path)
+            return
+        for number in range(self.backups - 1, 0, -1):
+            older = f"{self.path}.{number}"
+            if os.path.exists(older):
+                os.replace(older, f"{self.path}.{number + 1}")
+        os.replace(self.path, f"{self.path}.1")
+
+def create_metrics_exporter(config):
+    """Build the exporter selected in the [Metrics] config section, or None when it is disabled"""
+    if not config.metrics_enabled:
+        return None
+    return MetricsExporter(registry, config.metrics_file, config.metrics_interval, config.metrics_max_bytes,
+                           config.metrics_backups, config.metrics_port)
@@ -0,0 +1,112 @@
+"""
+Top movers for RSS Terminal.
+Stores the latest quotes in columnar NumPy arrays so gainers, losers and
+unusual moves across large watchlists are ranked with vectorized operations.
+The columns are allocated, and NumPy imported, on the first update.
+"""
+
+np = None  # numpy, bound when the first columns are allocated
+
+class MoversTable:
+    """Columnar quote store with vectorized rankings"""
+    
+    def __init__(self, capacity=64):
+        self.symbols = []  # Row -> symbol
+        self._rows = {}  # Symbol -> row
+        self.size = 0
+        self.initial_capacity = capacity
+        self.price = None  # Columns are allocated on the first update
+        self.pct_change = None
+    
+    def _ensure_capacity(self, needed):
+        """Grow the columns geometrically so appends stay amortized O(1)"""
+        if self.price is None:
+            # Imported on first use: numpy takes a few hundred ms to load
+            global np
+            import numpy as np
+            self.price = np.full(self.initial_capacity, np.nan)
+            self.pct_change = np.full(self.initial_capacity, np.nan)
+        capacity = len(self.price)
+        if needed <= capacity:
+            return
+        
+        while capacity < needed:
+            capacity *= 2
+        for name in ('price', 'pct_change'):
+            column = np.full(capacity, np.nan)
+            column[:self.size] = getattr(self, name)[:self.size]
+            setattr(self, name, column)
+    
+    def update(self, quotes):
+        """Write the latest quotes (symbol -> quote dict) into their rows"""
+        if not quotes:
+            return
+        
+        new_symbols = [symbol for symbol in quotes if symbol not in self._rows]
+        if new_symbols:
+            self._ensure_capacity(self.size + len(new_symbols))
+            for symbol in new_symbols:
+                self._rows[symbol] = self.size
+                self.symbols.append(symbol)
+                self.size += 1
+        
+        rows = np.fromiter((self._rows[symbol] for symbol in quotes), dtype=np.intp, count=len(quotes))
+        self.price[rows] = np.fromiter((quote['current_price'] for quote in quotes.values()),
+                                       dtype=np.float64, count=len(quotes))
+        self.pct_change[rows] = np.fromiter((quote['percent_change'] for quote in quotes.values()),
+                                            dtype=np.float64, count=len(quotes))
+    
+    def retain(self, symbols):
+        """Drop rows for symbols that are no longer watched"""
+        watched = set(symbols)
+        keep = [symbol for symbol in self.symbols if symbol in watched]
+        if len(keep) == self.size:
+            return
+        
+        rows = np.array([self._rows[symbol] for symbol in keep], dtype=np.intp)
+        price = self.price[rows]
+        pct_change = self.pct_change[rows]
+        
+        self.symbols = keep
+        self._rows = {symbol: row for row, symbol in enumerate(keep)}
+        self.size = len(keep)
+        self.price[:self.size] = price
+        self.pct_change[:self.size] = pct_change
+        self.price[self.size:] = np.nan
+        self.pct_change[self.size:] = np.nan
+    
+    def _rows_to_entries(self, rows):
+        """Convert row indexes to (symbol, price, percent change) tuples"""
+        return [(self.symbols[row], float(self.price[row]), float(self.pct_change[row])) for row in rows]
+    
+    def rank(self, count=10, unusual_threshold=2.0):
+        """Return the top gainers, top losers and unusual moves (by cross-sectional z-score)"""
+        if not self.size:
+            return {'gainers': [], 'losers': [], 'unusual': []}
+        
+        pct = self.pct_change[:self.size]
+        valid = np.flatnonzero(~np.isnan(pct))
+        values = pct[valid]
+        count = min(count, len(values))
+        if count == 0:
+            return {'gainers': [], 'losers': [], 'unusual': []}
+        
+        # argpartition finds the top/bottom k in O(n); only those k get sorted
+        top = np.argpartition(-values, count - 1)[:count]
+        top = top[np.argsort(-values[top])]
+        bottom = np.argpartition(values, count - 1)[:count]
+        bottom = bottom[np.argsort(values[bottom])]
+        
+        # Moves far from the rest of the watchlist, largest first
+        unusual = np.array([], dtype=np.intp)
+        std = values.std()
+        if len(values) > 2 and std > 0:
+            z_scores = np.abs(values - values.mean()) / std
+            unusual = np.flatnonzero(z_scores >= unusual_threshold)
+            unusual = unusual[np.argsort(-z_scores[unusual])][:count]
+        
+        return {
+            'gainers': self._rows_to_entries(valid[top]),
+            'losers': self._rows_to_entries(valid[bottom]),
+            'unusual': self._rows_to_entries(valid[unusual]),
+        }
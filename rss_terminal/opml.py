@@ -0,0 +1,63 @@
+"""
+OPML import for RSS Terminal.
+Reads a feed reader's OPML export into the feed registry: every outline
+with an xmlUrl becomes a feed, named with a short upper-case source code,
+and the enclosing folder outline becomes its group.
+"""
+import re
+import xml.etree.ElementTree as ET
+
+MAX_CODE_LENGTH = 10  # Source codes are shown next to every headline
+DEFAULT_GROUP = "OPML"
+
+def source_code(title, max_length=MAX_CODE_LENGTH):
+    """Short upper-case source code for a feed title, e.g. 'Ars Technica' -> 'ARS_TECHNI'"""
+    code = re.sub(r"[^A-Z0-9]+", "_", title.upper()).strip("_")
+    return code[:max_length].rstrip("_") or "FEED"
+
+def _unique_code(code, taken):
+    """Append a counter to a code that is already in use, keeping it within the length limit"""
+    if code not in taken:
+        return code
+    counter = 2
+    while True:
+        suffix = str(counter)
+        candidate = code[:MAX_CODE_LENGTH - len(suffix)] + suffix
+        if candidate not in taken:
+            return candidate
+        counter += 1
+
+def load_opml(path, taken_names=()):
+    """Read feeds from an OPML file as {'name', 'url', 'group'} dicts, skipping duplicate URLs"""
+    root = ET.parse(path).getroot()
+    body = root.find('body')
+    if body is None:
+        return []
+    
+    taken = set(taken_names)
+    seen_urls = set()
+    feeds = []
+    
+    def walk(outline, group):
+        url = (outline.get('xmlUrl') or "").strip()
+        title = outline.get('title') or outline.get('text') or url
+        if url:
+            if url not in seen_urls:
+                seen_urls.add(url)
+                name = _unique_code(source_code(title), taken)
+                taken.add(name)
+                feeds.append({'name': name, 'url': url, 'group': group})
+            return
+        
+        # An outline without a feed URL is a folder; nested folders keep the outermost name
+        for child in outline.findall('outline'):
+            walk(child, group or title.strip().upper() or None)
+    
+    for outline in body.findall('outline'):
+        walk(outline, None)
+    
+    # Feeds outside any folder still get a group so the filter menu stays short
+    for feed in feeds:
+        if feed['group'] is None:
+            feed['group'] = DEFAULT_GROUP
+    return feeds
@@ -0,0 +1,220 @@
+"""
+Main-loop performance monitor for RSS Terminal.
+A heartbeat callback measures how late the Tk event loop runs it, every
+after() callback is timed by name, and garbage collection pauses are
+recorded, so stutters can be traced to a slow callback, a blocked loop or
+GC. The UI shows the numbers in a toggleable overlay. The heartbeat only
+runs while the overlay is shown or metrics are exported, so an idle app
+is not woken ten times a second.
+"""
+import functools
+import gc
+import threading
+import time
+import tkinter as tk
+from collections import deque
+
+from rss_terminal import metrics
+
+HEARTBEAT_MS = 100  # How often the heartbeat is scheduled
+LAG_WINDOW = 600  # Heartbeats kept for the lag percentiles (one minute at 100 ms)
+
+def callback_name(func):
+    """Readable name of a scheduled callback, looking through functools.partial"""
+    while isinstance(func, functools.partial):
+        func = func.func
+    name = getattr(func, '__qualname__', None) or getattr(func, '__name__', None) or repr(func)
+    return name.replace(".<locals>", "")
+
+def _percentile(ordered, fraction):
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))] if ordered else 0.0
+
+class CallbackStats:
+    """Run count and durations of one named callback"""
+    
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+class PerfMonitor:
+    """Times the Tk main loop: heartbeat lag, after() callbacks by name, pending callbacks and GC pauses"""
+    
+    def __init__(self, root, heartbeat_ms=HEARTBEAT_MS, export_metrics=False):
+        self.root = root
+        self.heartbeat_ms = heartbeat_ms
+        self.export_metrics = export_metrics  # Record into the metrics registry, which also keeps the heartbeat on
+        self.watched = False  # True while the overlay is shown
+        self.lags = deque(maxlen=LAG_WINDOW)  # Seconds each heartbeat ran late
+        self.callbacks = {}  # Name -> CallbackStats
+        self.gc_pauses = deque(maxlen=LAG_WINDOW)
+        self.gc_count = 0
+        self._lock = threading.Lock()  # Background threads schedule callbacks too
+        self._pending = set()  # Tokens of callbacks scheduled but not yet run or cancelled
+        self._tokens = {}  # after() id -> token, to match cancellations
+        self._original_after = None
+        self._original_after_cancel = None
+        self._heartbeat_due = None
+        self._heartbeat_job = None
+        self._gc_started = None
+    
+    @property
+    def queue_depth(self):
+        """Callbacks waiting in the Tk event loop"""
+        return len(self._pending)
+    
+    def start(self):
+        """Wrap after()/after_cancel() on every widget, starting the heartbeat if metrics are exported"""
+        if self._original_after is not None:
+            return
+        self._original_after = original_after = tk.Misc.after
+        self._original_after_cancel = original_after_cancel = tk.Misc.after_cancel
+        monitor = self
+        
+        def after(widget, ms, func=None, *args):
+            if func is None:
+                return original_after(widget, ms)  # Plain sleep, nothing to time
+            return monitor._schedule(original_after, widget, ms, func, args)
+        
+        def after_cancel(widget, after_id):
+            with monitor._lock:
+                token = monitor._tokens.pop(after_id, None)
+                monitor._pending.discard(token)
+            return original_after_cancel(widget, after_id)
+        
+        tk.Misc.after = after
+        tk.Misc.after_cancel = after_cancel
+        gc.callbacks.append(self._on_gc)
+        if self.export_metrics:
+            self._schedule_heartbeat()
+    
+    def set_watched(self, watched):
+        """Run the heartbeat while the overlay is shown; with metrics exported it always runs"""
+        self.watched = watched
+        if self._original_after is None:
+            return
+        if watched and self._heartbeat_job is None:
+            self.lags.clear()  # Lag from before the pause would not describe the loop now
+            self._schedule_heartbeat()
+        elif not watched and not self.export_metrics:
+            self._cancel_heartbeat()
+    
+    def stop(self):
+        """Restore the original after()/after_cancel() and stop the heartbeat"""
+        if self._original_after is None:
+            return
+        self._cancel_heartbeat()
+        tk.Misc.after = self._original_after
+        tk.Misc.after_cancel = self._original_after_cancel
+        self._original_after = None
+        if self._on_gc in gc.callbacks:
+            gc.callbacks.remove(self._on_gc)
+    
+    def _schedule(self, original_after, widget, ms, func, args):
+        """Schedule func through the original after(), timing it when it runs"""
+        name = callback_name(func)
+        token = []  # Holds the after() id once known
+        with self._lock:
+            self._pending.add(id(token))
+        
+        def timed_callback(*callback_args):
+            with self._lock:
+                self._pending.discard(id(token))
+                if token:
+                    self._tokens.pop(token[0], None)
+            started = time.perf_counter()
+            try:
+                return func(*callback_args)
+            finally:
+                self._record_callback(name, time.perf_counter() - started)
+        
+        after_id = original_after(widget, ms, timed_callback, *args)
+        with self._lock:
+            # A callback handed over from another thread may already have run
+            if id(token) in self._pending:
+                token.append(after_id)
+                self._tokens[after_id] = id(token)
+        return after_id
+    
+    def _record_callback(self, name, seconds):
+        with self._lock:
+            stats = self.callbacks.get(name)
+            if stats is None:
+                stats = self.callbacks[name] = CallbackStats()
+            stats.count += 1
+            stats.total += seconds
+            stats.max = max(stats.max, seconds)
+        if self.export_metrics:
+            metrics.histogram('ui_callback_seconds', "Duration of main-loop callbacks").observe(seconds)
+    
+    def _cancel_heartbeat(self):
+        if self._heartbeat_job is None:
+            return
+        try:
+            self._original_after_cancel(self.root, self._heartbeat_job)
+        except tk.TclError:
+            pass  # The window is already gone
+        self._heartbeat_job = None
+    
+    def _schedule_heartbeat(self):
+        # Scheduled past the wrapper so the heartbeat does not show up among the callbacks
+        self._heartbeat_due = time.perf_counter() + self.heartbeat_ms / 1000
+        self._heartbeat_job = self._original_after(self.root, self.heartbeat_ms, self._heartbeat)
+    
+    def _heartbeat(self):
+        """Record how late this beat ran, then schedule the next one"""
+        self._heartbeat_job = None
+        lag = max(0.0, time.perf_counter() - self._heartbeat_due)
+        self.lags.append(lag)
+        if self.export_metrics:
+            metrics.histogram('ui_loop_lag_seconds', "How late the main loop ran the heartbeat").observe(lag)
+            metrics.gauge('ui_after_queue_depth', "Callbacks waiting in the main loop").set(self.queue_depth)
+        if self._original_after is not None and (self.watched or self.export_metrics):
+            self._schedule_heartbeat()
+    
+    def _on_gc(self, phase, info):
+        if phase == "start":
+            self._gc_started = time.perf_counter()
+        elif self._gc_started is not None:
+            self.gc_pauses.append(time.perf_counter() - self._gc_started)
+            self.gc_count += 1
+            self._gc_started = None
+    
+    def lag_percentiles(self):
+        """(p50, p90, p99, max) heartbeat lag in seconds over the recent window"""
+        ordered = sorted(self.lags)
+        return (_percentile(ordered, 0.5), _percentile(ordered, 0.9), _percentile(ordered, 0.99),
+                ordered[-1] if ordered else 0.0)
+    
+    def slowest_callbacks(self, count=8):
+        """(name, stats) of the callbacks with the longest single run, slowest first"""
+        with self._lock:
+            ranked = sorted(self.callbacks.items(), key=lambda item: item[1].max, reverse=True)
+        return ranked[:count]
+    
+    def report_lines(self):
+        """Overlay text: loop lag, queue depth, GC pauses, redraw times and the slowest callbacks"""
+        p50, p90, p99, worst = self.lag_percentiles()
+        lines = [f"loop lag   p50 {p50 * 1000:6.1f}  p90 {p90 * 1000:6.1f}  p99 {p99 * 1000:6.1f}  "
+                 f"max {worst * 1000:6.1f} ms",
+                 f"queue      {self.queue_depth} callbacks pending"]
+        
+        pauses = list(self.gc_pauses)
+        if pauses:
+            lines.append(f"gc         {self.gc_count} collections, max {max(pauses) * 1000:.1f} ms, "
+                         f"last {pauses[-1] * 1000:.1f} ms")
+        else:
+            lines.append("gc         no collections yet")
+        
+        lines.append("")
+        lines.append("redraw     view        p50 ms  p99 ms   count")
+        for labels, histogram in metrics.registry.find('ui_render_seconds'):
+            lines.append(f"           {labels.get('view', ''):<10} {histogram.quantile(0.5) * 1000:7.2f} "
+                         f"{histogram.quantile(0.99) * 1000:7.2f} {histogram.count:7d}")
+        
+        lines.append("")
+        lines.append("slowest callbacks                           max ms  avg ms   calls")
+        for name, stats in self.slowest_callbacks():
+            lines.append(f"  {name[-40:]:<40} {stats.max * 1000:7.1f} {stats.total / stats.count * 1000:7.2f} "
+                         f"{stats.count:7d}")
+        return lines
@@ -0,0 +1,132 @@
+"""
+Per-host politeness for RSS Terminal's feed fetching.
+Caps how many requests run against one host at a time, spaces them with a
+token bucket, honours Retry-After from throttled responses, and records
+how long requests queued for their host so the limits can be tuned.
+"""
+import threading
+import time
+import urllib.parse
+from contextlib import contextmanager
+from email.utils import parsedate_to_datetime
+
+# Deferral applied when a throttling response carries no usable Retry-After
+DEFAULT_RETRY_AFTER = 60
+
+# Statuses that mean "slow down" rather than "broken"
+THROTTLE_STATUSES = (429, 503)
+
+class HostDeferred(Exception):
+    """Raised instead of fetching from a host that asked us to retry later"""
+    
+    def __init__(self, host, retry_at):
+        super().__init__(f"{host} asked to retry after {time.strftime('%H:%M:%S', time.localtime(retry_at))}")
+        self.host = host
+        self.retry_at = retry_at
+
+def host_of(url):
+    """Lower-case host name of a URL"""
+    return (urllib.parse.urlsplit(url).hostname or "").lower()
+
+def parse_retry_after(value, now=None):
+    """Absolute time from a Retry-After header (delta seconds or HTTP date), or None if unusable"""
+    now = time.time() if now is None else now
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return now + int(value)
+    try:
+        return parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError):
+        return None
+
+class TokenBucket:
+    """Allows `rate` requests per second on average, with bursts of up to `burst`"""
+    
+    def __init__(self, rate, burst):
+        self.rate = rate
+        self.burst = max(1.0, burst)
+        self.tokens = self.burst
+        self.updated = time.monotonic()
+    
+    def reserve(self, now):
+        """Take a token, returning how many seconds to wait before using it"""
+        if self.rate <= 0:
+            return 0.0  # Unlimited
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        self.tokens -= 1
+        return 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+
+class _HostState:
+    """Limits and counters for one host"""
+    
+    def __init__(self, max_concurrent, rate, burst):
+        self.semaphore = threading.BoundedSemaphore(max(1, max_concurrent))
+        self.bucket = TokenBucket(rate, burst)
+        self.retry_at = 0  # Wall-clock time before which the host is skipped
+        self.requests = 0
+        self.deferred = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+
+class PolitenessGate:
+    """Per-host concurrency caps, token-bucket pacing and Retry-After deferral, shared by fetch workers"""
+    
+    def __init__(self, max_concurrent=2, rate=1.0, burst=2):
+        self.max_concurrent = max_concurrent
+        self.rate = rate
+        self.burst = burst
+        self._hosts = {}
+        self._lock = threading.Lock()
+    
+    def _host(self, host):
+        with self._lock:
+            state = self._hosts.get(host)
+            if state is None:
+                state = self._hosts[host] = _HostState(self.max_concurrent, self.rate, self.burst)
+            return state
+    
+    @contextmanager
+    def slot(self, url):
+        """Hold a request slot for the URL's host, waiting for its turn; yields the seconds spent queued"""
+        host = host_of(url)
+        state = self._host(host)
+        if state.retry_at > time.time():
+            with self._lock:
+                state.deferred += 1
+            raise HostDeferred(host, state.retry_at)
+        
+        queued_at = time.monotonic()
+        with state.semaphore:
+            with self._lock:
+                delay = state.bucket.reserve(time.monotonic())
+            if delay > 0:
+                time.sleep(delay)
+            
+            waited = time.monotonic() - queued_at
+            with self._lock:
+                state.requests += 1
+                state.wait_total += waited
+                state.wait_max = max(state.wait_max, waited)
+            yield waited
+    
+    def defer(self, url, retry_after=None):
+        """Skip the URL's host until its Retry-After time (or DEFAULT_RETRY_AFTER seconds)"""
+        state = self._host(host_of(url))
+        retry_at = parse_retry_after(retry_after) or time.time() + DEFAULT_RETRY_AFTER
+        with self._lock:
+            state.retry_at = max(state.retry_at, retry_at)
+        return retry_at
+    
+    def stats(self):
+        """Per-host request counts and queue waits since startup"""
+        with self._lock:
+            return {host: {
+                'requests': state.requests,
+                'deferred': state.deferred,
+                'wait_avg': state.wait_total / state.requests if state.requests else 0.0,
+                'wait_max': state.wait_max,
+                'retry_at': state.retry_at,
+            } for host, state in self._hosts.items()}
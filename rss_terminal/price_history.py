@@ -0,0 +1,93 @@
+"""
+Intraday price history for RSS Terminal.
+Keeps a fixed-size NumPy ring buffer of quote samples per symbol so memory
+stays bounded however long the app runs. NumPy is imported on first use,
+so it does not slow down startup.
+"""
+SPARK_CHARS = "▁▂▃▄▅▆▇█"
+
+np = None  # numpy, bound by the first buffer created
+
+# Column layout of the sample array
+TIMESTAMP, PRICE, VOLUME = 0, 1, 2
+
+class PriceRingBuffer:
+    """Fixed-size ring buffer of (timestamp, price, volume) samples for one symbol"""
+    
+    def __init__(self, capacity=390):
+        # Imported on first use: numpy takes a few hundred ms to load
+        global np
+        import numpy as np
+        
+        self.capacity = max(2, capacity)
+        self._data = np.zeros((self.capacity, 3), dtype=np.float64)
+        self._next = 0  # Slot the next sample is written to
+        self._count = 0
+    
+    def __len__(self):
+        return self._count
+    
+    def append(self, timestamp, price, volume=0.0):
+        """Add a sample, overwriting the oldest one when full (O(1))"""
+        self._data[self._next] = (timestamp, price, volume)
+        self._next = (self._next + 1) % self.capacity
+        self._count = min(self._count + 1, self.capacity)
+    
+    def clear(self):
+        """Drop all samples"""
+        self._next = 0
+        self._count = 0
+    
+    def samples(self):
+        """Return the samples in chronological order as an (n, 3) array"""
+        if self._count < self.capacity:
+            return self._data[:self._count]
+        return np.concatenate((self._data[self._next:], self._data[:self._next]))
+    
+    def summary(self):
+        """Vectorized low/high/first/last and volume-weighted average price"""
+        if not self._count:
+            return None
+        
+        samples = self.samples()
+        prices = samples[:, PRICE]
+        volumes = samples[:, VOLUME]
+        
+        # Volume-weighted average when volumes are known, time-weighted otherwise
+        total_volume = volumes.sum()
+        if total_volume > 0:
+            vwap = float(np.dot(prices, volumes) / total_volume)
+        elif len(prices) > 1:
+            durations = np.diff(samples[:, TIMESTAMP])
+            total_time = durations.sum()
+            vwap = float(np.dot(prices[:-1], durations) / total_time) if total_time > 0 else float(prices.mean())
+        else:
+            vwap = float(prices[0])
+        
+        return {
+            'low': float(prices.min()),
+            'high': float(prices.max()),
+            'first': float(prices[0]),
+            'last': float(prices[-1]),
+            'vwap': vwap,
+            'samples': self._count,
+        }
+    
+    def sparkline(self, width=10):
+        """Render the price trend as a string of block characters"""
+        if self._count < 2:
+            return ""
+        
+        prices = self.samples()[:, PRICE]
+        
+        # Resample to the requested width by picking evenly spaced samples
+        if len(prices) > width:
+            prices = prices[np.linspace(0, len(prices) - 1, width).astype(int)]
+        
+        low, high = prices.min(), prices.max()
+        if high == low:
+            levels = np.full(len(prices), len(SPARK_CHARS) // 2 - 1)
+        else:
+            levels = np.rint((prices - low) / (high - low) * (len(SPARK_CHARS) - 1)).astype(int)
+        
+        return "".join(SPARK_CHARS[level] for level in levels)
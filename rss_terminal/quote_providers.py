@@ -0,0 +1,345 @@
+"""
+Quote providers for RSS Terminal.
+StockManager asks a provider for the latest quotes; Yahoo Finance is the
+default, and the replay provider serves recorded quotes from a local file
+so the stock pipeline can run and be benchmarked offline. The recording
+provider writes another provider's quotes in the replay format.
+"""
+import json
+import time
+from datetime import datetime, timedelta
+from rss_terminal.bar_cache import BarCache
+
+# Calendar days of daily bars to download for a symbol with no cached history
+HISTORY_LOOKBACK_DAYS = 14
+
+# Sessions back for the multi-day change column
+MULTI_DAY_SESSIONS = 5
+
+def build_quote(symbol, current_price, prev_close, market_state,
+                after_hours_price=None, after_hours_change=None, company_name=None, volume=0):
+    """Assemble the quote dict every provider returns"""
+    # Calculate change
+    price_change = current_price - prev_close
+    percent_change = (price_change / prev_close * 100) if prev_close > 0 else 0
+    
+    return {
+        'symbol': symbol,
+        'current_price': current_price,
+        'previous_close': prev_close,
+        'price_change': price_change,
+        'percent_change': percent_change,
+        'market_state': market_state,
+        'after_hours_price': after_hours_price,
+        'after_hours_change': after_hours_change,
+        'last_updated': datetime.now(),
+        'company_name': company_name,  # None if the provider does not know it
+        'volume': volume
+    }
+
+class QuoteProvider:
+    """Base class for quote sources used by StockManager"""
+    
+    # Poll on the exchange calendar; providers with their own clock poll on a fixed interval
+    follows_market_hours = True
+    
+    def fetch_quotes(self, symbols):
+        """Return {symbol: quote} for the symbols that could be quoted"""
+        raise NotImplementedError
+    
+    def close(self):
+        """Release any resources held by the provider"""
+
+class YahooQuoteProvider(QuoteProvider):
+    """Quotes from Yahoo Finance bulk downloads, with per-symbol requests as a fallback"""
+    
+    def __init__(self, config, calendar):
+        self.config = config
+        self.calendar = calendar
+        
+        # Completed daily bars, so only the missing tail is downloaded
+        self.bar_cache = BarCache(self.config.stock_bar_cache_file)
+    
+    def fetch_quotes(self, symbols):
+        """Fetch quotes for all symbols, falling back to per-symbol requests for gaps"""
+        # Imported on first use: yfinance pulls in pandas, which is slow to load
+        import yfinance as yf
+        
+        # Quotes for all symbols come from a couple of bulk downloads
+        session_day = self.calendar.current_session_day(time.time())
+        quotes = self._fetch_batch_quotes(yf, symbols, session_day)
+        
+        # Fall back to slow per-symbol requests only for what the batch missed
+        missing = [symbol for symbol in symbols if symbol not in quotes]
+        if missing:
+            print(f"[DEBUG] Batch quote missing {len(missing)} symbols, fetching individually")
+        
+        for symbol in missing:
+            try:
+                quote = self._fetch_single_quote(yf, symbol)
+                if quote:
+                    quotes[symbol] = quote
+            except Exception as e:
+                print(f"Error fetching data for {symbol}: {e}")
+        
+        self._attach_multi_day_change(quotes, session_day)
+        
+        stats = self.bar_cache.stats()
+        print(f"[DEBUG] Bar cache: {stats['hits']} hits, {stats['misses']} misses "
+              f"({stats['hit_rate']:.0%} hit rate), {stats['bars_stored']} bars stored")
+        
+        return quotes
+    
+    def close(self):
+        """Close the bar cache"""
+        self.bar_cache.close()
+    
+    def _fetch_batch_quotes(self, yf, symbols, session_day):
+        """Build quotes for many symbols from two bulk downloads instead of per-symbol requests"""
+        # Daily bars for the current session plus any completed sessions missing from the cache
+        try:
+            start = self._history_start(symbols, session_day)
+            daily = yf.download(symbols, start=start.isoformat(), interval="1d", group_by="ticker",
+                                auto_adjust=False, progress=False, threads=True)
+        except Exception as e:
+            print(f"Daily batch download failed: {e}")
+            return {}
+        
+        # The session's own bar only becomes final once the close has settled
+        session_close = self.calendar.session_times(session_day)[2]
+        settled = time.time() >= session_close + self.config.stock_settlement_delay
+        
+        # Minute bars including extended hours give the post-market price
+        try:
+            intraday = yf.download(symbols, period="1d", interval="1m", prepost=True, group_by="ticker",
+                                   auto_adjust=False, progress=False, threads=True)
+        except Exception as e:
+            print(f"Intraday batch download failed: {e}")
+            intraday = None
+        
+        market_state = self.calendar.session()
+        quotes = {}
+        
+        for symbol in symbols:
+            try:
+                bars = self._symbol_frame(daily, symbol, len(symbols))
+                if bars is None:
+                    continue
+                
+                bars = bars.dropna(subset=['Close'])
+                self._store_completed_bars(symbol, bars, session_day, settled)
+                
+                session_bars = bars[bars.index.date == session_day]
+                prev_closes = self.bar_cache.closes(symbol, session_day, 1)
+                if session_bars.empty or not prev_closes:
+                    continue  # No session price or previous close yet
+                
+                current_price = float(session_bars['Close'].iloc[-1])
+                prev_close = prev_closes[-1]
+                volume = float(session_bars['Volume'].fillna(0).iloc[-1]) if 'Volume' in bars else 0.0
+                
+                # After hours data if available
+                after_hours_price = None
+                after_hours_change = None
+                minute_bars = self._symbol_frame(intraday, symbol, len(symbols))
+                if minute_bars is not None:
+                    minute_closes = minute_bars['Close'].dropna()
+                    post_market = minute_closes[minute_closes.index.hour >= 16]
+                    if len(post_market):
+                        after_hours_price = float(post_market.iloc[-1])
+                        after_hours_change = after_hours_price - current_price
+                
+                quotes[symbol] = build_quote(symbol, current_price, prev_close, market_state,
+                                             after_hours_price, after_hours_change, volume=volume)
+            except Exception as e:
+                print(f"Error reading batch data for {symbol}: {e}")
+        
+        return quotes
+    
+    def _history_start(self, symbols, session_day):
+        """Earliest date the daily download must cover so every symbol's cache is complete"""
+        needed_through = self.calendar.previous_trading_day(session_day)
+        cold_start = session_day - timedelta(days=HISTORY_LOOKBACK_DAYS)
+        start = session_day
+        
+        for symbol in symbols:
+            latest = self.bar_cache.latest_date(symbol)
+            hit = latest is not None and latest >= needed_through
+            self.bar_cache.record_lookup(hit)
+            if not hit:
+                # Fetch only the tail after the newest cached bar, within the lookback
+                tail_start = latest + timedelta(days=1) if latest else cold_start
+                start = min(start, max(tail_start, cold_start))
+        
+        return start
+    
+    def _store_completed_bars(self, symbol, bars, session_day, settled):
+        """Write bars of completed sessions to the cache; past daily bars never change"""
+        rows = []
+        for timestamp, bar in bars.iterrows():
+            day = timestamp.date()
+            if day > session_day or (day == session_day and not settled):
+                continue
+            rows.append((day, float(bar['Open']), float(bar['High']), float(bar['Low']),
+                         float(bar['Close']), float(bar['Volume']) if 'Volume' in bar else 0.0))
+        self.bar_cache.store(symbol, rows)
+    
+    def _attach_multi_day_change(self, quotes, session_day):
+        """Add the percent change over the last few sessions from cached closes"""
+        for symbol, quote in quotes.items():
+            closes = self.bar_cache.closes(symbol, session_day, MULTI_DAY_SESSIONS)
+            if len(closes) == MULTI_DAY_SESSIONS and closes[0] > 0:
+                quote['change_5d'] = (quote['current_price'] / closes[0] - 1) * 100
+            else:
+                quote['change_5d'] = None
+    
+    def _symbol_frame(self, data, symbol, symbol_count):
+        """Return the bars for one symbol from a grouped download, or None if absent"""
+        if data is None or data.empty:
+            return None
+        
+        # Grouped downloads have (symbol, field) columns; single symbols may not
+        if getattr(data.columns, 'nlevels', 1) > 1:
+            if symbol not in data.columns.get_level_values(0):
+                return None
+            return data[symbol]
+        
+        return data if symbol_count == 1 else None
+    
+    def _fetch_single_quote(self, yf, symbol):
+        """Fetch one symbol's quote with per-ticker requests (slow fallback path)"""
+        ticker = yf.Ticker(symbol)
+        info = ticker.info
+        hist = ticker.history(period="2d", interval="1d")
+        
+        if hist.empty or 'regularMarketPrice' not in info:
+            return None
+        
+        current_price = info.get('regularMarketPrice', 0)
+        prev_close = info.get('previousClose', current_price)
+        
+        return build_quote(symbol, current_price, prev_close,
+                           info.get('marketState', 'CLOSED'),
+                           info.get('postMarketPrice'),
+                           info.get('postMarketChange'),
+                           info.get('shortName', symbol),
+                           info.get('regularMarketVolume') or 0)
+
+class ReplayQuoteProvider(QuoteProvider):
+    """
+    Serves quotes recorded as JSON lines, one tick per line:
+    {"time": 1760967000.0, "symbol": "AAPL", "price": 231.4, "previous_close": 229.9, "volume": 1200}
+    previous_close, volume, market_state and name are optional.
+    """
+    
+    # The recording has its own clock, so poll on the update interval at any hour
+    follows_market_hours = False
+    
+    def __init__(self, path, speed=1.0):
+        self.path = path
+        self.speed = speed  # Recorded seconds per wall second; 0 replays one step per fetch
+        self._ticks = None  # (time, tick) pairs sorted by time
+        self._position = 0  # Next tick to apply
+        self._latest = {}  # Symbol -> latest replayed tick
+        self._first_price = {}  # Symbol -> first price, used when a tick has no previous close
+        self._started_at = None  # (wall time, recording time) when the replay began
+    
+    def _load(self):
+        """Read and sort the recorded ticks"""
+        ticks = []
+        with open(self.path, "r") as f:
+            for line_number, line in enumerate(f, 1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    tick = json.loads(line)
+                    ticks.append((float(tick['time']), tick))
+                except (ValueError, KeyError, TypeError) as e:
+                    print(f"Skipping replay line {line_number}: {e}")
+        
+        ticks.sort(key=lambda item: item[0])
+        self._ticks = ticks
+    
+    def _replay_until(self, target):
+        """Apply every tick recorded at or before the target time"""
+        while self._position < len(self._ticks) and self._ticks[self._position][0] <= target:
+            tick = self._ticks[self._position][1]
+            self._latest[tick['symbol']] = tick
+            self._first_price.setdefault(tick['symbol'], tick['price'])
+            self._position += 1
+    
+    def fetch_quotes(self, symbols):
+        """Advance the replay clock and return the latest quote for each recorded symbol"""
+        if self._ticks is None:
+            self._load()
+        
+        if self._position < len(self._ticks):
+            if self.speed > 0:
+                now = time.time()
+                if self._started_at is None:
+                    self._started_at = (now, self._ticks[0][0])
+                wall_start, recording_start = self._started_at
+                self._replay_until(recording_start + (now - wall_start) * self.speed)
+            else:
+                self._replay_until(self._ticks[self._position][0])
+        
+        quotes = {}
+        for symbol in symbols:
+            tick = self._latest.get(symbol)
+            if tick is None:
+                continue
+            
+            price = float(tick['price'])
+            prev_close = float(tick.get('previous_close', self._first_price[symbol]))
+            quotes[symbol] = build_quote(symbol, price, prev_close, tick.get('market_state', 'REGULAR'),
+                                         company_name=tick.get('name'), volume=tick.get('volume', 0))
+        return quotes
+
+class RecordingQuoteProvider(QuoteProvider):
+    """Passes another provider's quotes through and appends them as ticks the replay provider can serve"""
+    
+    def __init__(self, provider, path):
+        self.provider = provider
+        self.path = path
+        self.follows_market_hours = provider.follows_market_hours
+    
+    def fetch_quotes(self, symbols):
+        """Fetch from the wrapped provider and record the quotes"""
+        quotes = self.provider.fetch_quotes(symbols)
+        now = time.time()
+        try:
+            with open(self.path, "a") as f:
+                for symbol, quote in quotes.items():
+                    f.write(json.dumps({
+                        'time': now,
+                        'symbol': symbol,
+                        'price': quote['current_price'],
+                        'previous_close': quote['previous_close'],
+                        'volume': quote['volume'],
+                        'market_state': quote['market_state'],
+                        'name': quote['company_name'],
+                    }) + "\n")
+        except OSError as e:
+            print(f"Error recording quotes: {e}")
+        return quotes
+    
+    def close(self):
+        """Close the wrapped provider"""
+        self.provider.close()
+
+def create_quote_provider(config, calendar, traffic=None):
+    """Build the quote provider selected in the [Stock] config section, or by the [Replay] mode"""
+    if traffic is not None and traffic.replaying:
+        return ReplayQuoteProvider(traffic.quotes_path, traffic.speed)
+    
+    if config.stock_provider == "replay":
+        provider = ReplayQuoteProvider(config.stock_replay_file, config.stock_replay_speed)
+    else:
+        if config.stock_provider != "yahoo":
+            print(f"Unknown quote provider '{config.stock_provider}', using yahoo")
+        provider = YahooQuoteProvider(config, calendar)
+    
+    if traffic is not None and traffic.recording:
+        return RecordingQuoteProvider(provider, traffic.quotes_path)
+    return provider
@@ -0,0 +1,103 @@
+"""
+Push quote stream for RSS Terminal.
+Reads quote ticks from a long-lived HTTP response, one JSON object per line
+(plain NDJSON or Server-Sent Events "data:" lines), and reconnects with
+exponential backoff when the connection drops.
+"""
+import json
+import random
+import threading
+import urllib.parse
+import urllib.request
+
+class QuoteStream:
+    """Background reader that hands each pushed tick to a callback"""
+    
+    def __init__(self, url, symbols, on_tick, read_timeout=60, max_backoff=60):
+        self.url = url
+        self.symbols = list(symbols)
+        self.on_tick = on_tick
+        self.read_timeout = read_timeout  # The server sends heartbeats; silence this long means a dead link
+        self.max_backoff = max_backoff
+        self.connected = False
+        self.ticks_received = 0
+        self.reconnects = 0
+        self._stop_event = threading.Event()
+        self._response = None
+        self._thread = None
+    
+    def start(self):
+        """Start reading in a daemon thread"""
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+    
+    def stop(self, wait=True):
+        """Stop reading and close the connection; with wait=False the reader thread is left to exit on its own"""
+        self._stop_event.set()
+        response = self._response
+        if response is not None:
+            try:
+                response.close()  # Unblocks a pending read
+            except OSError:
+                pass
+        if wait and self._thread and self._thread.is_alive():
+            self._thread.join(timeout=1)
+    
+    def _subscription_url(self):
+        """The stream URL with the watched symbols as a query parameter"""
+        separator = "&" if "?" in self.url else "?"
+        return f"{self.url}{separator}{urllib.parse.urlencode({'symbols': ','.join(self.symbols)})}"
+    
+    def _run(self):
+        """Connect, read ticks until the connection drops, then back off and reconnect"""
+        backoff = 1
+        while not self._stop_event.is_set():
+            try:
+                request = urllib.request.Request(self._subscription_url(),
+                                                 headers={'Accept': 'application/x-ndjson, text/event-stream'})
+                with urllib.request.urlopen(request, timeout=self.read_timeout) as response:
+                    self._response = response
+                    self.connected = True
+                    backoff = 1
+                    print(f"[DEBUG] Quote stream connected: {self.url}")
+                    
+                    for line in response:
+                        if self._stop_event.is_set():
+                            break
+                        self._handle_line(line)
+            
+            except (OSError, ValueError) as e:
+                if not self._stop_event.is_set():
+                    print(f"Quote stream error: {e}")
+            finally:
+                self._response = None
+                self.connected = False
+            
+            if self._stop_event.is_set():
+                break
+            
+            # Jittered exponential backoff so many clients don't reconnect in lockstep
+            self.reconnects += 1
+            self._stop_event.wait(backoff * random.uniform(0.5, 1.0))
+            backoff = min(backoff * 2, self.max_backoff)
+    
+    def _handle_line(self, line):
+        """Parse one line of the stream and pass its ticks on"""
+        line = line.decode("utf-8", errors="replace").strip()
+        if line.startswith("data:"):
+            line = line[5:].strip()
+        if not line or line.startswith(":"):
+            return  # Heartbeat or SSE comment
+        
+        try:
+            payload = json.loads(line)
+        except ValueError:
+            print(f"Skipping malformed stream line: {line[:80]}")
+            return
+        
+        # A line holds one tick or a list of ticks
+        for tick in payload if isinstance(payload, list) else [payload]:
+            if isinstance(tick, dict) and 'symbol' in tick and 'price' in tick:
+                self.ticks_received += 1
+                self.on_tick(tick)
@@ -0,0 +1,79 @@
+"""
+Selection model for the RSS Terminal article list.
+Keeps the selected row separate from what is highlighted on screen so the
+UI can repaint only the rows that changed, once per frame.
+"""
+
+class SelectionModel:
+    """Tracks the selected article row and the pending highlight change"""
+    
+    def __init__(self, page_size=10):
+        self.page_size = page_size
+        self.count = 0  # Number of selectable rows
+        self.index = -1  # Selected row, -1 when nothing is selected
+        self.rendered_index = -1  # Row currently highlighted on screen
+        self.scroll_pending = False
+    
+    @property
+    def has_selection(self):
+        """True if a valid row is selected"""
+        return 0 <= self.index < self.count
+    
+    @property
+    def dirty(self):
+        """True if the screen does not reflect the current selection yet"""
+        return self.index != self.rendered_index or self.scroll_pending
+    
+    def reset(self, count, index=-1):
+        """Start over for a freshly rendered list; nothing is highlighted on screen"""
+        self.count = count
+        self.index = index if 0 <= index < count else -1
+        self.rendered_index = -1
+        self.scroll_pending = False
+    
+    def select(self, index, scroll=True):
+        """Select a row, clamped to the list bounds"""
+        if self.count == 0:
+            return False
+        
+        self.index = max(0, min(self.count - 1, index))
+        self.scroll_pending = self.scroll_pending or scroll
+        return True
+    
+    def move(self, delta):
+        """Move the selection by delta rows, wrapping around at either end"""
+        if self.count == 0:
+            return False
+        
+        if self.index < 0:
+            # Nothing selected yet: Down starts at the top, Up at the bottom
+            return self.select(0 if delta > 0 else self.count - 1)
+        return self.select((self.index + delta) % self.count)
+    
+    def page(self, pages):
+        """Move the selection by whole pages without wrapping"""
+        if self.count == 0:
+            return False
+        
+        start = max(self.index, 0)
+        return self.select(start + pages * self.page_size)
+    
+    def first(self):
+        """Select the first (newest) row"""
+        return self.select(0)
+    
+    def last(self):
+        """Select the last row"""
+        return self.select(self.count - 1)
+    
+    def clear(self):
+        """Drop the selection"""
+        self.index = -1
+        self.scroll_pending = False
+    
+    def take_changes(self):
+        """Return (old_row, new_row, scroll) to repaint and mark them as rendered"""
+        change = (self.rendered_index, self.index, self.scroll_pending)
+        self.rendered_index = self.index
+        self.scroll_pending = False
+        return change
@@ -1,129 +1,357 @@
 """
 Stock Manager module for RSS Terminal.
-Handles fetching stock data from Yahoo Finance and managing updates.
+Handles fetching stock data from a quote provider and managing updates.
 """
 import time
 import threading
-import yfinance as yf
 from datetime import datetime, timedelta
+from rss_terminal import metrics
+from rss_terminal.market_calendar import MarketCalendar, EASTERN
+from rss_terminal.price_history import PriceRingBuffer
+from rss_terminal.quote_providers import create_quote_provider, build_quote
+from rss_terminal.quote_stream import QuoteStream
 
+# Streamed quotes go into the intraday history at most this often per symbol,
+# so a full buffer (390 samples by default) still spans a trading day
+STREAM_HISTORY_SPACING = 60
 
 class StockManager:
     """Manages stock data fetching and caching"""
     
-    def __init__(self, config_manager):
+    def __init__(self, config_manager, traffic=None):
         self.config = config_manager
+        self.traffic = traffic  # Optional TrafficLog; in replay mode quotes come from the recording
         self.stocks = {}  # Cache for stock data
         self.last_update_time = 0
         self.fetch_thread = None
         self.stop_fetching_flag = False
         self.fetch_callback = None
         self.current_symbol_index = 0
+        self.calendar = MarketCalendar()
         
-    def start_fetching(self, callback):
+        # Intraday (timestamp, price, volume) samples per symbol, bounded in size
+        self.history = {}
+        self._history_day = None
+        self._last_volume = {}  # Cumulative day volume seen at the previous sample
+        self._last_sample_time = {}  # Symbol -> time of its latest history sample
+        
+        # Where quotes come from (Yahoo Finance by default)
+        self.provider = create_quote_provider(self.config, self.calendar, traffic)
+        
+        # Wakes the fetch loop early for shutdown or a requested refresh
+        self._wake_event = threading.Event()
+        self._refresh_requested = False
+        self._added_symbols = set()  # Added to the watchlist by a config reload, fetched on their own
+        
+        # Polled and streamed quotes both replace self.stocks under this lock
+        self._stocks_lock = threading.Lock()
+        
+        # Streaming mode: pushed ticks are coalesced per symbol and published
+        # at most stock_max_redraws_per_second times a second
+        self.stream = None
+        self.publish_thread = None
+        self._pending_ticks = {}
+        self._pending_lock = threading.Lock()
+        self._tick_event = threading.Event()
+    
+    def start_fetching(self, callback, initial_delay=0):
         """Start background stock data fetching"""
         self.fetch_callback = callback
         self.stop_fetching_flag = False
         
         # Start the background thread
-        self.fetch_thread = threading.Thread(target=self._fetch_loop, daemon=True)
+        self.fetch_thread = threading.Thread(target=self._fetch_loop, args=(initial_delay,), daemon=True)
         self.fetch_thread.start()
         
+        # Subscribe to pushed quotes when a stream is configured
+        self._start_stream()
+    
+    def _start_stream(self):
+        """Subscribe to pushed quotes for the current watchlist, if a stream is configured"""
+        if not self.config.stock_stream_url:
+            return
+        if self.traffic is not None and self.traffic.replaying:
+            return  # Replays run offline
+        self.stream = QuoteStream(self.config.stock_stream_url, self.config.stock_symbols, self._on_stream_tick)
+        self.stream.start()
+        if not (self.publish_thread and self.publish_thread.is_alive()):
+            self.publish_thread = threading.Thread(target=self._publish_loop, daemon=True)
+            self.publish_thread.start()
+    
     def stop_fetching(self):
         """Stop the background fetching thread"""
         self.stop_fetching_flag = True
+        self._wake_event.set()
+        self._tick_event.set()
+        if self.stream:
+            self.stream.stop()
         if self.fetch_thread and self.fetch_thread.is_alive():
             self.fetch_thread.join(timeout=1)
+        if self.publish_thread and self.publish_thread.is_alive():
+            self.publish_thread.join(timeout=1)
+        self.provider.close()
+    
+    def request_refresh(self):
+        """Ask the background loop to fetch quotes now, whatever the market session"""
+        self._refresh_requested = True
+        self._wake_event.set()
     
-    def _fetch_loop(self):
-        """Background loop for fetching stock data"""
+    def reschedule(self):
+        """Re-evaluate the fetch schedule after the configured intervals changed"""
+        self._wake_event.set()
+    
+    def update_watchlist(self, added, removed, resubscribe=False):
+        """Apply a watchlist change from a config reload: drop removed quotes, fetch only the added symbols"""
+        if removed:
+            removed = set(removed)
+            with self._stocks_lock:
+                self.stocks = {symbol: quote for symbol, quote in self.stocks.items() if symbol not in removed}
+            if self.current_symbol_index >= len(self.config.stock_symbols):
+                self.current_symbol_index = 0
+            if self.fetch_callback:
+                self.fetch_callback(self.stocks)
+        
+        # The stream subscription carries the symbol list, so reconnect with the new one
+        if (added or removed or resubscribe) and (self.stream or self.config.stock_stream_url):
+            if self.stream:
+                # Called on the Tk thread, so don't wait for the old reader to finish
+                self.stream.stop(wait=False)
+                self.stream = None
+            self._start_stream()
+        
+        if added:
+            self._added_symbols.update(added)
+            self._wake_event.set()
+    
+    def _fetch_loop(self, initial_delay=0):
+        """Background loop for fetching stock data on a market-hours schedule"""
+        if initial_delay:
+            self._wake_event.wait(initial_delay)
+            self._wake_event.clear()
+        
         while not self.stop_fetching_flag:
             try:
-                # Check if it's time to update
-                current_time = time.time()
-                if current_time - self.last_update_time >= self.config.stock_update_interval:
-                    self.fetch_stock_data()
-                    self.last_update_time = current_time
+                # Symbols just added to the watchlist are fetched on their own, off-schedule
+                if self._added_symbols:
+                    symbols, self._added_symbols = self._added_symbols, set()
+                    self.fetch_stock_data([s for s in self.config.stock_symbols if s in symbols])
+                    continue
                 
-                # Sleep for 10 seconds before checking again
-                time.sleep(10)
+                # Check if it's time to update
+                delay = 0 if self._refresh_requested else self._seconds_until_next_fetch(time.time())
+                if delay > 0:
+                    # Sleep until the next scheduled fetch, a refresh request or shutdown
+                    self._wake_event.wait(delay)
+                    self._wake_event.clear()
+                    continue
                 
+                self._refresh_requested = False
+                self.fetch_stock_data()
+                self.last_update_time = time.time()
+            
             except Exception as e:
                 print(f"Stock fetch error: {e}")
-                time.sleep(30)  # Wait longer on error
+                self._wake_event.wait(30)  # Wait longer on error
+                self._wake_event.clear()
+    
+    def _seconds_until_next_fetch(self, now):
+        """Seconds to wait before the next quote fetch, based on the market session"""
+        # Always fetch once at startup so a closed market still shows the last close
+        if not self.last_update_time:
+            return 0
+        
+        # While the stream is up it keeps quotes current; polling resumes if it drops
+        if self.stream is not None and self.stream.connected:
+            return self.config.stock_update_interval
+        
+        # Providers with their own clock (e.g. replays) poll on a fixed interval
+        if not self.provider.follows_market_hours:
+            return max(0, self.last_update_time + self.config.stock_update_interval - now)
+        
+        state, started_at, ends_at = self.calendar.session_info(now)
+        
+        # Fetch right away when a new session begins (e.g. at the opening bell)
+        if started_at and self.last_update_time < started_at:
+            return 0
+        
+        # Poll quickly during regular hours, slowly in pre/post-market, not at all when closed
+        due = []
+        if state == 'REGULAR':
+            due.append(self.last_update_time + self.config.stock_update_interval)
+        elif state in ('PRE', 'POST') and self.config.stock_extended_interval > 0:
+            due.append(self.last_update_time + self.config.stock_extended_interval)
+        
+        # One settlement fetch after the close picks up official closing prices
+        last_close = self.calendar.last_close(now)
+        if last_close:
+            settlement_time = last_close + self.config.stock_settlement_delay
+            if self.last_update_time < settlement_time:
+                due.append(settlement_time)
+        
+        # Re-evaluate the schedule when the session changes
+        due.append(ends_at)
+        
+        return max(0, min(due) - now)
     
-    def fetch_stock_data(self):
-        """Fetch stock data for configured symbols"""
+    def fetch_stock_data(self, symbols=None):
+        """Fetch stock data for configured symbols (or just the given subset)"""
         if not self.config.stock_symbols:
             return
         
         try:
-            # Fetch data for all symbols at once with timeout
-            symbols_str = " ".join(self.config.stock_symbols)
-            tickers = yf.Tickers(symbols_str)
+            watchlist = list(self.config.stock_symbols)
+            symbols = watchlist if symbols is None else list(symbols)
+            if not symbols:
+                return
+            print(f"[DEBUG] Fetching stock data for: {' '.join(symbols)}")
             
-            print(f"[DEBUG] Fetching stock data for: {symbols_str}")
+            with metrics.timed('stock_fetch_seconds', "Quote fetch time"):
+                fresh_quotes = self.provider.fetch_quotes(symbols)
+            metrics.counter('stock_quotes_total', "Quotes received by fetch or stream", via='fetch').inc(len(fresh_quotes))
             
-            updated_stocks = {}
+            # Some sources carry no names, so keep one learned from an earlier fetch
+            for symbol, quote in fresh_quotes.items():
+                if quote['company_name'] is None:
+                    quote['company_name'] = self.stocks.get(symbol, {}).get('company_name', symbol)
             
-            for symbol in self.config.stock_symbols:
-                try:
-                    print(f"[DEBUG] Processing {symbol}...")
-                    ticker = tickers.tickers[symbol]
-                    info = ticker.info
-                    hist = ticker.history(period="2d", interval="1d")
-                    
-                    if not hist.empty and 'regularMarketPrice' in info:
-                        current_price = info.get('regularMarketPrice', 0)
-                        prev_close = info.get('previousClose', current_price)
-                        
-                        # Calculate change
-                        price_change = current_price - prev_close
-                        percent_change = (price_change / prev_close * 100) if prev_close > 0 else 0
-                        
-                        # Market status
-                        market_state = info.get('marketState', 'CLOSED')
-                        
-                        # After hours data if available
-                        after_hours_price = info.get('postMarketPrice')
-                        after_hours_change = info.get('postMarketChange')
-                        
-                        updated_stocks[symbol] = {
-                            'symbol': symbol,
-                            'current_price': current_price,
-                            'previous_close': prev_close,
-                            'price_change': price_change,
-                            'percent_change': percent_change,
-                            'market_state': market_state,
-                            'after_hours_price': after_hours_price,
-                            'after_hours_change': after_hours_change,
-                            'last_updated': datetime.now(),
-                            'company_name': info.get('shortName', symbol)
-                        }
-                        
-                except Exception as e:
-                    print(f"Error fetching data for {symbol}: {e}")
-                    # Keep previous data if fetch fails
-                    if symbol in self.stocks:
+            with self._stocks_lock:
+                # Keep previous data for symbols the provider could not quote (or were not asked for)
+                updated_stocks = dict(fresh_quotes)
+                for symbol in watchlist:
+                    if symbol not in updated_stocks and symbol in self.stocks:
                         updated_stocks[symbol] = self.stocks[symbol]
-            
-            # Update the cache
-            self.stocks = updated_stocks
+                
+                # Add the new samples to the intraday history
+                self._record_history(fresh_quotes)
+                
+                # Update the cache
+                self.stocks = updated_stocks
             
             # Notify UI if callback is set
             if self.fetch_callback:
                 self.fetch_callback(self.stocks)
-                
+        
         except Exception as e:
+            metrics.counter('stock_fetch_errors_total', "Failed quote fetches").inc()
             print(f"Stock data fetch error: {e}")
             if self.fetch_callback:
                 self.fetch_callback(None, error=True)
     
+    def _on_stream_tick(self, tick):
+        """Queue a pushed tick; only the latest tick per symbol is kept until the next publish"""
+        with self._pending_lock:
+            self._pending_ticks[tick['symbol']] = tick
+        self._tick_event.set()
+    
+    def _publish_loop(self):
+        """Apply queued ticks and notify the UI, at most N times per second"""
+        while not self.stop_fetching_flag:
+            # Read every round so a config reload takes effect without a restart
+            min_interval = 1.0 / max(self.config.stock_max_redraws_per_second, 0.1)
+            self._tick_event.wait()
+            self._tick_event.clear()
+            if self.stop_fetching_flag:
+                break
+            
+            with self._pending_lock:
+                ticks, self._pending_ticks = self._pending_ticks, {}
+            
+            try:
+                if self._apply_ticks(ticks) and self.fetch_callback:
+                    self.fetch_callback(self.stocks)
+            except Exception as e:
+                print(f"Stock stream update error: {e}")
+            
+            # Ticks arriving meanwhile are coalesced into the next publish
+            time.sleep(min_interval)
+    
+    def _apply_ticks(self, ticks):
+        """Merge pushed ticks into the quotes as per-symbol deltas; returns True if any changed"""
+        watched = set(self.config.stock_symbols)
+        market_state = self.calendar.session()
+        
+        with self._stocks_lock:
+            fresh_quotes = {}
+            for symbol, tick in ticks.items():
+                if symbol not in watched:
+                    continue
+                
+                try:
+                    previous = self.stocks.get(symbol, {})
+                    price = float(tick['price'])
+                    prev_close = float(tick.get('previous_close') or previous.get('previous_close') or price)
+                    volume = tick.get('volume', previous.get('volume', 0))
+                    
+                    quote = build_quote(symbol, price, prev_close, tick.get('market_state', market_state),
+                                        previous.get('after_hours_price'), previous.get('after_hours_change'),
+                                        tick.get('name') or previous.get('company_name', symbol), volume)
+                    quote['change_5d'] = previous.get('change_5d')
+                    fresh_quotes[symbol] = quote
+                except (TypeError, ValueError) as e:
+                    print(f"Skipping bad tick for {symbol}: {e}")
+            
+            if not fresh_quotes:
+                return False
+            
+            metrics.counter('stock_quotes_total', via='stream').inc(len(fresh_quotes))
+            self._record_history(fresh_quotes, STREAM_HISTORY_SPACING)
+            
+            # Copy-on-write so the UI's reference to the previous dict stays consistent
+            updated_stocks = dict(self.stocks)
+            updated_stocks.update(fresh_quotes)
+            self.stocks = updated_stocks
+        
+        return True
+    
+    def _record_history(self, quotes, min_spacing=0):
+        """Append quotes to each symbol's ring buffer, at most one per min_spacing seconds, and attach trend summaries"""
+        now = time.time()
+        
+        # The history is intraday, so start over on a new trading day
+        today = datetime.now(EASTERN).date()
+        if today != self._history_day:
+            for buffer in self.history.values():
+                buffer.clear()
+            self._last_volume = {}
+            self._last_sample_time = {}
+            self._history_day = today
+        
+        # Drop buffers for symbols that left the watchlist
+        watched = set(self.config.stock_symbols)
+        for symbol in list(self.history):
+            if symbol not in watched:
+                del self.history[symbol]
+                self._last_volume.pop(symbol, None)
+                self._last_sample_time.pop(symbol, None)
+        
+        for symbol, quote in quotes.items():
+            buffer = self.history.get(symbol)
+            if buffer is None:
+                buffer = self.history[symbol] = PriceRingBuffer(self.config.stock_history_size)
+            
+            # Too soon after the last sample: the quote is still shown, but not added to the history
+            if now - self._last_sample_time.get(symbol, 0) >= min_spacing:
+                # Each sample carries the volume traded since the previous one
+                volume = quote.get('volume') or 0
+                previous_volume = self._last_volume.get(symbol)
+                volume_delta = volume - previous_volume if previous_volume is not None and volume >= previous_volume else 0
+                self._last_volume[symbol] = volume
+                
+                buffer.append(now, quote['current_price'], volume_delta)
+                self._last_sample_time[symbol] = now
+            
+            summary = buffer.summary()
+            quote['range_low'] = min(summary['low'], quote['current_price'])
+            quote['range_high'] = max(summary['high'], quote['current_price'])
+            quote['vwap'] = summary['vwap']
+            quote['sparkline'] = buffer.sparkline(10)
+            quote['sparkline_wide'] = buffer.sparkline(40)
+    
     def get_current_display_stock(self):
         """Get the currently selected stock for display cycling"""
         if not self.config.stock_symbols or not self.stocks:
             return None
-            
+        
         symbol = self.config.stock_symbols[self.current_symbol_index]
         return self.stocks.get(symbol)
     
@@ -143,19 +371,8 @@ class StockManager:
         return self.stocks.get(symbol)
     
     def is_market_open(self):
-        """Check if the market is currently open (simplified check)"""
-        now = datetime.now()
-        
-        # Basic US market hours check (9:30 AM - 4:00 PM ET, Mon-Fri)
-        # This is a simplified check - real implementation would consider holidays
-        if now.weekday() >= 5:  # Saturday = 5, Sunday = 6
-            return False
-            
-        # Convert to approximate ET (this is simplified)
-        market_open = now.replace(hour=9, minute=30, second=0, microsecond=0)
-        market_close = now.replace(hour=16, minute=0, second=0, microsecond=0)
-        
-        return market_open <= now <= market_close
+        """Check if the regular trading session is open (US exchange calendar, Eastern Time)"""
+        return self.calendar.session() == 'REGULAR'
     
     def format_price(self, price):
         """Format price for display"""
@@ -0,0 +1,145 @@
+"""
+Stock ticker bar for RSS Terminal.
+Shows quotes in a pool of reusable labels, reconfiguring only the labels
+whose text or color changed, and rotates through the watchlist when it
+does not fit in the available width.
+"""
+import tkinter as tk
+
+class TickerBar:
+    """Row of quote labels that are created once and reused on every update"""
+    
+    def __init__(self, frame, font, bg, separator_fg, available_width=None, prefix="📈 ", rotate_ms=3000):
+        self.frame = frame
+        self.font = font
+        self.bg = bg
+        self.separator_fg = separator_fg
+        self.available_width = available_width  # Callable returning pixels, or None for no limit
+        self.prefix = prefix  # Shown before the first visible item
+        self.rotate_ms = rotate_ms
+        
+        self._slots = []  # (label, separator) pairs, reused across updates
+        self._shown = []  # (text, color) currently configured on each slot
+        self._visible = 0  # Slots currently packed
+        self._items = []  # (text, color) for every quote
+        self._offset = 0  # First item shown when rotating
+        self._rotate_job = None
+        self._widths = {}  # Text -> measured pixel width
+        
+        self._message_label = tk.Label(self.frame, font=self.font, bg=self.bg)
+        self._message_shown = False
+    
+    def set_items(self, items):
+        """Show (text, color) items, updating only the labels that changed"""
+        self._items = list(items)
+        if self._offset >= len(self._items):
+            self._offset = 0
+        self._hide_message()
+        self._render()
+    
+    def show_message(self, text, color):
+        """Replace the quotes with a single status message (loading, error, no data)"""
+        self._items = []
+        self._cancel_rotation()
+        self._pack_slots(0)
+        self._message_label.config(text=text, fg=color)
+        if not self._message_shown:
+            self._message_label.pack(side=tk.LEFT)
+            self._message_shown = True
+    
+    def relayout(self, event=None):
+        """Recompute how many items fit, e.g. after the window was resized"""
+        if self._items:
+            self._render()
+    
+    def _hide_message(self):
+        if self._message_shown:
+            self._message_label.pack_forget()
+            self._message_shown = False
+    
+    def _measure(self, text):
+        """Pixel width of a text, cached since quote texts repeat between updates"""
+        width = self._widths.get(text)
+        if width is None:
+            if len(self._widths) > 4096:
+                self._widths.clear()
+            width = self._widths[text] = self.font.measure(text)
+        return width
+    
+    def _fitting_count(self):
+        """Number of items, starting at the rotation offset, that fit in the available width"""
+        if self.available_width is None:
+            return len(self._items)
+        
+        available = self.available_width()
+        separator_width = self._measure(" | ")
+        used = self._measure(self.prefix)
+        count = 0
+        for i in range(len(self._items)):
+            text = self._items[(self._offset + i) % len(self._items)][0]
+            used += self._measure(text) + (separator_width if i else 0)
+            if used > available and count:
+                break
+            count += 1
+        return count
+    
+    def _render(self):
+        """Configure the visible slots from the current items and rotation offset"""
+        count = self._fitting_count()
+        if count == len(self._items):
+            self._offset = 0  # Everything fits: no rotation
+        
+        # Grow the pool once; labels are never destroyed afterwards
+        while len(self._slots) < count:
+            label = tk.Label(self.frame, font=self.font, bg=self.bg)
+            separator = tk.Label(self.frame, text=" | ", font=self.font, bg=self.bg, fg=self.separator_fg)
+            self._slots.append((label, separator))
+            self._shown.append(None)
+        
+        for i in range(count):
+            text, color = self._items[(self._offset + i) % len(self._items)]
+            if i == 0:
+                text = self.prefix + text
+            if self._shown[i] != (text, color):
+                self._slots[i][0].config(text=text, fg=color)
+                self._shown[i] = (text, color)
+        
+        self._pack_slots(count)
+        
+        if count < len(self._items):
+            self._schedule_rotation()
+        else:
+            self._cancel_rotation()
+    
+    def _pack_slots(self, count):
+        """Show the first count slots in order, with separators between them"""
+        if count == self._visible:
+            return
+        
+        # Re-pack from the first slot whose separator visibility changes so order is kept
+        start = max(0, min(count, self._visible) - 1)
+        for label, separator in self._slots[start:]:
+            label.pack_forget()
+            separator.pack_forget()
+        for i in range(start, count):
+            label, separator = self._slots[i]
+            label.pack(side=tk.LEFT)
+            if i < count - 1:
+                separator.pack(side=tk.LEFT)
+        self._visible = count
+    
+    def _schedule_rotation(self):
+        if self._rotate_job is None:
+            self._rotate_job = self.frame.after(self.rotate_ms, self._rotate)
+    
+    def _cancel_rotation(self):
+        if self._rotate_job is not None:
+            self.frame.after_cancel(self._rotate_job)
+            self._rotate_job = None
+    
+    def _rotate(self):
+        """Advance the window by one symbol"""
+        self._rotate_job = None
+        if self._items:
+            self._offset = (self._offset + 1) % len(self._items)
+            self._render()
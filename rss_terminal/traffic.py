@@ -0,0 +1,132 @@
+"""
+Traffic recording and replay for RSS Terminal.
+In record mode the raw feed and weather responses are written to a local
+directory together with their timing, and fetched quotes are saved as
+ticks for the replay quote provider. In replay mode the same responses are
+served back in recorded order with no network access, optionally faster
+than they were recorded, so the app and benchmarks run offline.
+"""
+import json
+import os
+import threading
+import time
+from collections import namedtuple
+import requests
+from requests.structures import CaseInsensitiveDict
+
+OFF = "off"
+RECORD = "record"
+REPLAY = "replay"
+
+# One recorded exchange; elapsed is how long the live request took
+RecordedResponse = namedtuple('RecordedResponse', ['status', 'headers', 'body', 'elapsed'])
+
+class ReplayMiss(Exception):
+    """The recording has no response for a request"""
+
+class TrafficLog:
+    """
+    Records or replays responses per channel ('feeds', 'weather').
+    Layout: <directory>/<channel>.jsonl indexes the exchanges, one JSON
+    object per line, and <directory>/<channel>/<n>.body holds each raw body.
+    """
+    
+    def __init__(self, mode, directory, speed=1.0):
+        self.mode = mode
+        self.directory = directory
+        self.speed = speed  # Replayed latency is the recorded latency divided by this; 0 = no delay
+        self._lock = threading.Lock()
+        self._counters = {}  # Channel -> next body number when recording
+        self._recorded = {}  # Channel -> {key: [entries]} when replaying
+        self._cursors = {}  # (channel, key) -> next entry to serve
+        
+        if mode == RECORD:
+            os.makedirs(directory, exist_ok=True)
+    
+    @property
+    def recording(self):
+        return self.mode == RECORD
+    
+    @property
+    def replaying(self):
+        return self.mode == REPLAY
+    
+    @property
+    def quotes_path(self):
+        """Recorded quotes, in the replay quote provider's tick format"""
+        return os.path.join(self.directory, "quotes.jsonl")
+    
+    def record(self, channel, key, status, headers, body, elapsed):
+        """Append one exchange to the channel's recording"""
+        with self._lock:
+            body_dir = os.path.join(self.directory, channel)
+            if channel not in self._counters:
+                os.makedirs(body_dir, exist_ok=True)
+                self._counters[channel] = len(os.listdir(body_dir))
+            number = self._counters[channel]
+            self._counters[channel] += 1
+            
+            body_file = f"{number}.body"
+            with open(os.path.join(body_dir, body_file), "wb") as f:
+                f.write(body)
+            
+            entry = {'time': time.time(), 'key': key, 'status': status, 'headers': dict(headers),
+                     'elapsed': round(elapsed, 4), 'body': body_file}
+            with open(os.path.join(self.directory, channel + ".jsonl"), "a") as f:
+                f.write(json.dumps(entry) + "\n")
+    
+    def _load(self, channel):
+        """Index a channel's recording by key, keeping the recorded order"""
+        recorded = {}
+        index_path = os.path.join(self.directory, channel + ".jsonl")
+        if os.path.exists(index_path):
+            with open(index_path, "r") as f:
+                for line in f:
+                    line = line.strip()
+                    if line:
+                        entry = json.loads(line)
+                        recorded.setdefault(entry['key'], []).append(entry)
+        self._recorded[channel] = recorded
+        return recorded
+    
+    def replay(self, channel, key):
+        """Serve the next recorded response for a key, after its recorded latency scaled by speed"""
+        with self._lock:
+            recorded = self._recorded.get(channel)
+            if recorded is None:
+                recorded = self._load(channel)
+            
+            entries = recorded.get(key)
+            if not entries:
+                raise ReplayMiss(f"No recorded {channel} response for {key}")
+            
+            # Responses come back in recorded order; the last one repeats once they run out
+            position = self._cursors.get((channel, key), 0)
+            entry = entries[min(position, len(entries) - 1)]
+            self._cursors[(channel, key)] = position + 1
+        
+        with open(os.path.join(self.directory, channel, entry['body']), "rb") as f:
+            body = f.read()
+        
+        if self.speed > 0:
+            time.sleep(entry['elapsed'] / self.speed)
+        return RecordedResponse(entry['status'], entry['headers'], body, entry['elapsed'])
+
+def as_requests_response(recorded, url):
+    """Wrap a recorded exchange as a requests.Response for code written against requests"""
+    response = requests.Response()
+    response.status_code = recorded.status
+    response.headers = CaseInsensitiveDict(recorded.headers)
+    response._content = recorded.body
+    response.url = url
+    return response
+
+def create_traffic_log(config):
+    """Build the traffic log selected in the [Replay] config section, or None when it is off"""
+    if config.replay_mode == OFF:
+        return None
+    if config.replay_mode not in (RECORD, REPLAY):
+        print(f"Unknown replay mode '{config.replay_mode}', traffic is not recorded")
+        return None
+    print(f"[DEBUG] Traffic {config.replay_mode} mode, directory {config.replay_directory}")
+    return TrafficLog(config.replay_mode, config.replay_directory, config.replay_speed)
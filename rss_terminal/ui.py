@@ -6,25 +6,46 @@ import time
 import webbrowser
 from tkinter import font, scrolledtext
 import datetime as dt
-import threading
+from collections import deque
 
-from rss_terminal.utils import get_formatted_time, truncate_headline, html_to_text, get_weather_data, get_weather_icon
+from rss_terminal import metrics
+from rss_terminal.utils import get_formatted_time, html_to_text, get_weather_icon
+from rss_terminal.layout import ColumnLayout
+from rss_terminal.view_model import ArticleListView, HEADLINE_SPAN, row_segments
+from rss_terminal.selection import SelectionModel
+from rss_terminal.movers import MoversTable
+from rss_terminal.ticker_bar import TickerBar
+
+# Most feeds listed in one filter (sub)menu before it is split alphabetically
+FILTER_MENU_CHUNK = 30
 
 class TerminalUI:
     """Manages the UI components for the RSS Terminal"""
     
-    def __init__(self, root, config_manager, feed_manager):
+    def __init__(self, root, config_manager, feed_manager, perf_monitor=None):
         self.root = root
         self.config = config_manager
         self.feed_manager = feed_manager
+        self.perf_monitor = perf_monitor  # Main-loop timings shown in the performance overlay
+        self._perf_overlay = None
+        self._perf_overlay_job = None
         
         # UI state variables
-        self.selected_article_index = -1
+        self.selection = SelectionModel()
+        self._selection_render_job = None
         self.goto_mode = False
         self.goto_number = ""
         self.new_article_tags = []
-        self.weather_data = None
+        self.weather_data = {}  # Station -> latest observation
+        self._weather_index = 0
+        self._weather_rotate_job = None
         self._initial_display_done = False
+        self._intro_job = None
+        self._intro_steps = deque()
+        
+        # The article snapshot currently rendered on screen; navigation indexes
+        # refer to this snapshot even while newer ones are being published
+        self.snapshot = self.feed_manager.snapshot()
         
         # Set up the window
         self._setup_window()
@@ -39,12 +60,18 @@ class TerminalUI:
         # Show the startup sequence
         self.show_startup_sequence()
         
-        # Start weather update
-        self.fetch_weather()
-        
         # Initialize stock display state
         self.current_stock_index = 0
         self.stock_data = {}
+        
+        # Columnar quote store for the top movers popup
+        self.movers = MoversTable()
+        self._movers_window = None
+        self._movers_text = None
+        self._movers_lines = []
+        self._health_window = None
+        self._health_text = None
+        self._health_lines = []
     
     def _setup_window(self):
         """Configure the main window"""
@@ -127,10 +154,11 @@ class TerminalUI:
         self.stock_frame = tk.Frame(self.filter_frame, bg=self.colors['bg'])
         self.stock_frame.pack(side=tk.LEFT, padx=10)
         
-        # Initial loading label
-        self.stock_loading_label = tk.Label(self.stock_frame, text="📈 Loading...", 
-                                          font=self.header_font, bg=self.colors['bg'], fg=self.colors['yellow'])
-        self.stock_loading_label.pack(side=tk.LEFT)
+        # Ticker labels are pooled and reused; symbols rotate when they don't fit
+        self.ticker = TickerBar(self.stock_frame, self.header_font, self.colors['bg'], self.colors['text'],
+                                available_width=self._ticker_available_width)
+        self.ticker.show_message("📈 Loading...", self.colors['yellow'])
+        self.filter_frame.bind("<Configure>", self.ticker.relayout)
         
         # Add separator
         separator2 = tk.Label(self.filter_frame, text="|", font=self.header_font, 
@@ -178,6 +206,70 @@ class TerminalUI:
         self.content_text.tag_configure("source", foreground=self.colors['source'])
         self.content_text.tag_configure("time", foreground=self.colors['time'])
         self.content_text.tag_configure("selected", foreground=self.colors['text'], background=self.colors['selected'])
+        
+        # Rows are built by the view model with cached font measurements; relayout when the widget is resized
+        self.view = ArticleListView(ColumnLayout(self.terminal_font.measure))
+        self._relayout_job = None
+        self._fitted_lines = set()  # Lines already fitted to the current width
+        self.content_text.bind("<Configure>", self._on_content_resize)
+        
+        # Intercept scrolling so rows scrolled into view after a resize get refitted
+        self.content_text.config(yscrollcommand=self._on_content_scroll)
+    
+    def _on_content_resize(self, event=None):
+        """Debounce resize events into a single relayout"""
+        if self._relayout_job:
+            self.root.after_cancel(self._relayout_job)
+        self._relayout_job = self.root.after(150, self._relayout)
+    
+    def _on_content_scroll(self, first, last):
+        """Forward scroll updates to the scrollbar and refit newly visible rows"""
+        self.content_text.vbar.set(first, last)
+        if self.view.width > 1 and not self._relayout_job:
+            self._relayout_job = self.root.after(50, self._refit_visible_rows)
+    
+    def _relayout(self):
+        """Move the right-aligned column to the new width and refit visible rows"""
+        self._relayout_job = None
+        rows = self.content_text.winfo_height() // max(1, self.terminal_font.metrics('linespace'))
+        if not self.view.resize(self.content_text.winfo_width(), rows):
+            return
+        
+        # One tab stop right-aligns the source/time column of every row
+        self.content_text.config(tabs=(self.view.tab_stop(), tk.RIGHT))
+        self._fitted_lines = set()
+        self._refit_visible_rows()
+    
+    @metrics.timed('ui_render_seconds', "Main-thread render time by view", view='refit')
+    def _refit_visible_rows(self):
+        """Re-truncate headlines on visible rows that were laid out for another width"""
+        self._relayout_job = None
+        articles = self.snapshot.filtered_articles
+        first_line = int(self.content_text.index("@0,0").split('.')[0])
+        last_line = int(self.content_text.index(f"@0,{self.content_text.winfo_height()}").split('.')[0])
+        
+        self.content_text.config(state=tk.NORMAL)
+        for line_num in range(first_line, last_line + 1):
+            idx = line_num - 1
+            if line_num in self._fitted_lines or idx >= len(articles):
+                continue
+            self._fitted_lines.add(line_num)
+            
+            line_text = self.content_text.get(f"{line_num}.0", f"{line_num}.end")
+            if "\t" not in line_text:
+                continue  # Not an article row (e.g. still being rebuilt)
+            
+            row = self.view.row(idx, articles[idx])
+            start, headline_end, _ = row.spans[HEADLINE_SPAN]
+            headline_text = row.text[start:headline_end]
+            
+            # Replace only the headline on screen (up to the tab), keeping its tags (new/selected)
+            end = line_text.index("\t")
+            if line_text[start:end] != headline_text:
+                tags = self.content_text.tag_names(f"{line_num}.{start}")
+                self.content_text.delete(f"{line_num}.{start}", f"{line_num}.{end}")
+                self.content_text.insert(f"{line_num}.{start}", headline_text, tags)
+        self.content_text.config(state=tk.DISABLED)
     
     def _create_status_bar(self):
         """Create the status bar at the bottom"""
@@ -191,7 +283,7 @@ class TerminalUI:
         
         # Add keyboard shortcuts info
         shortcuts_label = tk.Label(self.status_frame,
-                                  text="↑/↓: Navigate | Enter: Open | Tab: Cycle Feeds | F5: Refresh | S: Stocks | Home: Newest",
+                                  text="↑/↓: Navigate | Enter: Open | Tab: Cycle Feeds | F5: Refresh | S: Stocks | M: Movers | H: Health | P: Perf | Home: Newest",
                                   font=self.terminal_font, bg='#333333', fg='#AAAAAA', anchor='e')
         shortcuts_label.pack(side=tk.RIGHT, padx=10)
     
@@ -224,20 +316,27 @@ class TerminalUI:
         self.root.bind("<Shift-Tab>", self.cycle_previous_feed)
         
         # Refresh key
-        self.root.bind("<F5>", lambda e: self.feed_manager.fetch_all_feeds())
+        self.root.bind("<F5>", self.refresh_feeds)
         
         # Stock navigation
         self.root.bind("s", self.cycle_stock_symbol)
         self.root.bind("S", self.show_stock_details)
+        self.root.bind("m", self.show_movers)
+        
+        # Feed health
+        self.root.bind("h", self.show_feed_health)
+        
+        # Performance overlay
+        self.root.bind("p", self.toggle_perf_overlay)
     
     def show_startup_sequence(self):
-        """Show a startup sequence"""
+        """Show a startup sequence, animated from the Tk event loop so it never blocks"""
         self.update_text(f"{'=' * 80}\n", text_style="time")
         self.update_text("  RSS TERMINAL VIEWER\n", text_style="headline")
         self.update_text(f"  Version 1.0 | {dt.datetime.now().strftime('%Y-%m-%d')}\n", text_style="time")
         self.update_text(f"{'=' * 80}\n\n", text_style="time")
         
-        # System initialization messages
+        # System initialization messages, typed out with a pause after each
         messages = [
             "Initializing system...",
             "Configuring feeds...",
@@ -246,26 +345,80 @@ class TerminalUI:
             "Ready for operation",
             ""
         ]
-        
-        for msg in messages:
-            self.update_text(f"  {msg}\n", text_style="source", delay_chars=True)
-            self.root.update()
-            time.sleep(0.3)
+        self._intro_steps = deque((f"  {msg}\n", "source", True) for msg in messages)
         
         # Final instructions with keyboard navigation info
-        self.update_text("KEYBOARD SHORTCUTS:\n", text_style="headline")
-        self.update_text("  ↑/↓ : Navigate between headlines\n", text_style="source")
-        self.update_text("  Enter/Space : Open selected article in browser\n", text_style="source")
-        self.update_text("  ESC : Unselect current article\n", text_style="source")
-        self.update_text("  Tab/Shift+Tab : Cycle between feeds\n", text_style="source")
-        self.update_text("  F5 : Refresh all feeds\n", text_style="source")
-        self.update_text("  g  : Go to article by number\n", text_style="source")
-        self.update_text("  d  : Show description of selected article\n", text_style="source")
-        self.update_text("  ⌘+↑/↓ : Page up/down in article list\n", text_style="source")
-        self.update_text("  ⌘+Shift+↑/↓ : Jump to first/last article\n", text_style="source")
-        self.update_text("  Home : Jump to newest articles\n\n", text_style="source")
-    
-    def update_text(self, text, delay_chars=False, flash=False, text_style=None):
+        self._intro_steps.append(("KEYBOARD SHORTCUTS:\n", "headline", False))
+        for line in [
+            "  ↑/↓ : Navigate between headlines\n",
+            "  Enter/Space : Open selected article in browser\n",
+            "  ESC : Unselect current article\n",
+            "  Tab/Shift+Tab : Cycle between feeds\n",
+            "  F5 : Refresh all feeds\n",
+            "  g  : Go to article by number\n",
+            "  d  : Show description of selected article\n",
+            "  ⌘+↑/↓ : Page up/down in article list\n",
+            "  ⌘+Shift+↑/↓ : Jump to first/last article\n",
+            "  Home : Jump to newest articles\n\n"
+        ]:
+            self._intro_steps.append((line, "source", False))
+        
+        if not self.config.show_intro:
+            self.skip_startup_sequence()
+            return
+        
+        # Any key press skips the animation; the bind tag sees keys before other bindings
+        for widget in (self.root, self.content_text):
+            widget.bindtags(("Intro",) + widget.bindtags())
+        self.root.bind_class("Intro", "<Key>", self.skip_startup_sequence)
+        
+        self._intro_job = self.root.after(0, self._run_startup_step)
+    
+    def _run_startup_step(self, char_index=0):
+        """Type the next character of the intro, or move on to the next line"""
+        self._intro_job = None
+        if not self._intro_steps:
+            self._end_startup_sequence()
+            return
+        
+        text, style, typed = self._intro_steps[0]
+        if not typed:
+            # Plain lines appear all at once
+            self._intro_steps.popleft()
+            self.update_text(text, text_style=style)
+            self._intro_job = self.root.after(0, self._run_startup_step)
+        elif char_index < len(text):
+            self.update_text(text[char_index], text_style=style)
+            self._intro_job = self.root.after(10, lambda: self._run_startup_step(char_index + 1))
+        else:
+            self._intro_steps.popleft()
+            self._intro_job = self.root.after(300, self._run_startup_step)
+    
+    def skip_startup_sequence(self, event=None, show_remaining=True):
+        """Finish the intro immediately, optionally writing out the remaining text"""
+        if self._intro_job:
+            self.root.after_cancel(self._intro_job)
+            self._intro_job = None
+        
+        if show_remaining and self._intro_steps:
+            # Drop the part of a typed line that is already on screen
+            text, style, typed = self._intro_steps.popleft()
+            if typed:
+                typed_so_far = self.content_text.get("end-1c linestart", "end-1c")
+                text = text[len(typed_so_far):]
+            self.update_text(text, text_style=style)
+            for text, style, typed in self._intro_steps:
+                self.update_text(text, text_style=style)
+        
+        self._intro_steps.clear()
+        self._end_startup_sequence()
+    
+    def _end_startup_sequence(self):
+        """Remove the intro's key binding"""
+        for widget in (self.root, self.content_text):
+            widget.bindtags(tuple(tag for tag in widget.bindtags() if tag != "Intro"))
+    
+    def update_text(self, text, flash=False, text_style=None):
         """Update the text display with the specified style"""
         self.content_text.config(state=tk.NORMAL)
         
@@ -283,13 +436,6 @@ class TerminalUI:
             # Insert with specific style
             self.content_text.insert(tk.END, text, text_style)
             self.content_text.see(tk.END)
-        elif delay_chars:
-            # Insert with typing animation
-            for char in text:
-                self.content_text.insert(tk.END, char)
-                self.content_text.see(tk.END)
-                self.content_text.update()
-                time.sleep(0.01)
         else:
             # Normal insert
             self.content_text.insert(tk.END, text)
@@ -297,6 +443,12 @@ class TerminalUI:
         
         self.content_text.config(state=tk.DISABLED)
     
+    def refresh_feeds(self, event=None):
+        """Request an immediate feed refresh without blocking the UI"""
+        self.feed_manager.request_refresh()
+        self.update_status(f"Refreshing {len(self.config.feeds)} feeds...")
+        return "break"
+    
     def update_status(self, text):
         """Update the status bar text"""
         self.status_label.config(text=text)
@@ -326,8 +478,15 @@ class TerminalUI:
         # Schedule the next update
         self.root.after(1000, self.update_countdown)
     
+    @metrics.timed('ui_render_seconds', view='articles')
     def display_articles(self, maintain_position=False):
         """Display articles based on current filter with incremental line-by-line updates"""
+        snapshot = self.feed_manager.snapshot()
+        
+        # Nothing was published since the last render, so skip the redraw
+        if maintain_position and snapshot.generation == self.snapshot.generation:
+            return
+        
         # Store view info if needed
         if maintain_position and self.content_text.winfo_viewable():
             # Save exact scroll position 
@@ -335,14 +494,15 @@ class TerminalUI:
             
             # Also store the selected article if any
             selected_article = None
-            if self.selected_article_index >= 0 and self.selected_article_index < len(self.feed_manager.filtered_articles):
-                selected_article = self.feed_manager.filtered_articles[self.selected_article_index]
+            if self.selection.has_selection:
+                selected_article = self.snapshot.filtered_articles[self.selection.index]
         else:
             visible_fraction = 0
             selected_article = None
         
-        # Reset selection state
-        self.selected_article_index = -1
+        # Reset selection state and switch to the new snapshot
+        self.selection.reset(len(snapshot.filtered_articles))
+        self.snapshot = snapshot
         
         # This is our key for split-flap display effect - either rebuild or update incrementally
         if not self.content_text.get("1.0", "end-1c") or not maintain_position:
@@ -359,30 +519,29 @@ class TerminalUI:
             
             # Restore selection if previously selected
             if selected_article:
-                for i, article in enumerate(self.feed_manager.filtered_articles):
+                for i, article in enumerate(self.snapshot.filtered_articles):
                     if article.get('title') == selected_article.get('title'):
-                        self.selected_article_index = i
-                        self.highlight_selected_article(scroll_to_view=False)
+                        self.selection.select(i, scroll=False)
+                        self.highlight_selected_article()
                         break
     
     def _rebuild_article_display(self):
         """Completely rebuild the article display from scratch"""
+        # Articles replace the intro, so stop it if it is still animating
+        self.skip_startup_sequence(show_remaining=False)
+        
         # Clear display
         self.content_text.config(state=tk.NORMAL)
         self.content_text.delete('1.0', tk.END)
         
-        # Track if any new articles are displayed
-        self.new_article_tags = []
-        displayed_new_articles = False
+        # Build every row up front and insert them all in a single call
+        self.new_article_tags = self._insert_rows(tk.END, self.view.rows(self.snapshot.filtered_articles))
+        displayed_new_articles = bool(self.new_article_tags)
         
-        # Display each article
-        for idx, article in enumerate(self.feed_manager.filtered_articles):
-            # Insert the article with proper formatting
-            self._format_and_insert_article(idx, article)
-            
-            # Track if this was a new article
-            if article.get('is_new', False):
-                displayed_new_articles = True
+        self.content_text.config(state=tk.DISABLED)
+        
+        # Every row was just laid out for the current width
+        self._fitted_lines = set(range(1, len(self.snapshot.filtered_articles) + 1))
         
         # Handle flashing effect for new articles
         if displayed_new_articles:
@@ -391,104 +550,41 @@ class TerminalUI:
     
     def _update_article_display_incrementally(self):
         """Update the article display incrementally for the split-flap effect"""
-        # Update the header first
-        self.content_text.config(state=tk.NORMAL)
-        
-        # Remove the header line (was line 1)
-        self.content_text.delete("1.0", "2.0")
-        
-        # Get the current content
-        current_content = self.content_text.get("2.0", "end-1c")
-        current_lines = current_content.split('\n')
-        
         # Track new article tags and flags
         self.new_article_tags = []
         displayed_new_articles = False
         
-        # Prepare for incremental updates
-        line_index = 1  # Start at line 1 since header is removed
+        # Rows are rewritten in place, article i on line i+1; there is no header line to skip
+        line_index = 1
         
         # Process each article with a visual delay between updates
-        self._incremental_update_with_delay(0, line_index, displayed_new_articles)
-    
-    def _format_and_insert_article(self, idx, article):
-        """Format a single article and insert it into the display"""
-        # Format row number
-        num_text = f"{idx+1}) "
-        self.update_text(num_text, text_style="number")
-        
-        # Format headline (title) with truncation
-        headline_text = truncate_headline(article['title'])
-        
-        # Check if this is a new article and should be highlighted
-        if article.get('is_new', False):
-            # Insert with unique tag for this article to enable flashing
-            tag_name = f"new_headline_{idx}"
-            self.content_text.config(state=tk.NORMAL)
-            self.content_text.insert(tk.END, headline_text, tag_name)
-            self.content_text.tag_configure(tag_name, foreground="#FFFFFF", background="#004400")
-            self.new_article_tags.append(tag_name)
-        else:
-            self.update_text(headline_text, text_style="headline")
-        
-        # Calculate space needed for right alignment
-        window_width = self.content_text.winfo_width() // 8
-        source_time_width = len(article['source']) + len(article['pub_date_str']) + 2
-        
-        # Ensure we have enough space for source and time
-        min_space = 5
-        
-        # Calculate spaces needed for right alignment
-        spaces_needed = window_width - len(num_text) - len(headline_text) - source_time_width - min_space
-        spaces_needed = max(spaces_needed, min_space)
-        spaces = " " * spaces_needed
-        
-        self.update_text(spaces)
-        
-        # Add source code and time
-        self.update_text(f"{article['source']} ", text_style="source")
-        self.update_text(f"{article['pub_date_str']}\n", text_style="time")
+        self._incremental_update_with_delay(self.snapshot, 0, line_index, displayed_new_articles)
     
-    def _create_formatted_article_line(self, idx, article):
-        """Create a fully formatted line for an article without inserting it"""
-        parts = []
-        
-        # Format row number
-        num_text = f"{idx+1}) "
-        parts.append((num_text, "number"))
-        
-        # Format headline with truncation
-        headline_text = truncate_headline(article['title'])
-        
-        # Check if this is a new article
-        if article.get('is_new', False):
-            tag_name = f"new_headline_{idx}"
-            parts.append((headline_text, tag_name))
-        else:
-            parts.append((headline_text, "headline"))
-        
-        # Calculate space needed for right alignment
-        window_width = self.content_text.winfo_width() // 8
-        source_time_width = len(article['source']) + len(article['pub_date_str']) + 2
-        
-        # Ensure enough space
-        min_space = 5
-        spaces_needed = window_width - len(num_text) - len(headline_text) - source_time_width - min_space
-        spaces_needed = max(spaces_needed, min_space)
-        spaces = " " * spaces_needed
-        
-        parts.append((spaces, None))
-        
-        # Add source and time
-        parts.append((f"{article['source']} ", "source"))
-        parts.append((f"{article['pub_date_str']}", "time"))
-        
-        return parts
+    def _insert_rows(self, position, rows):
+        """Insert view-model rows at position in one call; returns the tags of new headlines to flash"""
+        chunks = []
+        for row in rows:
+            for text, tag in row_segments(row):
+                chunks.extend((text, tag or ()))
+            chunks.extend(("\n", ()))
+        if chunks:
+            self.content_text.insert(position, *chunks)
+        
+        # New articles get a tag of their own so they can flash
+        new_tags = [row.new_tag for row in rows if row.new_tag]
+        for tag in new_tags:
+            self.content_text.tag_configure(tag, foreground="#FFFFFF", background="#004400")
+        return new_tags
     
-    def _incremental_update_with_delay(self, article_idx, line_idx, any_new_articles):
+    @metrics.timed('ui_render_seconds', view='row')
+    def _incremental_update_with_delay(self, snapshot, article_idx, line_idx, any_new_articles):
         """Update articles one by one with a visual delay between updates"""
+        # A newer snapshot has been rendered since this update started, so stop
+        if snapshot is not self.snapshot:
+            return
+        
         # Base case - we've gone through all articles
-        if article_idx >= len(self.feed_manager.filtered_articles):
+        if article_idx >= len(snapshot.filtered_articles):
             # Remove any remaining lines 
             self.content_text.config(state=tk.NORMAL)
             self.content_text.delete(f"{line_idx}.0", "end")
@@ -501,15 +597,15 @@ class TerminalUI:
             return
         
         # Get the current article
-        article = self.feed_manager.filtered_articles[article_idx]
+        article = snapshot.filtered_articles[article_idx]
         
         # Update if this is a new article
         new_article = article.get('is_new', False)
         if new_article:
             any_new_articles = True
         
-        # Create the formatted line
-        parts = self._create_formatted_article_line(article_idx, article)
+        # Lay out the row
+        row = self.view.row(article_idx, article)
         
         # Update the line with a visual flicker effect
         self.content_text.config(state=tk.NORMAL)
@@ -525,29 +621,19 @@ class TerminalUI:
         # Insert at the specific line position (not at END)
         position = f"{line_idx}.0"
         
-        # Insert the new line parts with their tags
-        for text, tag in parts:
-            if tag:
-                if tag.startswith("new_headline_"):
-                    self.new_article_tags.append(tag)
-                    self.content_text.insert(position, text, tag)
-                    self.content_text.tag_configure(tag, foreground="#FFFFFF", background="#004400")
-                else:
-                    self.content_text.insert(position, text, tag)
-            else:
-                self.content_text.insert(position, text)
-            
-            # Update the position for the next insert
-            position = self.content_text.index(f"{position}+{len(text)}c")
+        # Insert the new line with its tags
+        self.new_article_tags.extend(self._insert_rows(position, [row]))
+        self._fitted_lines.add(line_idx)
         
-        # Add newline
-        self.content_text.insert(position, "\n")
+        # Rewriting the line dropped its highlight, so put it back
+        if article_idx == self.selection.rendered_index:
+            self.content_text.tag_add("selected", f"{line_idx}.0", f"{line_idx}.end")
         
         self.content_text.config(state=tk.DISABLED)
         
         # Schedule the next article update with a small delay for visual effect
         delay = 5 if new_article else 2  # Pause slightly longer on new articles
-        self.root.after(delay, lambda: self._incremental_update_with_delay(article_idx + 1, line_idx + 1, any_new_articles))
+        self.root.after(delay, lambda: self._incremental_update_with_delay(snapshot, article_idx + 1, line_idx + 1, any_new_articles))
     
     def flash_new_articles(self, step):
         """Create a flashing effect for new articles with improved visibility"""
@@ -591,10 +677,12 @@ class TerminalUI:
                     # Apply the regular headline tag
                     self.content_text.tag_add("headline", start, end)
         
-        # Reset the flags in the article data
-        for article in self.feed_manager.articles:
-            if article.get('is_new', False):
-                article['is_new'] = False
+        # Reset the flags in the article data. If nothing else was published
+        # in between, the new snapshot matches what is on screen, so adopt it
+        # instead of scheduling a redraw.
+        snapshot = self.feed_manager.reset_new_article_flags()
+        if snapshot and snapshot.generation == self.snapshot.generation + 1:
+            self.snapshot = snapshot
         
         # Clear the new article tags list
         self.new_article_tags = []
@@ -609,10 +697,19 @@ class TerminalUI:
         filter_menu.add_command(label="📰 ALL", command=lambda: self.set_filter("ALL"))
         filter_menu.add_separator()
         
-        # Add each feed option
+        # Feeds from [Feeds] are listed directly, imported feeds in a submenu per group
+        groups = {}
         for feed in self.config.feeds:
-            filter_menu.add_command(label=f"📰 {feed['name']}", 
-                                  command=lambda name=feed['name']: self.set_filter(name))
+            if feed.get('group'):
+                groups.setdefault(feed['group'], []).append(feed)
+            else:
+                filter_menu.add_command(label=f"📰 {feed['name']}", 
+                                      command=lambda name=feed['name']: self.set_filter(name))
+        
+        for group, feeds in groups.items():
+            group_menu = self._create_filter_submenu(filter_menu)
+            self._add_feed_entries(group_menu, sorted(feeds, key=lambda feed: feed['name']))
+            filter_menu.add_cascade(label=f"📁 {group} ({len(feeds)})", menu=group_menu)
         
         # Show menu at cursor position
         try:
@@ -620,6 +717,25 @@ class TerminalUI:
         finally:
             filter_menu.grab_release()
     
+    def _create_filter_submenu(self, parent):
+        """Submenu styled like the filter menu"""
+        return tk.Menu(parent, tearoff=0, bg=self.colors['bg'],
+                       fg=self.colors['text'], activebackground=self.colors['selected'])
+    
+    def _add_feed_entries(self, menu, feeds):
+        """Add feed entries to a menu, split into alphabetical submenus when there are too many to fit"""
+        if len(feeds) <= FILTER_MENU_CHUNK:
+            for feed in feeds:
+                menu.add_command(label=f"📰 {feed['name']}",
+                                 command=lambda name=feed['name']: self.set_filter(name))
+            return
+        
+        for start in range(0, len(feeds), FILTER_MENU_CHUNK):
+            chunk = feeds[start:start + FILTER_MENU_CHUNK]
+            chunk_menu = self._create_filter_submenu(menu)
+            self._add_feed_entries(chunk_menu, chunk)
+            menu.add_cascade(label=f"{chunk[0]['name']} – {chunk[-1]['name']}", menu=chunk_menu)
+    
     def set_filter(self, feed_name):
         """Set the current feed filter and refresh display"""
         self.feed_manager.apply_filter(feed_name)
@@ -630,77 +746,65 @@ class TerminalUI:
     
     def select_previous_article(self, event=None):
         """Select the previous article in the list"""
-        if not self.feed_manager.filtered_articles:
-            return "break"  # No articles to navigate
-        
         # Decrement the index, wrapping around if necessary
-        if self.selected_article_index > 0:
-            self.selected_article_index -= 1
-        else:
-            self.selected_article_index = len(self.feed_manager.filtered_articles) - 1
-        
-        # Highlight the selected article
-        self.highlight_selected_article()
+        if self.selection.move(-1):
+            self.highlight_selected_article()
         return "break"  # Prevent default handling
 
     def select_next_article(self, event=None):
         """Select the next article in the list"""
-        if not self.feed_manager.filtered_articles:
-            return "break"  # No articles to navigate
-        
         # Increment the index, wrapping around if necessary
-        if self.selected_article_index < len(self.feed_manager.filtered_articles) - 1:
-            self.selected_article_index += 1
-        else:
-            self.selected_article_index = 0
-        
-        # Highlight the selected article
-        self.highlight_selected_article()
+        if self.selection.move(1):
+            self.highlight_selected_article()
         return "break"  # Prevent default handling
 
-    def highlight_selected_article(self, scroll_to_view=True):
-        """Highlight the currently selected article"""
-        if not self.feed_manager.filtered_articles:
-            return  # No articles to highlight
-            
-        # First, remove all selection highlights
-        self.content_text.tag_remove("selected", "1.0", tk.END)
+    def highlight_selected_article(self):
+        """Schedule a highlight update; key auto-repeat is merged into one render per frame"""
+        if self._selection_render_job is None:
+            self._selection_render_job = self.root.after(16, self._render_selection)
+    
+    @metrics.timed('ui_render_seconds', view='selection')
+    def _render_selection(self):
+        """Repaint only the previously and newly selected rows"""
+        self._selection_render_job = None
+        if not self.selection.dirty:
+            return
+        
+        old_index, new_index, scroll_to_view = self.selection.take_changes()
         
-        # Add 1 instead of 2 since there is no header row
-        line_num = self.selected_article_index + 1
+        # Line numbers are index + 1 since there is no header row
+        if old_index >= 0 and old_index != new_index:
+            self.content_text.tag_remove("selected", f"{old_index + 1}.0", f"{old_index + 1}.end")
         
-        # Apply selected style to the current line
-        line_start = f"{line_num}.0"
-        line_end = f"{line_num}.end"
+        if new_index < 0:
+            return
         
-        self.content_text.tag_add("selected", line_start, line_end)
+        line_start = f"{new_index + 1}.0"
+        self.content_text.tag_add("selected", line_start, f"{new_index + 1}.end")
         
         # Ensure the selected line is visible if requested
         if scroll_to_view:
             self.content_text.see(line_start)
         
         # Update status with selected article info
-        article = self.feed_manager.filtered_articles[self.selected_article_index]
+        article = self.snapshot.filtered_articles[new_index]
         self.update_status(f"Selected: {article['title']}")
     
     def open_selected_article(self, event=None):
         """Open the currently selected article in a web browser"""
-        if not self.feed_manager.filtered_articles or self.selected_article_index < 0 or \
-           self.selected_article_index >= len(self.feed_manager.filtered_articles):
+        if not self.selection.has_selection:
             return "break"  # No articles or invalid index
         
-        article = self.feed_manager.filtered_articles[self.selected_article_index]
+        article = self.snapshot.filtered_articles[self.selection.index]
         self.update_status(f"Opening article: {article['title']}")
         webbrowser.open(article['link'])
         return "break"  # Prevent default handling
     
     def unselect_article(self, event=None):
         """Unselect any selected article and return to default view"""
-        # Reset the selection index
-        self.selected_article_index = -1
-        
-        # Remove all selection highlights
-        self.content_text.tag_remove("selected", "1.0", tk.END)
+        # Reset the selection and remove its highlight
+        self.selection.clear()
+        self._render_selection()
         
         # Reset the status bar to default message
         self.update_status(f"Monitoring {len(self.config.feeds)} feeds | Refresh: {self.config.refresh_interval}s")
@@ -710,7 +814,7 @@ class TerminalUI:
     def cycle_next_feed(self, event=None):
         """Cycle to the next feed in the list"""
         feed_names = ["ALL"] + [feed["name"] for feed in self.config.feeds]
-        current_index = feed_names.index(self.feed_manager.current_filter)
+        current_index = feed_names.index(self.snapshot.current_filter)
         next_index = (current_index + 1) % len(feed_names)
         self.set_filter(feed_names[next_index])
         return "break"  # Prevent default tab behavior
@@ -718,14 +822,14 @@ class TerminalUI:
     def cycle_previous_feed(self, event=None):
         """Cycle to the previous feed in the list"""
         feed_names = ["ALL"] + [feed["name"] for feed in self.config.feeds]
-        current_index = feed_names.index(self.feed_manager.current_filter)
+        current_index = feed_names.index(self.snapshot.current_filter)
         prev_index = (current_index - 1) % len(feed_names)
         self.set_filter(feed_names[prev_index])
         return "break"  # Prevent default tab behavior
     
     def start_goto_mode(self, event=None):
         """Enter goto mode to jump to a specific article by number"""
-        if not self.feed_manager.filtered_articles:
+        if not self.snapshot.filtered_articles:
             return "break"  # No articles to navigate to
             
         self.goto_mode = True
@@ -757,8 +861,8 @@ class TerminalUI:
         article_num = int(self.goto_number)
         
         # Article numbers are 1-indexed in display, but 0-indexed in the list
-        if 1 <= article_num <= len(self.feed_manager.filtered_articles):
-            self.selected_article_index = article_num - 1
+        if 1 <= article_num <= self.selection.count:
+            self.selection.select(article_num - 1)
             self.highlight_selected_article()
             
         # Exit goto mode
@@ -772,91 +876,39 @@ class TerminalUI:
     
     def page_up(self, event=None):
         """Move the selection up by several items"""
-        if not self.feed_manager.filtered_articles:
-            return "break"  # No articles to navigate
-        
-        # Set selection if not already set
-        if self.selected_article_index < 0:
-            self.selected_article_index = 0
-        
-        # Move selection up by 10 items, but not less than 0
-        self.selected_article_index = max(0, self.selected_article_index - 10)
-        
-        # Highlight the selected article
-        self.highlight_selected_article()
+        # Move selection up by a page, but not before the first item
+        if self.selection.page(-1):
+            self.highlight_selected_article()
         return "break"
         
     def page_down(self, event=None):
         """Move the selection down by several items"""
-        if not self.feed_manager.filtered_articles:
-            return "break"  # No articles to navigate
-        
-        # Set selection if not already set
-        if self.selected_article_index < 0:
-            self.selected_article_index = 0
-        
-        # Move selection down by 10 items, but not beyond the last item
-        self.selected_article_index = min(len(self.feed_manager.filtered_articles) - 1, self.selected_article_index + 10)
-        
-        # Highlight the selected article
-        self.highlight_selected_article()
+        # Move selection down by a page, but not beyond the last item
+        if self.selection.page(1):
+            self.highlight_selected_article()
         return "break"
     
     def jump_to_first(self, event=None):
         """Jump to the first article in the list"""
-        if not self.feed_manager.filtered_articles:
-            return "break"  # No articles to navigate
-        
-        # Set selection to the first article
-        self.selected_article_index = 0
-        
-        # Highlight the selected article
-        self.highlight_selected_article()
+        if self.selection.first():
+            self.highlight_selected_article()
         return "break"  # Prevent default handling
         
     def jump_to_last(self, event=None):
         """Jump to the last article in the list"""
-        if not self.feed_manager.filtered_articles:
-            return "break"  # No articles to navigate
-        
-        # Set selection to the last article
-        self.selected_article_index = len(self.feed_manager.filtered_articles) - 1
-        
-        # Highlight the selected article
-        self.highlight_selected_article()
+        if self.selection.last():
+            self.highlight_selected_article()
         return "break"  # Prevent default handling
         
     def jump_to_newest(self, event=None):
         """Jump to newest articles (top of list)"""
-        if not self.feed_manager.filtered_articles:
-            return "break"  # No articles to navigate to
-        
         # Set selection to the newest article (first in the list)
-        self.selected_article_index = 0
-        
-        # Highlight the selected article
-        self.highlight_selected_article()
+        if not self.selection.first():
+            return "break"  # No articles to navigate to
         
-        # Scroll to show the newest articles
-        self.content_text.see("2.0")  # First article after header
-        
-        # Remove the new content indicator if it exists
-        try:
-            self.content_text.tag_remove("new_content_indicator", "1.0", "1.end")
-            
-            # Restore normal header format
-            if self.feed_manager.current_filter == "ALL":
-                filter_text = "All Feeds"
-            else:
-                filter_text = f"{self.feed_manager.current_filter} Feed"
-            
-            self.content_text.config(state=tk.NORMAL)
-            self.content_text.delete("1.0", "1.end")
-            self.content_text.insert("1.0", f"{filter_text} - {len(self.feed_manager.filtered_articles)} Headlines", "headline")
-            self.content_text.config(state=tk.DISABLED)
-        except:
-            # If no indicator exists, just continue
-            pass
+        # Render right away so the status message below is not overwritten
+        self._render_selection()
+        self.content_text.see("1.0")
         
         # Update status
         self.update_status("Showing newest headlines")
@@ -865,11 +917,11 @@ class TerminalUI:
     
     def show_article_description(self, event=None):
         """Show description for the selected article in terminal style"""
-        if not self.feed_manager.filtered_articles or self.selected_article_index < 0:
+        if not self.selection.has_selection:
             self.update_status("No article selected")
             return "break"
             
-        article = self.feed_manager.filtered_articles[self.selected_article_index]
+        article = self.snapshot.filtered_articles[self.selection.index]
         
         # Create a popup window for description
         desc_window = tk.Toplevel(self.root)
@@ -890,7 +942,7 @@ class TerminalUI:
         # Header with article number and source identifier
         header_label = tk.Label(
             header_frame, 
-            text=f"{self.selected_article_index + 1}) {article['source']} ARTICLE DETAIL",
+            text=f"{self.selection.index + 1}) {article['source']} ARTICLE DETAIL",
             font=self.header_font, 
             bg=self.colors['header_bg'],
             fg=self.colors['text'], 
@@ -1114,11 +1166,11 @@ class TerminalUI:
             # Count how many new articles match the current filter
             new_for_current_filter = 0
             for article in new_articles:
-                if self.feed_manager.current_filter == "ALL" or article['source'] == self.feed_manager.current_filter:
+                if self.snapshot.current_filter == "ALL" or article['source'] == self.snapshot.current_filter:
                     new_for_current_filter += 1
             
             # Update status to show new article count (removed reference to number of new headlines)
-            self.update_status(f"Total: {len(self.feed_manager.articles)}")
+            self.update_status(f"Total: {len(self.feed_manager.snapshot().articles)}{self._feed_health_note()}")
             
             # Determine if this is the initial display or an update
             if not self._initial_display_done:
@@ -1132,26 +1184,33 @@ class TerminalUI:
                 # This ensures the view doesn't jump when new content arrives
                 self.display_articles(maintain_position=True)
         else:
-            self.update_status(f"No new updates | Last check: {dt.datetime.now().strftime('%H:%M:%S')}")
+            self.update_status(f"No new updates{self._feed_health_note()} | Last check: {dt.datetime.now().strftime('%H:%M:%S')}")
+        
+        self._refresh_feed_health()
             
-    def fetch_weather(self):
-        """Fetch weather data from the API in a separate thread"""
-        def _fetch():
-            try:
-                weather = get_weather_data(self.config.airport_code)
-                if weather:
-                    # Update UI from the main thread
-                    self.root.after(0, lambda: self.update_weather_display(weather))
-            except Exception as e:
-                print(f"Weather update error: {e}")
-        
-        # Start the weather fetching in a separate thread
-        thread = threading.Thread(target=_fetch)
-        thread.daemon = True
-        thread.start()
-        
-        # Schedule next weather update based on config (convert seconds to milliseconds)
-        self.root.after(self.config.weather_update_interval * 1000, self.fetch_weather)
+    def handle_weather_update(self, weather_by_station):
+        """Handle new observations from the weather manager"""
+        self.weather_data = weather_by_station
+        
+        # Restart the rotation so only one chain of after() callbacks runs
+        if self._weather_rotate_job is not None:
+            self.root.after_cancel(self._weather_rotate_job)
+            self._weather_rotate_job = None
+        self._show_current_weather()
+    
+    def _show_current_weather(self):
+        """Show one station, rotating through the stations when there are several"""
+        self._weather_rotate_job = None
+        stations = list(self.weather_data)
+        if not stations:
+            return
+        
+        self._weather_index %= len(stations)
+        self.update_weather_display(self.weather_data[stations[self._weather_index]])
+        
+        if len(stations) > 1:
+            self._weather_index += 1
+            self._weather_rotate_job = self.root.after(5000, self._show_current_weather)
     
     def update_weather_display(self, weather):
         """Update the weather display with current temperature and weather icon"""
@@ -1188,17 +1247,20 @@ class TerminalUI:
         if stocks:
             self.stock_data = stocks
             self.update_stock_display()
+            
+            # Keep the movers columns current and refresh the popup if it is open
+            self.movers.retain(self.config.stock_symbols)
+            self.movers.update(stocks)
+            self._refresh_movers()
         else:
             self._show_stock_no_data()
     
+    @metrics.timed('ui_render_seconds', view='ticker')
     def update_stock_display(self):
-        """Update the stock ticker display with all three market indexes"""
+        """Update the stock ticker display with the latest quotes"""
         if not self.stock_data or not self.config.stock_symbols:
             return
         
-        # Clear existing stock labels
-        self._clear_stock_labels()
-        
         # Get symbols that have data
         available_symbols = [symbol for symbol in self.config.stock_symbols if symbol in self.stock_data]
         
@@ -1206,8 +1268,9 @@ class TerminalUI:
             self._show_stock_loading()
             return
         
-        # Create labels for each stock with individual colors
-        for i, symbol in enumerate(available_symbols):
+        # Build the text and color of each quote; the ticker only touches labels that changed
+        items = []
+        for symbol in available_symbols:
             stock = self.stock_data[symbol]
             
             # Get short name for display
@@ -1225,22 +1288,21 @@ class TerminalUI:
             else:
                 color = self.colors['yellow']
             
-            # Create display text
-            if i == 0:
-                display_text = f"📈 {display_name} {price_str} {change_str}"
-            else:
-                display_text = f"{display_name} {price_str} {change_str}"
+            display_text = f"{display_name} {price_str} {change_str}"
             
-            # Create label
-            stock_label = tk.Label(self.stock_frame, text=display_text,
-                                 font=self.header_font, bg=self.colors['bg'], fg=color)
-            stock_label.pack(side=tk.LEFT)
+            # Intraday trend, once there are enough samples
+            if self.config.show_sparkline and stock.get('sparkline'):
+                display_text += f" {stock['sparkline']}"
             
-            # Add separator if not last item
-            if i < len(available_symbols) - 1:
-                sep_label = tk.Label(self.stock_frame, text=" | ",
-                                   font=self.header_font, bg=self.colors['bg'], fg=self.colors['text'])
-                sep_label.pack(side=tk.LEFT)
+            items.append((display_text, color))
+        
+        self.ticker.set_items(items)
+    
+    def _ticker_available_width(self):
+        """Pixels left for the ticker between the filter display and the clock/weather"""
+        others = sum(widget.winfo_reqwidth() for widget in self.filter_frame.winfo_children()
+                     if widget is not self.stock_frame)
+        return self.filter_frame.winfo_width() - others - 60  # Padding around the packed widgets
     
     def _get_index_display_name(self, symbol):
         """Get short display name for market index symbols"""
@@ -1260,30 +1322,17 @@ class TerminalUI:
         }
         return full_names.get(symbol, symbol)
     
-    def _clear_stock_labels(self):
-        """Clear all existing stock labels from the frame"""
-        for widget in self.stock_frame.winfo_children():
-            widget.destroy()
-    
     def _show_stock_loading(self):
         """Show loading message"""
-        loading_label = tk.Label(self.stock_frame, text="📈 Loading...",
-                                font=self.header_font, bg=self.colors['bg'], fg=self.colors['yellow'])
-        loading_label.pack(side=tk.LEFT)
+        self.ticker.show_message("📈 Loading...", self.colors['yellow'])
     
     def _show_stock_error(self):
         """Show error message"""
-        self._clear_stock_labels()
-        error_label = tk.Label(self.stock_frame, text="📈 Error",
-                              font=self.header_font, bg=self.colors['bg'], fg=self.colors['red'])
-        error_label.pack(side=tk.LEFT)
+        self.ticker.show_message("📈 Error", self.colors['red'])
     
     def _show_stock_no_data(self):
         """Show no data message"""
-        self._clear_stock_labels()
-        no_data_label = tk.Label(self.stock_frame, text="📈 No Data",
-                                font=self.header_font, bg=self.colors['bg'], fg=self.colors['time'])
-        no_data_label.pack(side=tk.LEFT)
+        self.ticker.show_message("📈 No Data", self.colors['time'])
     
     def _format_stock_price(self, price):
         """Format stock price for display"""
@@ -1340,6 +1389,8 @@ class TerminalUI:
         if not available_symbols:
             return "break"
         
+        # The watchlist or the fetched quotes may have shrunk since the index was set
+        self.current_stock_index %= len(available_symbols)
         symbol = available_symbols[self.current_stock_index]
         stock = self.stock_data[symbol]
         
@@ -1350,7 +1401,7 @@ class TerminalUI:
         
         # Set window size and position relative to main window
         window_width = 600
-        window_height = 400
+        window_height = 490
         x = self.root.winfo_x() + (self.root.winfo_width() - window_width) // 2
         y = self.root.winfo_y() + (self.root.winfo_height() - window_height) // 2
         stock_window.geometry(f'{window_width}x{window_height}+{x}+{y}')
@@ -1423,7 +1474,7 @@ class TerminalUI:
                                 self.colors['yellow'])
         
         # Market Status
-        market_color = self.colors['green'] if stock['market_state'] == 'OPEN' else self.colors['time']
+        market_color = self.colors['green'] if stock['market_state'] in ('OPEN', 'REGULAR') else self.colors['time']
         self._add_stock_data_row(data_frame, 3, "MARKET:", stock['market_state'], market_color)
         
         # After hours data if available
@@ -1436,6 +1487,20 @@ class TerminalUI:
         last_updated = stock['last_updated'].strftime('%H:%M:%S') if stock.get('last_updated') else "Unknown"
         self._add_stock_data_row(data_frame, 5, "LAST UPDATE:", last_updated, self.colors['time'])
         
+        # Intraday range and trend from the sampled price history
+        if stock.get('range_low') is not None:
+            range_text = f"{self._format_stock_price(stock['range_low'])} - {self._format_stock_price(stock['range_high'])}"
+            self._add_stock_data_row(data_frame, 6, "SESSION RANGE:", range_text, self.colors['yellow'])
+            self._add_stock_data_row(data_frame, 7, "VWAP:", self._format_stock_price(stock['vwap']), self.colors['yellow'])
+        
+        if stock.get('sparkline_wide'):
+            self._add_stock_data_row(data_frame, 8, "TREND:", stock['sparkline_wide'], change_color)
+        
+        # Multi-day change from the cached daily bars
+        if stock.get('change_5d') is not None:
+            change_5d_color = self.colors['green'] if stock['change_5d'] >= 0 else self.colors['red']
+            self._add_stock_data_row(data_frame, 9, "5-DAY CHANGE:", f"{stock['change_5d']:+.1f}%", change_5d_color)
+        
         # Status bar
         status_frame = tk.Frame(stock_window, bg='#333333', height=22)
         status_frame.pack(fill=tk.X, side=tk.BOTTOM, padx=0, pady=0)
@@ -1495,4 +1560,228 @@ class TerminalUI:
             fg=value_color,
             anchor='w'
         )
-        value.grid(row=row, column=1, sticky='w', pady=2)
\ No newline at end of file
+        value.grid(row=row, column=1, sticky='w', pady=2)
+    
+    def _open_table_window(self, title, header_text, footer_text, on_close, width=520, height=560):
+        """Open a non-modal terminal-style popup holding a read-only text table; returns (window, text)"""
+        window = tk.Toplevel(self.root)
+        window.title(title)
+        window.configure(bg=self.colors['bg'])
+        
+        # Set window size and position relative to main window
+        x = self.root.winfo_x() + (self.root.winfo_width() - width) // 2
+        y = self.root.winfo_y() + (self.root.winfo_height() - height) // 2
+        window.geometry(f'{width}x{height}+{x}+{y}')
+        
+        # Terminal-style header bar
+        header_frame = tk.Frame(window, bg=self.colors['header_bg'], height=30)
+        header_frame.pack(fill=tk.X, padx=0, pady=0)
+        
+        header_label = tk.Label(
+            header_frame, 
+            text=header_text,
+            font=self.header_font, 
+            bg=self.colors['header_bg'],
+            fg=self.colors['text'], 
+            anchor='w', 
+            padx=10, 
+            pady=5
+        )
+        header_label.pack(side=tk.LEFT, fill=tk.X, expand=True)
+        
+        # Status bar
+        status_frame = tk.Frame(window, bg='#333333', height=22)
+        status_frame.pack(fill=tk.X, side=tk.BOTTOM, padx=0, pady=0)
+        
+        shortcuts_label = tk.Label(
+            status_frame,
+            text=footer_text,
+            font=self.terminal_font, 
+            bg='#333333', 
+            fg='#AAAAAA', 
+            anchor='e'
+        )
+        shortcuts_label.pack(side=tk.RIGHT, padx=10)
+        
+        # Table area
+        text = tk.Text(
+            window,
+            bg=self.colors['bg'],
+            fg=self.colors['text'],
+            font=self.terminal_font,
+            wrap=tk.NONE,
+            padx=15,
+            pady=10,
+            borderwidth=0,
+            highlightthickness=0
+        )
+        text.pack(fill=tk.BOTH, expand=True)
+        text.config(state=tk.DISABLED)
+        
+        def close(event=None):
+            on_close()
+            window.destroy()
+        
+        window.protocol("WM_DELETE_WINDOW", close)
+        window.bind("<Escape>", close)
+        
+        # Not modal: the table keeps refreshing while the main window is used
+        window.transient(self.root)
+        window.focus_set()
+        
+        return window, text
+    
+    def show_movers(self, event=None):
+        """Show the top gainers, losers and unusual moves across the watchlist"""
+        if self._movers_window is not None:
+            self._movers_window.lift()
+            return "break"
+        
+        def close_movers():
+            self._movers_window = None
+            self._movers_text = None
+            self._movers_lines = []
+        
+        movers_window, movers_text = self._open_table_window(
+            "Top Movers", f"📈 TOP MOVERS | {len(self.config.stock_symbols)} SYMBOLS",
+            "ESC: Close | Updates with each quote refresh", close_movers)
+        movers_text.tag_configure("section", foreground=self.colors['blue'])
+        movers_text.tag_configure("gain", foreground=self.colors['green'])
+        movers_text.tag_configure("loss", foreground=self.colors['red'])
+        movers_text.tag_configure("flat", foreground=self.colors['yellow'])
+        
+        self._movers_window = movers_window
+        self._movers_text = movers_text
+        self._refresh_movers()
+        
+        return "break"
+    
+    def _build_movers_lines(self):
+        """Build the movers table as (text, tag) lines"""
+        ranking = self.movers.rank(count=10)
+        lines = []
+        
+        for title, key in (("TOP GAINERS", 'gainers'), ("TOP LOSERS", 'losers'), ("UNUSUAL MOVES", 'unusual')):
+            lines.append((title, "section"))
+            if not ranking[key]:
+                lines.append(("  --", "flat"))
+            for rank, (symbol, price, pct) in enumerate(ranking[key], start=1):
+                tag = "gain" if pct > 0 else "loss" if pct < 0 else "flat"
+                name = self._get_index_display_name(symbol)
+                lines.append((f"{rank:>3}. {name:<10} {self._format_stock_price(price):>12} {pct:>+8.2f}%", tag))
+            lines.append(("", None))
+        
+        return lines
+    
+    def _refresh_movers(self):
+        """Redraw only the movers table lines that changed since the last refresh"""
+        if self._movers_text is None:
+            return
+        
+        self._movers_lines = self._write_table_lines(self._movers_text, self._movers_lines,
+                                                     self._build_movers_lines())
+    
+    def _write_table_lines(self, text, previous_lines, lines):
+        """Rewrite only the (text, tag) lines of a popup table that changed; returns the new lines"""
+        text.config(state=tk.NORMAL)
+        
+        for i, (line, tag) in enumerate(lines):
+            if i < len(previous_lines):
+                if previous_lines[i] == (line, tag):
+                    continue
+                text.delete(f"{i + 1}.0", f"{i + 1}.end")
+                text.insert(f"{i + 1}.0", line, tag)
+            else:
+                text.insert(tk.END, ("\n" if i else "") + line, tag)
+        
+        # Remove lines left over from a longer previous table
+        if len(lines) < len(previous_lines):
+            text.delete(f"{len(lines)}.end", tk.END)
+        
+        text.config(state=tk.DISABLED)
+        return lines
+    
+    def show_feed_health(self, event=None):
+        """Show failing feeds with their circuit state, failure counts and next retry times"""
+        if self._health_window is not None:
+            self._health_window.lift()
+            return "break"
+        
+        def close_health():
+            self._health_window = None
+            self._health_text = None
+            self._health_lines = []
+        
+        health_window, health_text = self._open_table_window(
+            "Feed Health", f"🩺 FEED HEALTH | {len(self.config.feeds)} FEEDS",
+            "ESC: Close | Updates with each feed refresh", close_health, width=760, height=480)
+        health_text.tag_configure("section", foreground=self.colors['blue'])
+        health_text.tag_configure("open", foreground=self.colors['red'])
+        health_text.tag_configure("probe", foreground=self.colors['yellow'])
+        health_text.tag_configure("ok", foreground=self.colors['green'])
+        
+        self._health_window = health_window
+        self._health_text = health_text
+        self._refresh_feed_health()
+        
+        return "break"
+    
+    def _build_feed_health_lines(self):
+        """Build the feed health table as (text, tag) lines"""
+        rows = self.feed_manager.health.rows()
+        healthy = len(self.config.feeds) - len(rows)
+        lines = [(f"{healthy} of {len(self.config.feeds)} feeds healthy", "ok"), ("", None),
+                 (f"{'FEED':<12}{'STATE':<7}{'FAILS':>6}{'TOTAL':>7}  {'NEXT RETRY':<11}LAST ERROR", "section")]
+        
+        if not rows:
+            lines.append(("  --", None))
+        for name, state, failures, total, next_retry, error in rows:
+            retry = time.strftime('%H:%M:%S', time.localtime(next_retry)) if next_retry else "next cycle"
+            tag = {"OPEN": "open", "PROBE": "probe"}.get(state)
+            lines.append((f"{name[:11]:<12}{state:<7}{failures:>6}{total:>7}  {retry:<11}{(error or '')[:60]}", tag))
+        
+        return lines
+    
+    def _refresh_feed_health(self):
+        """Redraw the feed health table if it is open"""
+        if self._health_text is None:
+            return
+        
+        self._health_lines = self._write_table_lines(self._health_text, self._health_lines,
+                                                     self._build_feed_health_lines())
+    
+    def _feed_health_note(self):
+        """Status bar note about failing feeds, or an empty string when all are healthy"""
+        failing = self.feed_manager.health.failing_count()
+        return f" - ⚠ {failing} feed{'s' if failing != 1 else ''} failing (H: Health)" if failing else ""
+    
+    def toggle_perf_overlay(self, event=None):
+        """Show or hide the performance overlay in the top-right corner of the article list"""
+        if self.perf_monitor is None:
+            return "break"
+        
+        if self._perf_overlay is not None:
+            if self._perf_overlay_job:
+                self.root.after_cancel(self._perf_overlay_job)
+                self._perf_overlay_job = None
+            self._perf_overlay.destroy()
+            self._perf_overlay = None
+            self.perf_monitor.set_watched(False)
+            return "break"
+        
+        self.perf_monitor.set_watched(True)
+        self._perf_overlay = tk.Label(self.content_text, font=self.terminal_font, justify=tk.LEFT, anchor='nw',
+                                      bg='#111111', fg=self.colors['green'], padx=8, pady=6,
+                                      relief=tk.SOLID, borderwidth=1)
+        self._perf_overlay.place(relx=1.0, x=-20, y=6, anchor='ne')
+        self._refresh_perf_overlay()
+        return "break"
+    
+    def _refresh_perf_overlay(self):
+        """Redraw the overlay twice a second while it is shown"""
+        self._perf_overlay_job = None
+        if self._perf_overlay is None:
+            return
+        lines = ["PERFORMANCE (P to hide)", ""] + self.perf_monitor.report_lines()
+        self._perf_overlay.config(text="\n".join(lines))
+        self._perf_overlay_job = self.root.after(500, self._refresh_perf_overlay)
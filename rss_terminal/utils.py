@@ -5,10 +5,8 @@ import re
 import html
 import time
 import datetime
-import requests
-from dateutil import parser
 import pytz
-import html2text
+from rss_terminal.metar import parse_weather_groups
 
 def parse_date(entry):
     """Try to parse date from entry in various formats"""
@@ -18,12 +16,14 @@ def parse_date(entry):
         return time.mktime(entry.updated_parsed)
     elif hasattr(entry, 'published') and entry.published:
         try:
+            from dateutil import parser  # Only needed for feeds without parsed dates
             dt_obj = parser.parse(entry.published)
             return dt_obj.timestamp()
         except:
             pass
     elif hasattr(entry, 'updated') and entry.updated:
         try:
+            from dateutil import parser
             dt_obj = parser.parse(entry.updated)
             return dt_obj.timestamp()
         except:
@@ -45,91 +45,46 @@ def get_formatted_time(timestamp=None, timezone="America/Los_Angeles"):
     
     return local_time.strftime("%H:%M")
 
-def get_weather_data(airport_code):
-    """Get current weather data for specified airport code"""
-    try:
-        url = f"https://aviationweather.gov/api/data/metar?ids={airport_code}&hours=0&order=id%2C-obs&format=json"
-        response = requests.get(url, timeout=10)
-        
-        if response.status_code == 200:
-            data = response.json()
-            if data and len(data) > 0:
-                weather = data[0]
-                temp_c = weather.get('temp')
-                
-                if temp_c is not None:
-                    # Convert Celsius to Fahrenheit
-                    temp_f = (temp_c * 9/5) + 32
-                    
-                    # Extract additional weather information
-                    clouds = weather.get('clouds', [])
-                    cloud_condition = clouds[0].get('cover') if clouds else "CLR"
-                    
-                    # Weather strings like "RA" (rain), "SN" (snow), etc.
-                    wx_string = weather.get('wxString')
-                    
-                    # Wind info
-                    wind_speed = weather.get('wspd')
-                    wind_gust = weather.get('wgst')
-                    wind_dir = weather.get('wdir')
-                    
-                    # Visibility
-                    visibility = weather.get('visib')
-                    
-                    return {
-                        'temp_c': round(temp_c, 1),
-                        'temp_f': round(temp_f, 1),
-                        'airport': airport_code,
-                        'last_updated': weather.get('reportTime'),
-                        'cloud_condition': cloud_condition,
-                        'wx_string': wx_string,
-                        'wind_speed': wind_speed,
-                        'wind_gust': wind_gust,
-                        'wind_dir': wind_dir,
-                        'visibility': visibility,
-                        'raw_metar': weather.get('rawOb')
-                    }
-        
-        return None
-    except Exception as e:
-        print(f"Error fetching weather: {e}")
-        return None
-
 def get_weather_icon(weather_data):
-    """Determine appropriate weather icon based on METAR data"""
+    """Determine appropriate weather icon based on decoded METAR data"""
     if not weather_data:
         return "?"
         
     cloud_condition = weather_data.get('cloud_condition', '')
-    wx_string = weather_data.get('wx_string', '')
+    
+    # Decoded weather groups; observations cached before decoding only have the string
+    groups = weather_data.get('weather')
+    if groups is None:
+        groups = parse_weather_groups(weather_data.get('wx_string'))
+    
+    descriptors = {group['descriptor'] for group in groups}
+    phenomena = {code for group in groups for code in group['phenomena']}
     
     # Default icon for clear conditions
     icon = "☀️"  # Sun
     
     # Weather phenomena take precedence over cloud cover
-    if wx_string:
-        wx_lower = wx_string.lower()
-        
+    if groups:
         # Thunderstorms
-        if 'ts' in wx_lower:
+        if 'TS' in descriptors:
             return "⚡"  # Lightning
         
         # Rain
-        if 'ra' in wx_lower or 'dz' in wx_lower:
-            if 'sh' in wx_lower:  # Showers
+        if phenomena & {'RA', 'DZ'}:
+            if 'SH' in descriptors:  # Showers
                 return "🌦️"  # Sun behind rain cloud
             return "🌧️"  # Rain cloud
         
         # Snow
-        if 'sn' in wx_lower:
+        if phenomena & {'SN', 'SG'}:
             return "❄️"  # Snowflake
         
         # Fog
-        if 'fg' in wx_lower or 'br' in wx_lower:
+        if phenomena & {'FG', 'BR'}:
             return "🌫️"  # Fog
         
         # Dust or sand
-        if 'du' in wx_lower or 'sa' in wx_lower or 'hz' in wx_lower:
+        if phenomena & {'DU', 'SA', 'HZ'}:
             return "💨"  # Wind
     
     # Cloud cover based icons (if no specific weather phenomena)
@@ -209,6 +164,9 @@ def html_to_text(html_content):
     
     # If it still looks like HTML, use html2text for conversion
     if "<" in text and ">" in text:
+        # Imported on first use to keep startup fast
+        import html2text
+        
         # Initialize html2text converter with some configuration
         h = html2text.HTML2Text()
         h.ignore_links = False
@@ -0,0 +1,89 @@
+"""
+View model for the RSS Terminal article list.
+Turns an article snapshot and a viewport size into row strings and tag
+spans as plain data. The Tk UI only applies them to its text widget, so
+rendering can be benchmarked and checked without a display and reused by
+other frontends.
+"""
+from collections import namedtuple
+
+from rss_terminal.layout import ColumnLayout, cell_width
+
+# New headlines get a tag of their own (prefix + row index) so they can flash
+NEW_HEADLINE_PREFIX = "new_headline_"
+
+# One article row. spans are (start, end, tag) character offsets into text in
+# order, and the headline is always spans[HEADLINE_SPAN]. new_tag is the row's
+# flashing tag, or None when the article is not new.
+ArticleRow = namedtuple('ArticleRow', ['text', 'spans', 'new_tag'])
+HEADLINE_SPAN = 1
+
+def monospace_measure(char_width=7):
+    """Pixel measure for a fixed-width font of char_width pixels per cell, for use without Tk"""
+    return lambda text: cell_width(text) * char_width
+
+def row_segments(row):
+    """The row as (text, tag) pieces in order, with None for untagged text, for inserting in one call"""
+    segments = []
+    position = 0
+    for start, end, tag in row.spans:
+        if start > position:
+            segments.append((row.text[position:start], None))
+        segments.append((row.text[start:end], tag))
+        position = end
+    if position < len(row.text):
+        segments.append((row.text[position:], None))
+    return segments
+
+class ArticleListView:
+    """Builds article rows for the current viewport; width is in pixels, height in rows"""
+    
+    def __init__(self, layout):
+        self.layout = layout
+        self.height = 0
+    
+    @property
+    def width(self):
+        return self.layout.width
+    
+    def resize(self, width, height=None):
+        """Set the viewport size, returning True if rows have to be refitted"""
+        if height is not None:
+            self.height = max(0, height)
+        return self.layout.set_width(width)
+    
+    def tab_stop(self):
+        """Pixel position of the right-aligned source/time column"""
+        return self.layout.tab_stop()
+    
+    def row(self, idx, article):
+        """Lay out one article as the idx'th row"""
+        num_text = f"{idx+1}) "
+        meta_text = f"{article['source']} {article['pub_date_str']}"
+        headline = self.layout.fit_headline(num_text, article['title'], meta_text)
+        
+        new_tag = f"{NEW_HEADLINE_PREFIX}{idx}" if article.get('is_new', False) else None
+        
+        # Number, headline, then a tab to the layout's right-aligned tab stop before source and time
+        headline_end = len(num_text) + len(headline)
+        source_end = headline_end + 1 + len(article['source']) + 1
+        spans = ((0, len(num_text), "number"),
+                 (len(num_text), headline_end, new_tag or "headline"),
+                 (headline_end + 1, source_end, "source"),
+                 (source_end, source_end + len(article['pub_date_str']), "time"))
+        return ArticleRow(f"{num_text}{headline}\t{meta_text}", spans, new_tag)
+    
+    def rows(self, articles, first=0, last=None):
+        """Rows for articles[first:last], numbered by their position in the whole list"""
+        last = len(articles) if last is None else min(last, len(articles))
+        return [self.row(idx, articles[idx]) for idx in range(max(0, first), last)]
+    
+    def visible_rows(self, articles, top=0):
+        """Rows that fill the viewport when row `top` is scrolled to the top"""
+        return self.rows(articles, top, top + self.height)
+
+def create_headless_view(width, height, char_width=7):
+    """An ArticleListView sized in pixels and rows, measuring text as a fixed-width font"""
+    view = ArticleListView(ColumnLayout(monospace_measure(char_width)))
+    view.resize(width, height)
+    return view
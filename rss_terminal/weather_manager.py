@@ -0,0 +1,227 @@
+"""
+Weather Manager module for RSS Terminal.
+Fetches raw METAR observations for all configured stations in one batched
+request from a single long-lived worker, decodes them locally, and keeps
+the last known observations on disk so the weather slot renders
+immediately at startup.
+"""
+import json
+import os
+import threading
+import time
+import urllib.parse
+import requests
+from rss_terminal import metrics
+from rss_terminal.metar import decode_metar
+from rss_terminal.traffic import as_requests_response
+
+METAR_URL = "https://aviationweather.gov/api/data/metar"
+
+# Retry delays after failed fetches: 60s, 120s, ... capped at the refresh interval
+ERROR_BACKOFF_BASE = 60
+
+class WeatherManager:
+    """Manages batched weather fetching and the persisted observation cache"""
+    
+    def __init__(self, config_manager, cache_file="weather_cache.json", traffic=None):
+        self.config = config_manager
+        self.cache_file = cache_file
+        self.traffic = traffic  # Optional TrafficLog that records or replays responses
+        self.weather = {}  # Station -> latest parsed observation
+        self.fetch_callback = None
+        self.fetch_thread = None
+        self.running = False
+        self.failures = 0  # Consecutive failed fetches, for backoff
+        self.last_fetch_time = 0
+        
+        # Validators from the last response, sent back to make refreshes conditional
+        self._etag = None
+        self._last_modified = None
+        self._validated_stations = ()  # Stations the validators belong to
+        
+        # One session keeps the HTTPS connection alive between refreshes
+        self._session = requests.Session()
+        self._wake_event = threading.Event()
+        
+        self.load_cache()
+    
+    def load_cache(self):
+        """Load the last known observations so they can be shown before the first fetch"""
+        try:
+            if os.path.exists(self.cache_file):
+                with open(self.cache_file, "r") as f:
+                    cache = json.load(f)
+                self.weather = cache.get('stations', {})
+                self.last_fetch_time = cache.get('fetched_at', 0)
+                self._etag = cache.get('etag')
+                self._last_modified = cache.get('last_modified')
+                self._validated_stations = tuple(cache.get('validated_stations', ()))
+        except Exception as e:
+            print(f"Error loading weather cache: {e}")
+            self.weather = {}
+    
+    def save_cache(self):
+        """Persist the observations and validators"""
+        cache = {
+            'stations': self.weather,
+            'fetched_at': self.last_fetch_time,
+            'etag': self._etag,
+            'last_modified': self._last_modified,
+            'validated_stations': list(self._validated_stations),
+        }
+        try:
+            # Write-then-rename so a crash never leaves a truncated cache
+            temp_file = self.cache_file + ".tmp"
+            with open(temp_file, "w") as f:
+                json.dump(cache, f)
+            os.replace(temp_file, self.cache_file)
+        except OSError as e:
+            print(f"Error saving weather cache: {e}")
+    
+    def get_all_weather(self):
+        """Latest observation per configured station, in configured order"""
+        return {code: self.weather[code] for code in self.config.airport_codes if code in self.weather}
+    
+    def start_fetching(self, callback):
+        """Start the background weather worker"""
+        self.fetch_callback = callback
+        self.running = True
+        self.fetch_thread = threading.Thread(target=self._fetch_loop, daemon=True)
+        self.fetch_thread.start()
+    
+    def stop_fetching(self):
+        """Stop the background weather worker"""
+        self.running = False
+        self._wake_event.set()
+        if self.fetch_thread and self.fetch_thread.is_alive():
+            self.fetch_thread.join(timeout=1)
+        self._session.close()
+    
+    def request_refresh(self):
+        """Wake the worker to refresh now"""
+        self.last_fetch_time = 0
+        self._wake_event.set()
+    
+    def reschedule(self):
+        """Re-evaluate the schedule after the stations or interval changed in the config"""
+        self._wake_event.set()
+    
+    def _seconds_until_next_fetch(self, now):
+        """Refresh on the configured interval, or sooner with backoff after errors"""
+        interval = self.config.weather_update_interval
+        if self.failures:
+            interval = min(interval, ERROR_BACKOFF_BASE * 2 ** (self.failures - 1))
+        elif tuple(self.config.airport_codes) != self._validated_stations:
+            return 0  # The cached observations are for a different station list
+        return max(0, self.last_fetch_time + interval - now)
+    
+    def _fetch_loop(self):
+        """Single worker: sleep until the next refresh is due, then fetch all stations"""
+        while self.running:
+            delay = self._seconds_until_next_fetch(time.time())
+            if delay > 0:
+                self._wake_event.wait(delay)
+                self._wake_event.clear()
+                continue
+            
+            changed = self.fetch_weather()
+            if changed and self.fetch_callback:
+                self.fetch_callback(self.get_all_weather())
+    
+    def fetch_weather(self):
+        """Fetch every configured station in one request; returns True if observations changed"""
+        stations = tuple(self.config.airport_codes)
+        if not stations:
+            return False
+        
+        # Latest observation per station, all stations in one request, as compact raw text
+        params = {'ids': ",".join(stations), 'hours': 0, 'order': "id,-obs", 'format': 'raw'}
+        
+        # Conditional request: the server answers 304 if nothing new was observed
+        headers = {}
+        if stations == self._validated_stations:
+            if self._etag:
+                headers['If-None-Match'] = self._etag
+            if self._last_modified:
+                headers['If-Modified-Since'] = self._last_modified
+        
+        try:
+            with metrics.timed('weather_fetch_seconds', "Weather request time"):
+                response = self._get(params, headers)
+            self.last_fetch_time = time.time()
+            
+            if response.status_code == 304:
+                self.failures = 0
+                metrics.counter('weather_fetches_total', "Weather fetches by result", result='not_modified').inc()
+                return False
+            response.raise_for_status()
+            
+            # One report per line; keep the first (newest) per station
+            observations = {}
+            for line in response.text.splitlines():
+                weather = self._parse_observation(line)
+                if weather and weather['airport'] not in observations:
+                    observations[weather['airport']] = weather
+            
+            self.failures = 0
+            self._etag = response.headers.get('ETag')
+            self._last_modified = response.headers.get('Last-Modified')
+            self._validated_stations = stations
+            
+            changed = any(self.weather.get(code) != weather for code, weather in observations.items())
+            self.weather.update(observations)
+            self.save_cache()
+            metrics.counter('weather_fetches_total', result='ok').inc()
+            return changed
+        
+        except Exception as e:
+            self.failures += 1
+            self.last_fetch_time = time.time()
+            metrics.counter('weather_fetches_total', result='error').inc()
+            print(f"Error fetching weather (attempt {self.failures}): {e}")
+            return False
+    
+    def _get(self, params, headers):
+        """GET the METAR endpoint, or serve the recorded response in replay mode"""
+        key = f"{METAR_URL}?{urllib.parse.urlencode(params)}"
+        if self.traffic is not None and self.traffic.replaying:
+            return as_requests_response(self.traffic.replay('weather', key), key)
+        
+        started = time.monotonic()
+        response = self._session.get(METAR_URL, params=params, headers=headers, timeout=10)
+        if self.traffic is not None and self.traffic.recording:
+            self.traffic.record('weather', key, response.status_code, response.headers, response.content,
+                                time.monotonic() - started)
+        return response
+    
+    def _parse_observation(self, raw_metar):
+        """Decode one raw METAR line into the display dict"""
+        report = decode_metar(raw_metar)
+        if not report or report['temperature'] is None:
+            return None
+        
+        temp_c = report['temperature']
+        
+        # Convert Celsius to Fahrenheit
+        temp_f = (temp_c * 9/5) + 32
+        
+        # Lowest reported layer; CAVOK and reports without clouds count as clear
+        clouds = report['clouds']
+        cloud_condition = clouds[0]['cover'] if clouds else "CLR"
+        
+        wind = report['wind'] or {}
+        
+        return {
+            'temp_c': round(temp_c, 1),
+            'temp_f': round(temp_f, 1),
+            'airport': report['station'],
+            'last_updated': f"{report['day']:02d} {report['hour']:02d}:{report['minute']:02d}Z",
+            'cloud_condition': cloud_condition,
+            'wx_string': " ".join(weather['raw'] for weather in report['weather']) or None,
+            'weather': report['weather'],  # Decoded phenomena, used for the icon
+            'wind_speed': wind.get('speed'),
+            'wind_gust': wind.get('gust'),
+            'wind_dir': wind.get('direction'),
+            'visibility': report['visibility'],
+            'raw_metar': report['raw']
+        }